@@ -1,6 +1,46 @@
 """Agent Arena core package."""
 
-from .base import Game, Player, RandomPlayer
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+from .base import AsyncPlayer, Game, Player, RandomPlayer
 from .engine import GameEngine
 
-__all__ = ["Game", "Player", "RandomPlayer", "GameEngine"]
+# Heavier subsystems (asyncio, process pools) are imported on first use so that
+# short-lived worker processes only pay for what they touch.
+_LAZY = {
+    "AsyncGameEngine": ".async_engine",
+    "AsyncMatchPool": ".async_engine",
+    "play_many": ".async_engine",
+    "MatchScheduler": ".tournament",
+    "Standings": ".tournament",
+    "Tournament": ".tournament",
+}
+
+__all__ = [
+    "Game",
+    "Player",
+    "AsyncPlayer",
+    "RandomPlayer",
+    "GameEngine",
+    "AsyncGameEngine",
+    "AsyncMatchPool",
+    "play_many",
+    "MatchScheduler",
+    "Standings",
+    "Tournament",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, List
+
+from .base import AsyncPlayer, Game, Player
+
+
+class SyncPlayerAdapter(AsyncPlayer):
+    """Expose a synchronous ``Player`` through the ``AsyncPlayer`` protocol.
+
+    Cheap players are called inline.  Set ``in_thread`` for players that block
+    (e.g. a synchronous HTTP client) so they do not stall the event loop.
+    """
+
+    def __init__(self, player: Player, in_thread: bool = False):
+        self.player = player
+        self.in_thread = in_thread
+
+    async def select_action(self, game: Game, state: Any) -> str:
+        if self.in_thread:
+            return await asyncio.to_thread(self.player.select_action, game, state)
+        return self.player.select_action(game, state)
+
+
+def as_async_player(player: Player | AsyncPlayer) -> AsyncPlayer:
+    if isinstance(player, AsyncPlayer):
+        return player
+    return SyncPlayerAdapter(player)
+
+
+class AsyncGameEngine:
+    """Run a match on the event loop, awaiting each player's decision."""
+
+    def __init__(self, game: Game, player0: Player | AsyncPlayer, player1: Player | AsyncPlayer):
+        self.game = game
+        self.players = [as_async_player(player0), as_async_player(player1)]
+
+    async def play(self) -> int | None:
+        """Run the game and return the winning player (0 or 1), or None for a draw."""
+        state = self.game.reset()
+        tracks_player = self.game.tracks_player()
+        current = 0
+        while not self.game.is_terminal(state):
+            action = await self.players[current].select_action(self.game, state)
+            state = self.game.apply_action(state, action)
+            current = self.game.current_player(state) if tracks_player else 1 - current
+        return self.game.get_winner(state)
+
+
+class AsyncMatchPool:
+    """Run many matches concurrently on one event loop.
+
+    At most ``max_concurrent`` matches are in progress at once.  Submitted
+    matches wait in a queue of at most ``max_pending`` entries; once it is
+    full, ``submit`` blocks, which pushes back on whatever is producing jobs.
+    """
+
+    def __init__(self, max_concurrent: int = 100, max_pending: int = 0):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self.max_concurrent = max_concurrent
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._workers: List[asyncio.Task] = []
+        self.active = 0
+        self.peak_active = 0
+
+    async def __aenter__(self) -> "AsyncMatchPool":
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.max_concurrent)]
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(self, engine: AsyncGameEngine) -> asyncio.Future:
+        """Queue ``engine`` and return a future for its winner."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((engine, future))
+        return future
+
+    async def _worker(self) -> None:
+        while True:
+            engine, future = await self._queue.get()
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+            try:
+                winner = await engine.play()
+            except Exception as exc:  # surfaced through the match future
+                if not future.cancelled():
+                    future.set_exception(exc)
+            else:
+                if not future.cancelled():
+                    future.set_result(winner)
+            finally:
+                self.active -= 1
+                self._queue.task_done()
+
+
+async def play_many(engines: List[AsyncGameEngine], max_concurrent: int = 100) -> List[int | None]:
+    """Play every match in ``engines`` and return the winners in order."""
+    async with AsyncMatchPool(max_concurrent, max_pending=max_concurrent) as pool:
+        futures = [await pool.submit(engine) for engine in engines]
+    return [future.result() for future in futures]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, List, Tuple
+
+from .hashing import stable_hash
 
 
 class Game(ABC):
@@ -27,10 +29,113 @@ class Game(ABC):
     def get_winner(self, state: Any) -> int | None:
         """Return 0 or 1 for the winning player, or None if undecided."""
 
+    # Integer action space ---------------------------------------------
+    #
+    # A parallel encoding of actions as ids in ``range(num_actions())`` for
+    # search and batch code that should not pay for building and parsing
+    # action strings.  ``action_to_str``/``str_to_action`` translate between
+    # the two; they take the state because some games (e.g. word ladders)
+    # encode actions relative to it.  The ids returned by
+    # ``legal_action_ids`` correspond one-to-one, in order, to
+    # ``valid_actions``.
+
+    def num_actions(self) -> int:
+        """Return the size of the integer action space."""
+        raise NotImplementedError
+
+    def legal_action_ids(self, state: Any) -> List[int]:
+        """Return the ids of the valid actions in `state`."""
+        raise NotImplementedError
+
+    def apply_action_id(self, state: Any, action_id: int) -> Any:
+        """Return a new state after applying the action with id `action_id`."""
+        raise NotImplementedError
+
+    def action_to_str(self, state: Any, action_id: int) -> str:
+        """Return the action string for `action_id` in `state`."""
+        raise NotImplementedError
+
+    def str_to_action(self, state: Any, action: str) -> int:
+        """Return the id of the action string `action` in `state`.
+
+        Raises ``ValueError`` for strings that do not denote an action.
+        """
+        raise NotImplementedError
+
+    # Make/unmake ------------------------------------------------------
+    #
+    # An optional in-place alternative to ``apply_action`` for search code.
+    # ``push`` applies an action to `state` itself and records how to undo it
+    # on a stack carried by the state; ``pop`` reverts the latest ``push``.
+    # After ``pop`` the state equals what it was before the matching ``push``.
+    # States from ``reset`` and ``apply_action`` may be pushed, but a state
+    # shared with other code should be copied first.
+
+    def supports_push(self) -> bool:
+        """Return True if this game implements ``push`` and ``pop``."""
+        return type(self).push is not Game.push
+
+    def push(self, state: Any, action: str) -> None:
+        """Apply `action` to `state` in place."""
+        raise NotImplementedError
+
+    def pop(self, state: Any) -> None:
+        """Undo the latest ``push`` on `state`."""
+        raise NotImplementedError
+
+    def current_player(self, state: Any) -> int:
+        """Return the player (0 or 1) whose turn it is in `state`.
+
+        Optional: games whose state does not record the side to move may
+        leave this unimplemented, at the cost of not supporting search players.
+        Games where a player can move twice in a row (e.g. Dots and Boxes with
+        extra turns) must implement it; the engines call it after every move,
+        so it should be cheap.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not track the player to move")
+
+    def tracks_player(self) -> bool:
+        """Return True if this game implements ``current_player``."""
+        return type(self).current_player is not Game.current_player
+
     @abstractmethod
     def render(self, state: Any) -> str:
         """Return a text representation of `state` for LLM consumption."""
 
+    def state_key(self, state: Any) -> int:
+        """Return a 64-bit key identifying `state`, stable across processes.
+
+        Equal positions give equal keys.  The default hashes ``repr(state)``,
+        which is only canonical for states built from lists, tuples, strings
+        and numbers; board games override it with Zobrist keys.
+        """
+        return stable_hash(repr(state))
+
+    # Symmetry ---------------------------------------------------------
+    #
+    # Games with board symmetries number them as transforms (0 is the
+    # identity) and return the same key for every symmetric image of a
+    # position: the ``state_key`` of its canonical image.  Caches keyed on
+    # that key store each class of positions once; an action recorded in the
+    # canonical frame is mapped back with ``from_canonical_action``.
+
+    def supports_symmetry(self) -> bool:
+        """Return True if this game implements ``canonical_state``."""
+        return type(self).canonical_state is not Game.canonical_state
+
+    def canonical_state(self, state: Any) -> Tuple[int, int]:
+        """Return ``(key, transform)``: the key shared by all symmetric images
+        of `state`, and the transform taking `state` to the canonical image."""
+        return self.state_key(state), 0
+
+    def to_canonical_action(self, state: Any, action_id: int, transform: int) -> int:
+        """Map an action id of `state` to the same move in the canonical image."""
+        return action_id
+
+    def from_canonical_action(self, state: Any, action_id: int, transform: int) -> int:
+        """Map an action id of the canonical image back to `state`."""
+        return action_id
+
 
 class Player(ABC):
     """Base class for players."""
@@ -40,6 +145,14 @@ class Player(ABC):
         """Return the action to take given the current state."""
 
 
+class AsyncPlayer(ABC):
+    """Base class for players whose decisions are awaited, e.g. remote models."""
+
+    @abstractmethod
+    async def select_action(self, game: Game, state: Any) -> str:
+        """Return the action to take given the current state."""
+
+
 class RandomPlayer(Player):
     """Baseline player that selects a random valid action."""
 
@@ -0,0 +1,12 @@
+"""Performance benchmarks.
+
+Run ``python -m arena.bench`` to measure every registered game and print the
+results as JSON; ``--baseline FILE`` compares against an earlier ``--output``
+and exits non-zero when anything regressed beyond ``--threshold``.
+``--perft DEPTH`` adds perft node counts and speeds (MiniChess by default).
+"""
+
+from .games import bench_game, compare, perft, perft_speed, run_suite
+from .imports import measure_import_time
+
+__all__ = ["bench_game", "compare", "perft", "perft_speed", "run_suite", "measure_import_time"]
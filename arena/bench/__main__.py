@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+from .games import compare, make_game, perft_speed, run_suite
+from .imports import measure_import_time
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m arena.bench", description="Benchmark Agent Arena games.")
+    parser.add_argument("games", nargs="*", help="games to benchmark (default: all registered games)")
+    parser.add_argument("--seconds", type=float, default=1.0, help="playout time per game")
+    parser.add_argument("--samples", type=int, default=20, help="positions per game phase")
+    parser.add_argument("--repeats", type=int, default=5, help="timed calls per position and method")
+    parser.add_argument("--perft", type=int, metavar="DEPTH", help="also time perft to DEPTH from the start position")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON file and fail on regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative regression")
+    args = parser.parse_args(argv)
+
+    results = {
+        "import": measure_import_time(),
+        "games": run_suite(args.games, seconds=args.seconds, samples=args.samples, repeats=args.repeats),
+    }
+    if args.perft:
+        results["perft"] = {name: perft_speed(make_game(name), args.perft) for name in args.games or ["MiniChess"]}
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results["games"], baseline.get("games", {}), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import random
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from ..base import Game
+from ..games import registry
+
+# Games whose constructor needs arguments.
+FACTORIES: Dict[str, Callable[[], Game]] = {
+    "WordLadderDuel": lambda: registry.load("WordLadderDuel")(
+        "cold", "warm", ["cold", "cord", "card", "ward", "warm", "word", "worm", "corm", "wore", "core", "care", "ware"]
+    ),
+}
+
+METHODS = ("valid_actions", "apply_action", "is_terminal", "get_winner", "render")
+SYMMETRY_METHODS = ("canonical_state",)  # timed too for games with board symmetries
+PHASES = ("opening", "midgame", "endgame")
+
+
+def make_game(name: str) -> Game:
+    factory = FACTORIES.get(name)
+    return factory() if factory else registry.load(name)()
+
+
+def random_playout(game: Game, rng: random.Random, max_plies: int, played: List[str] | None = None) -> List[Any]:
+    """Play random moves from the start; return every non-terminal state visited.
+
+    The moves are appended to ``played`` if given, so ``replay(game,
+    played[:i])`` rebuilds the i-th state.
+    """
+    state = game.reset()
+    states = []
+    for _ in range(max_plies):
+        if game.is_terminal(state):
+            break
+        actions = game.valid_actions(state)
+        if not actions:
+            break
+        states.append(state)
+        action = rng.choice(actions)
+        if played is not None:
+            played.append(action)
+        state = game.apply_action(state, action)
+    return states
+
+
+def replay(game: Game, line: List[str]) -> Any:
+    """The state reached by playing ``line`` from the start."""
+    state = game.reset()
+    for action in line:
+        state = game.apply_action(state, action)
+    return state
+
+
+def playout_throughput(game: Game, seconds: float, seed: int = 0, max_plies: int = 500) -> Dict[str, float]:
+    """Random playouts per second and plies per second over ``seconds``."""
+    rng = random.Random(seed)
+    games = plies = 0
+    start = time.perf_counter()
+    while True:
+        plies += len(random_playout(game, rng, max_plies))
+        games += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= seconds:
+            break
+    return {"games_per_sec": games / elapsed, "plies_per_sec": plies / elapsed}
+
+
+def sample_positions(game: Game, samples: int, seed: int = 0, max_plies: int = 500) -> Dict[str, List[List[str]]]:
+    """Pick opening, midgame and endgame positions from seeded random playouts.
+
+    Each position is the line of moves leading to it; see ``replay``.
+    """
+    rng = random.Random(seed)
+    positions: Dict[str, List[List[str]]] = {phase: [] for phase in PHASES}
+    for _ in range(samples):
+        played: List[str] = []
+        states = random_playout(game, rng, max_plies, played)
+        if not states:
+            continue
+        positions["opening"].append(played[:0])
+        positions["midgame"].append(played[: len(states) // 2])
+        positions["endgame"].append(played[: len(states) - 1])
+    return positions
+
+
+def _call(game: Game, method: str, state: Any, action: str) -> Any:
+    if method == "apply_action":
+        return game.apply_action(state, action)
+    return getattr(game, method)(state)
+
+
+def method_latency(game: Game, positions: List[List[str]], repeats: int, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """Latency distribution in microseconds of each game method over ``positions``.
+
+    Every call gets the position rebuilt by ``replay``, so states that cache
+    derived data (legal moves and the like) are measured cold, as a new
+    state is after ``apply_action``.  A copy would carry the caches along.
+    """
+    rng = random.Random(seed)
+    results: Dict[str, Dict[str, float]] = {}
+    methods = METHODS + SYMMETRY_METHODS if game.supports_symmetry() else METHODS
+    for method in methods:
+        samples: List[float] = []
+        for line in positions:
+            action = rng.choice(game.valid_actions(replay(game, line)))
+            for _ in range(repeats):
+                fresh = replay(game, line)
+                start = time.perf_counter_ns()
+                _call(game, method, fresh, action)
+                samples.append((time.perf_counter_ns() - start) / 1000)
+        samples.sort()
+        results[method] = {
+            "mean_us": statistics.fmean(samples),
+            "p50_us": samples[len(samples) // 2],
+            "p90_us": samples[int(len(samples) * 0.9)],
+            "p99_us": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+        }
+    return results
+
+
+def state_memory(game: Game, positions: List[List[str]], seed: int = 0) -> int:
+    """Peak bytes allocated while producing one successor state, maximised over ``positions``."""
+    rng = random.Random(seed)
+    peak = 0
+    for line in positions:
+        state = replay(game, line)
+        action = rng.choice(game.valid_actions(state))
+        tracemalloc.start()
+        try:
+            game.apply_action(state, action)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+    return peak
+
+
+def perft(game: Game, state: Any, depth: int) -> int:
+    """Count the positions ``depth`` plies ahead; finished games count once.
+
+    Uses the integer action API, so it measures move generation and
+    ``apply_action_id`` without any string handling.
+    """
+    if depth == 0 or game.is_terminal(state):
+        return 1
+    if depth == 1:
+        return len(game.legal_action_ids(state))
+    return sum(perft(game, game.apply_action_id(state, a), depth - 1) for a in game.legal_action_ids(state))
+
+
+def perft_speed(game: Game, depth: int) -> Dict[str, float]:
+    """Perft node count from the start position and nodes per second."""
+    start = time.perf_counter()
+    nodes = perft(game, game.reset(), depth)
+    elapsed = time.perf_counter() - start
+    return {"depth": depth, "nodes": nodes, "nodes_per_sec": nodes / elapsed}
+
+
+def bench_game(name: str, seconds: float = 1.0, samples: int = 20, repeats: int = 5, seed: int = 0) -> Dict[str, Any]:
+    game = make_game(name)
+    positions = sample_positions(game, samples, seed)
+    return {
+        "throughput": playout_throughput(game, seconds, seed),
+        "latency": {phase: method_latency(game, lines, repeats, seed) for phase, lines in positions.items() if lines},
+        "peak_state_bytes": {phase: state_memory(game, lines, seed) for phase, lines in positions.items() if lines},
+    }
+
+
+def run_suite(names: List[str] | None = None, **kwargs: Any) -> Dict[str, Any]:
+    """Benchmark every registered game (or just ``names``)."""
+    return {name: bench_game(name, **kwargs) for name in names or registry.list()}
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.2, min_delta_us: float = 1.0
+) -> List[str]:
+    """Return a description of every metric that regressed by more than ``threshold``.
+
+    Throughput regresses when it drops; latencies and memory regress when they
+    grow.  Latency changes below ``min_delta_us`` are timer noise and ignored,
+    as are games or metrics missing from either side.
+    """
+    regressions: List[str] = []
+    for name, result in current.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        old = base["throughput"]["games_per_sec"]
+        new = result["throughput"]["games_per_sec"]
+        if new < old * (1 - threshold):
+            regressions.append(f"{name} games_per_sec {old:.1f} -> {new:.1f}")
+        for phase, methods in result["latency"].items():
+            for method, stats in methods.items():
+                old_p50 = base["latency"].get(phase, {}).get(method, {}).get("p50_us")
+                if old_p50 is None or stats["p50_us"] - old_p50 < min_delta_us:
+                    continue
+                if stats["p50_us"] > old_p50 * (1 + threshold):
+                    regressions.append(f"{name} {phase} {method} p50 {old_p50:.1f}us -> {stats['p50_us']:.1f}us")
+        for phase, size in result["peak_state_bytes"].items():
+            old_size = base["peak_state_bytes"].get(phase)
+            if old_size is not None and size > old_size * (1 + threshold):
+                regressions.append(f"{name} {phase} peak_state_bytes {old_size} -> {size}")
+    return regressions
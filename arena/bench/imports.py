@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import json
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict
+
+_PROBE = """
+import sys, time, json
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, sorted(m for m in sys.modules if m.startswith("arena"))]))
+"""
+
+
+def measure_import_time(module: str = "arena.games", repeats: int = 5) -> Dict[str, Any]:
+    """Time ``import module`` in fresh interpreters.
+
+    Each run starts a new process so nothing is cached in ``sys.modules``;
+    compiled bytecode on disk is reused, as it would be by a worker process.
+    """
+    times = []
+    loaded: list[str] = []
+    for _ in range(repeats):
+        out = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        elapsed, loaded = json.loads(out)
+        times.append(elapsed * 1000)
+    return {
+        "module": module,
+        "best_ms": min(times),
+        "median_ms": statistics.median(times),
+        "modules_loaded": loaded,
+    }
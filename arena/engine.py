@@ -1,26 +1,110 @@
 from __future__ import annotations
 
-from typing import Any
+import copy
+import time
+from typing import Any, List
 
 from .base import Game, Player
 
+# Game methods timed when an observer is attached.
+GAME_METHODS = (
+    "reset",
+    "valid_actions",
+    "apply_action",
+    "is_terminal",
+    "get_winner",
+    "render",
+    "state_key",
+    "current_player",
+)
+
+
+class EngineObserver:
+    """Hooks called by ``GameEngine`` while a match is played.
+
+    Every game-method call made during the match, by the engine or by a
+    player, is reported to ``on_call`` with its wall time, as is every
+    ``select_action``.  Times are inclusive: a game method that calls another
+    one reports both.  Calls belong to the turn announced by the latest
+    ``on_turn``.  ``on_match_start`` receives the game passed to the engine,
+    while the players are handed a timed per-match copy of it.
+    """
+
+    def on_match_start(self, game: Game, players: List[Player]) -> None:
+        pass
+
+    def on_turn(self, ply: int, player: int) -> None:
+        pass
+
+    def on_call(self, method: str, seconds: float) -> None:
+        pass
+
+    def on_match_end(self, winner: int | None) -> None:
+        pass
+
 
 class GameEngine:
     """Run a match between two players."""
 
-    def __init__(self, game: Game, player0: Player, player1: Player):
+    def __init__(self, game: Game, player0: Player, player1: Player, observer: EngineObserver | None = None):
         self.game = game
         self.players = [player0, player1]
+        self.observer = observer
 
-    def play(self) -> int:
-        """Run the game and return the winning player (0 or 1)."""
+    def play(self) -> int | None:
+        """Run the game and return the winning player (0 or 1), or None for a draw."""
+        if self.observer is not None:
+            return self._play_observed(self.observer)
         state = self.game.reset()
+        tracks_player = self.game.tracks_player()
         current = 0
         while not self.game.is_terminal(state):
             player = self.players[current]
             action = player.select_action(self.game, state)
             state = self.game.apply_action(state, action)
-            current = 1 - current
-        winner = self.game.get_winner(state)
-        assert winner is not None
+            current = self.game.current_player(state) if tracks_player else 1 - current
+        return self.game.get_winner(state)
+
+    def _play_observed(self, observer: EngineObserver) -> int | None:
+        observer.on_match_start(self.game, self.players)
+        game = _observed(self.game, observer)
+        ply = 0
+        tracks_player = game.tracks_player()
+        current = 0
+        observer.on_turn(ply, current)
+        state = game.reset()
+        while not game.is_terminal(state):
+            start = time.perf_counter()
+            action = self.players[current].select_action(game, state)
+            observer.on_call("select_action", time.perf_counter() - start)
+            state = game.apply_action(state, action)
+            current = game.current_player(state) if tracks_player else 1 - current
+            ply += 1
+            observer.on_turn(ply, current)
+        winner = game.get_winner(state)
+        observer.on_match_end(winner)
         return winner
+
+
+def _observed(game: Game, observer: EngineObserver) -> Game:
+    """A copy of `game` whose methods report their wall time to `observer`.
+
+    The copy is shallow, so it shares the game's tables and caches, and the
+    game itself is left alone for other matches running at the same time.
+    """
+    proxy = copy.copy(game)
+    for name in GAME_METHODS:
+        # Bound to the copy, so calls a method makes on ``self`` are timed too.
+        setattr(proxy, name, _timed(getattr(proxy, name), name, observer))
+    return proxy
+
+
+def _timed(method: Any, name: str, observer: EngineObserver) -> Any:
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            observer.on_call(name, time.perf_counter() - start)
+
+    return wrapper
@@ -1,25 +1,87 @@
-"""Game package auto-discovery.
+"""Game package with lazy auto-discovery.
 
-Rather than manually editing this file every time a new game is added, we
-automatically import any modules in this package that define subclasses of the
-``Game`` base class.  This keeps merge conflicts to a minimum because new games
-only need to add a new module and do not modify shared files.
+Rather than manually editing this file every time a new game is added, game
+classes are discovered automatically: the sources of the modules in this
+package are scanned for top-level classes deriving from ``Game`` (directly or
+through another game class).  Modules are only imported when one of their
+classes is first accessed, e.g. ``from arena.games import Othello``, so
+importing the package stays cheap however many games it holds.  New games only
+need to add a new module and do not modify shared files.
 """
 
 from __future__ import annotations
 
 import importlib
-import inspect
-import pkgutil
+import os
+import re
+from typing import Any, Dict, List
 
 from ..base import Game
 
-__all__: list[str] = []
+_CLASS_RE = re.compile(r"^class\s+(\w+)\s*\(([^)]*)\)\s*:", re.MULTILINE)
 
-for finder, name, ispkg in pkgutil.iter_modules(__path__):
-    module = importlib.import_module(f"{__name__}.{name}")
-    for attr_name, attr in vars(module).items():
-        if inspect.isclass(attr) and issubclass(attr, Game) and attr is not Game:
-            globals()[attr_name] = attr
-            __all__.append(attr_name)
 
+class GameRegistry:
+    """Map game class names to their modules without importing them."""
+
+    def __init__(self, package: str, path: str):
+        self.package = package
+        self.path = path
+        self._modules: Dict[str, str] = self._scan()
+
+    def list(self) -> List[str]:
+        """Return the names of all discovered game classes."""
+        return sorted(self._modules)
+
+    def module_name(self, name: str) -> str:
+        return f"{self.package}.{self._modules[name]}"
+
+    def load(self, name: str) -> type[Game]:
+        """Import the module defining ``name`` and return the class."""
+        if name not in self._modules:
+            raise KeyError(name)
+        cls = getattr(importlib.import_module(self.module_name(name)), name)
+        if not (isinstance(cls, type) and issubclass(cls, Game)):
+            raise TypeError(f"{name} is not a Game subclass")
+        return cls
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._modules
+
+    def _scan(self) -> Dict[str, str]:
+        bases: Dict[str, tuple[str, List[str]]] = {}
+        for filename in sorted(os.listdir(self.path)):
+            module, ext = os.path.splitext(filename)
+            if ext != ".py" or module.startswith("_"):
+                continue
+            with open(os.path.join(self.path, filename), encoding="utf-8") as f:
+                source = f.read()
+            for name, base_list in _CLASS_RE.findall(source):
+                names = [b.strip().rsplit(".", 1)[-1] for b in base_list.split(",")]
+                bases[name] = (module, names)
+        found: Dict[str, str] = {}
+        changed = True
+        while changed:
+            changed = False
+            for name, (module, names) in bases.items():
+                if name not in found and any(b == "Game" or b in found for b in names):
+                    found[name] = module
+                    changed = True
+        return found
+
+
+registry = GameRegistry(__name__, __path__[0])
+
+__all__: list[str] = registry.list()
+
+
+def __getattr__(name: str) -> Any:
+    if name in registry:
+        cls = registry.load(name)
+        globals()[name] = cls
+        return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,19 +1,93 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import List, Tuple
 
 from ..base import Game
+from ..hashing import zobrist_table
+
+_PIECES = "bBrR"
+_ZOBRIST = zobrist_table(64, len(_PIECES), "checkers")
+_SIDE_KEY = zobrist_table(1, 1, "checkers:side")[0][0]
+_OWNER = {"b": 0, "B": 0, "r": 1, "R": 1}
+
+# Direction indices into _DIRECTIONS usable by each piece.
+_DIRECTIONS = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+_PIECE_DIRECTIONS = {"b": (2, 3), "r": (0, 1), "B": (0, 1, 2, 3), "R": (0, 1, 2, 3)}
+# Row on which each side's men are crowned.
+_CROWN_ROW = (7, 0)
+
+
+def _in_bounds(r: int, c: int) -> bool:
+    return 0 <= r < 8 and 0 <= c < 8
+
+
+# Per square and direction: the adjacent square, and the (jumped, landing)
+# squares of a capture; -1 / None where the board ends.
+_STEPS = [
+    [(r + dr) * 8 + c + dc if _in_bounds(r + dr, c + dc) else -1 for dr, dc in _DIRECTIONS]
+    for r in range(8)
+    for c in range(8)
+]
+_JUMPS = [
+    [((r + dr) * 8 + c + dc, (r + 2 * dr) * 8 + c + 2 * dc) if _in_bounds(r + 2 * dr, c + 2 * dc) else None for dr, dc in _DIRECTIONS]
+    for r in range(8)
+    for c in range(8)
+]
+
+
+def _jump_sequences() -> List[Tuple[int, Tuple[int, ...]]]:
+    """Every multi-jump the board allows, whatever stands on it: (square,
+    directions) for two or more jumps that never cross the same square twice."""
+    sequences: List[Tuple[int, Tuple[int, ...]]] = []
+
+    def extend(origin: int, square: int, jumped: int, directions: Tuple[int, ...]) -> None:
+        for d in range(4):
+            jump = _JUMPS[square][d]
+            if jump is None or jumped >> jump[0] & 1:
+                continue
+            path = directions + (d,)
+            if len(path) >= 2:
+                sequences.append((origin, path))
+            extend(origin, jump[1], jumped | 1 << jump[0], path)
+
+    for square in range(64):
+        extend(square, square, 0, ())
+    return sequences
+
+
+# Action ids: a step or single jump is (square * 4 + direction) * 2 + jump.
+# A multi-jump is _SEQUENCE_BASE plus its index in _SEQUENCES; a legal capture
+# never jumps a piece twice, so the table holds every one (2512 entries).
+_SEQUENCE_BASE = 64 * 4 * 2
+_SEQUENCES = _jump_sequences()
+_SEQUENCE_IDS = {sequence: i for i, sequence in enumerate(_SEQUENCES)}
 
 
 @dataclass
 class CheckersState:
     board: List[List[str]]
     turn: int  # 0 for black, 1 for red
+    key: int | None = None  # Zobrist key, kept up to date by the game; None if unknown
+    # Derived data, computed at most once and then carried forward by apply_action.
+    counts: Tuple[int, int] | None = field(default=None, compare=False)  # pieces per side
+    occupied: int | None = field(default=None, repr=False, compare=False)  # bit r * 8 + c per piece
+    # (forced_jumps, legal action ids): the moves depend on the game's rule.
+    moves: Tuple[bool, List[int]] | None = field(default=None, repr=False, compare=False)
+    undo: List[tuple] | None = field(default=None, repr=False, compare=False)  # see Game.push
 
 
 class Checkers(Game):
-    """Simplified checkers implementation on an 8x8 board."""
+    """Simplified checkers implementation on an 8x8 board.
+
+    By default captures are optional single jumps.  With ``forced_jumps``
+    a side that can capture must, and a capture is the whole multi-jump
+    sequence (``"2,1->4,3->6,5"``), continued until no further jump is
+    possible or the piece is crowned.
+    """
+
+    def __init__(self, forced_jumps: bool = False):
+        self.forced_jumps = forced_jumps
 
     def reset(self) -> CheckersState:
         board = [[" "] * 8 for _ in range(8)]
@@ -25,79 +99,283 @@ class Checkers(Game):
             for c in range(8):
                 if (r + c) % 2 == 1:
                     board[r][c] = "r"
-        return CheckersState(board, 0)
+        state = CheckersState(board, 0)
+        state.key = self._compute_key(state)
+        return state
 
     def valid_actions(self, state: CheckersState) -> List[str]:
-        actions: List[str] = []
-        for r in range(8):
-            for c in range(8):
-                piece = state.board[r][c]
-                if not self._belongs_to_player(piece, state.turn):
-                    continue
-                for dr, dc in self._directions(piece, state.turn):
-                    nr, nc = r + dr, c + dc
-                    if self._in_bounds(nr, nc) and state.board[nr][nc] == " ":
-                        actions.append(f"{r},{c}->{nr},{nc}")
-                    elif self._in_bounds(nr, nc) and self._belongs_to_player(state.board[nr][nc], 1 - state.turn):
-                        jr, jc = r + 2 * dr, c + 2 * dc
-                        if self._in_bounds(jr, jc) and state.board[jr][jc] == " ":
-                            actions.append(f"{r},{c}->{jr},{jc}")
-        return actions
+        return [self.action_to_str(state, action_id) for action_id in self._moves(state)]
 
     def apply_action(self, state: CheckersState, action: str) -> CheckersState:
-        src, dst = action.split("->")
-        r1, c1 = map(int, src.split(","))
-        r2, c2 = map(int, dst.split(","))
-        piece = state.board[r1][c1]
-        if not self._belongs_to_player(piece, state.turn):
+        return self.apply_action_id(state, self.str_to_action(state, action))
+
+    def apply_action_id(self, state: CheckersState, action_id: int) -> CheckersState:
+        if action_id not in self._moves(state):
             raise ValueError("Invalid move")
-        new_board = [row.copy() for row in state.board]
-        new_board[r1][c1] = " "
-        if abs(r2 - r1) == 2:
-            mr, mc = (r1 + r2) // 2, (c1 + c2) // 2
-            new_board[mr][mc] = " "
-        if piece == "b" and r2 == 7:
-            piece = "B"
-        elif piece == "r" and r2 == 0:
-            piece = "R"
-        new_board[r2][c2] = piece
-        return CheckersState(new_board, 1 - state.turn)
+        counts, occupied = self._derived(state)
+        key = self.state_key(state)
+        child = CheckersState([row.copy() for row in state.board], state.turn, key, counts, occupied)
+        self._play(child, action_id, None)
+        return child
+
+    def push(self, state: CheckersState, action: str) -> None:
+        action_id = self.str_to_action(state, action)
+        if action_id not in self._moves(state):
+            raise ValueError("Invalid move")
+        counts, occupied = self._derived(state)
+        changes: List[Tuple[int, int, str]] = []
+        record = (state.key, counts, occupied, state.moves, changes)
+        self._play(state, action_id, changes)
+        if state.undo is None:
+            state.undo = []
+        state.undo.append(record)
+
+    def pop(self, state: CheckersState) -> None:
+        if not state.undo:
+            raise ValueError("No move to undo")
+        state.key, state.counts, state.occupied, state.moves, changes = state.undo.pop()
+        if not state.undo:
+            state.undo = None
+        for r, c, cell in reversed(changes):
+            state.board[r][c] = cell
+        state.turn = 1 - state.turn
 
     def is_terminal(self, state: CheckersState) -> bool:
-        if not self._has_pieces(state, 0) or not self._has_pieces(state, 1):
-            return True
-        return len(self.valid_actions(state)) == 0
+        counts, _ = self._derived(state)
+        return not counts[0] or not counts[1] or not self._moves(state)
 
     def get_winner(self, state: CheckersState) -> int | None:
-        if not self._has_pieces(state, 0):
+        counts, _ = self._derived(state)
+        if not counts[0]:
             return 1
-        if not self._has_pieces(state, 1):
+        if not counts[1]:
             return 0
-        if len(self.valid_actions(state)) == 0:
+        if not self._moves(state):
             return 1 - state.turn
         return None
 
+    def current_player(self, state: CheckersState) -> int:
+        return state.turn
+
     def render(self, state: CheckersState) -> str:
         rows = ["|".join(row) for row in state.board]
         board = "\n".join(rows)
         return f"```\n{board}\n```"
 
-    def _belongs_to_player(self, piece: str, player: int) -> bool:
-        if player == 0:
-            return piece in {"b", "B"}
-        return piece in {"r", "R"}
-
-    def _directions(self, piece: str, player: int) -> List[tuple[int, int]]:
-        if piece in {"B", "R"}:
-            return [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-        return [(1, -1), (1, 1)] if player == 0 else [(-1, -1), (-1, 1)]
-
-    def _in_bounds(self, r: int, c: int) -> bool:
-        return 0 <= r < 8 and 0 <= c < 8
-
-    def _has_pieces(self, state: CheckersState, player: int) -> bool:
-        for row in state.board:
-            for cell in row:
-                if self._belongs_to_player(cell, player):
-                    return True
-        return False
+    def state_key(self, state: CheckersState) -> int:
+        # States built by hand carry no key; work it out without storing it.
+        return self._compute_key(state) if state.key is None else state.key
+
+    def num_actions(self) -> int:
+        if self.forced_jumps:
+            return _SEQUENCE_BASE + len(_SEQUENCES)
+        return _SEQUENCE_BASE
+
+    def legal_action_ids(self, state: CheckersState) -> List[int]:
+        return list(self._moves(state))
+
+    def action_to_str(self, state: CheckersState, action_id: int) -> str:
+        square, directions, jump = self._decode(action_id)
+        path = [square]
+        for d in directions:
+            path.append(_JUMPS[path[-1]][d][1] if jump else _STEPS[path[-1]][d])
+        return "->".join(f"{s // 8},{s % 8}" for s in path)
+
+    def str_to_action(self, state: CheckersState, action: str) -> int:
+        try:
+            path = [tuple(map(int, part.split(","))) for part in action.split("->")]
+        except ValueError as exc:
+            raise ValueError("Invalid move") from exc
+        if len(path) < 2 or any(len(p) != 2 or not _in_bounds(*p) for p in path):
+            raise ValueError("Invalid move")
+        step = abs(path[1][0] - path[0][0])
+        directions = []
+        for (r1, c1), (r2, c2) in zip(path, path[1:]):
+            dr, dc = r2 - r1, c2 - c1
+            if step not in (1, 2) or abs(dr) != step or abs(dc) != step:
+                raise ValueError("Invalid move")
+            directions.append(_DIRECTIONS.index((dr // step, dc // step)))
+        square = path[0][0] * 8 + path[0][1]
+        if len(directions) > 1 and (step == 1 or (square, tuple(directions)) not in _SEQUENCE_IDS):
+            raise ValueError("Invalid move")
+        return self._encode(square, directions, step == 2)
+
+    def capture_sequences(self, state: CheckersState) -> List[List[int]]:
+        """Every complete multi-jump of the side to move, as square paths.
+
+        Found by a depth-first search over the capture tree: a sequence ends
+        when the piece cannot jump again or is crowned.  Jumped pieces stay on
+        the board until the sequence ends, so they block landings and cannot
+        be jumped twice.
+        """
+        return [self._path(square, directions) for square, directions in self._captures(state)]
+
+    # internal helpers -------------------------------------------------
+
+    def _derived(self, state: CheckersState) -> Tuple[Tuple[int, int], int]:
+        if state.counts is None or state.occupied is None:
+            counts = [0, 0]
+            occupied = 0
+            for r, row in enumerate(state.board):
+                for c, cell in enumerate(row):
+                    if cell != " ":
+                        counts[_OWNER[cell]] += 1
+                        occupied |= 1 << (r * 8 + c)
+            state.counts = (counts[0], counts[1])
+            state.occupied = occupied
+        return state.counts, state.occupied
+
+    def _moves(self, state: CheckersState) -> List[int]:
+        cached = state.moves
+        if cached is None or cached[0] != self.forced_jumps:
+            cached = state.moves = (self.forced_jumps, self._generate(state))
+        return cached[1]
+
+    def _generate(self, state: CheckersState) -> List[int]:
+        if self.forced_jumps:
+            captures = self._captures(state)
+            if captures:
+                return [self._encode(square, directions, True) for square, directions in captures]
+        _, occupied = self._derived(state)
+        board = state.board
+        turn = state.turn
+        moves: List[int] = []
+        pieces = occupied
+        while pieces:
+            low = pieces & -pieces
+            pieces ^= low
+            square = low.bit_length() - 1
+            piece = board[square >> 3][square & 7]
+            if _OWNER[piece] != turn:
+                continue
+            for d in _PIECE_DIRECTIONS[piece]:
+                target = _STEPS[square][d]
+                if target < 0:
+                    continue
+                if not occupied >> target & 1:
+                    moves.append((square * 4 + d) * 2)
+                elif _OWNER[board[target >> 3][target & 7]] != turn and not self.forced_jumps:
+                    jump = _JUMPS[square][d]
+                    if jump is not None and not occupied >> jump[1] & 1:
+                        moves.append((square * 4 + d) * 2 + 1)
+        return moves
+
+    def _captures(self, state: CheckersState) -> List[Tuple[int, List[int]]]:
+        _, occupied = self._derived(state)
+        board = state.board
+        turn = state.turn
+        found: List[Tuple[int, List[int]]] = []
+        pieces = occupied
+        while pieces:
+            low = pieces & -pieces
+            pieces ^= low
+            square = low.bit_length() - 1
+            piece = board[square >> 3][square & 7]
+            if _OWNER[piece] == turn:
+                self._extend(board, piece, square, square, occupied ^ low, 0, [], found)
+        return found
+
+    def _extend(
+        self,
+        board: List[List[str]],
+        piece: str,
+        origin: int,
+        square: int,
+        occupied: int,
+        jumped: int,
+        directions: List[int],
+        found: List[Tuple[int, List[int]]],
+    ) -> None:
+        turn = _OWNER[piece]
+        extended = False
+        for d in _PIECE_DIRECTIONS[piece]:
+            jump = _JUMPS[square][d]
+            if jump is None:
+                continue
+            over, land = jump
+            if occupied >> land & 1 or jumped >> over & 1 or not occupied >> over & 1:
+                continue
+            if _OWNER[board[over >> 3][over & 7]] == turn:
+                continue
+            extended = True
+            path = directions + [d]
+            if piece.islower() and land >> 3 == _CROWN_ROW[turn]:
+                found.append((origin, path))  # crowning ends the move
+            else:
+                self._extend(board, piece, origin, land, occupied, jumped | (1 << over), path, found)
+        if not extended and directions:
+            found.append((origin, directions))
+
+    def _play(self, state: CheckersState, action_id: int, changes: List | None) -> None:
+        """Make the move ``action_id`` on ``state`` in place.
+
+        Overwritten cells are appended to ``changes`` when it is given.
+        """
+        square, directions, jump = self._decode(action_id)
+        board = state.board
+        key = state.key
+        counts = list(state.counts)
+        occupied = state.occupied
+        piece = board[square >> 3][square & 7]
+        opponent = 1 - _OWNER[piece]
+        if key is not None:
+            key ^= _SIDE_KEY ^ self._piece_key(square, piece)
+        if changes is not None:
+            changes.append((square >> 3, square & 7, piece))
+        board[square >> 3][square & 7] = " "
+        occupied ^= 1 << square
+        for d in directions:
+            if jump:
+                over, square = _JUMPS[square][d]
+                taken = board[over >> 3][over & 7]
+                if key is not None:
+                    key ^= self._piece_key(over, taken)
+                if changes is not None:
+                    changes.append((over >> 3, over & 7, taken))
+                board[over >> 3][over & 7] = " "
+                occupied ^= 1 << over
+                counts[opponent] -= 1
+            else:
+                square = _STEPS[square][d]
+        if piece.islower() and square >> 3 == _CROWN_ROW[1 - opponent]:
+            piece = piece.upper()
+        if key is not None:
+            key ^= self._piece_key(square, piece)
+        if changes is not None:
+            changes.append((square >> 3, square & 7, " "))
+        board[square >> 3][square & 7] = piece
+        state.key = key
+        state.counts = (counts[0], counts[1])
+        state.occupied = occupied | (1 << square)
+        state.moves = None
+        state.turn = 1 - state.turn
+
+    def _encode(self, square: int, directions: List[int], jump: bool) -> int:
+        if len(directions) == 1:
+            return (square * 4 + directions[0]) * 2 + jump
+        return _SEQUENCE_BASE + _SEQUENCE_IDS[square, tuple(directions)]
+
+    def _decode(self, action_id: int) -> Tuple[int, List[int], bool]:
+        if action_id < _SEQUENCE_BASE:
+            rest, jump = divmod(action_id, 2)
+            square, direction = divmod(rest, 4)
+            return square, [direction], bool(jump)
+        square, directions = _SEQUENCES[action_id - _SEQUENCE_BASE]
+        return square, list(directions), True
+
+    def _path(self, square: int, directions: List[int]) -> List[int]:
+        path = [square]
+        for d in directions:
+            path.append(_JUMPS[path[-1]][d][1])
+        return path
+
+    def _compute_key(self, state: CheckersState) -> int:
+        key = _SIDE_KEY if state.turn else 0
+        for r, row in enumerate(state.board):
+            for c, cell in enumerate(row):
+                if cell != " ":
+                    key ^= self._piece_key(r * 8 + c, cell)
+        return key
+
+    def _piece_key(self, square: int, piece: str) -> int:
+        return _ZOBRIST[square][_PIECES.index(piece)]
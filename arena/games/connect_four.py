@@ -1,8 +1,28 @@
 from __future__ import annotations
 
-from typing import Any, List
+from dataclasses import dataclass, field
+from typing import Iterator, List, Tuple
 
 from ..base import Game
+from ..hashing import canonical_key, symmetry_table, zobrist_table
+
+
+@dataclass(slots=True)
+class ConnectFourState:
+    """Bitboard position.
+
+    Column ``c`` occupies bits ``c * (rows + 1)`` upwards, bottom cell first.
+    The extra bit on top of each column is always empty so that shifted lines
+    cannot wrap from one column into the next.
+    """
+
+    x: int  # stones of player 0
+    o: int  # stones of player 1
+    mask: int  # x | o
+    moves: int
+    winner: int | None = None
+    key: int = 0  # Zobrist key, updated incrementally
+    undo: List[Tuple[int, int | None]] | None = field(default=None, repr=False, compare=False)  # see Game.push
 
 
 class ConnectFour(Game):
@@ -12,60 +32,165 @@ class ConnectFour(Game):
         self.rows = rows
         self.cols = cols
         self.connect = connect
+        self.height = rows + 1
+        self.bottom = [1 << (c * self.height) for c in range(cols)]
+        self.top = [1 << (c * self.height + rows - 1) for c in range(cols)]
+        # vertical, horizontal and both diagonals
+        self.shifts = (1, self.height, self.height - 1, self.height + 1)
+        self.zobrist = zobrist_table(cols * self.height, 2, f"connect_four:{rows}x{cols}")
+        # Left-right mirror; transform 1 maps bit c * height + r to the mirrored column.
+        h = self.height
+        mirror = [(cols - 1 - bit // h) * h + bit % h for bit in range(cols * h)]
+        self.symmetries = [list(range(cols * self.height)), mirror]
+        self.symmetry_keys = symmetry_table(self.zobrist, self.symmetries)
 
-    def reset(self) -> List[List[str]]:
-        return [[" "] * self.cols for _ in range(self.rows)]
+    def reset(self) -> ConnectFourState:
+        return ConnectFourState(0, 0, 0, 0)
 
-    def valid_actions(self, state: List[List[str]]) -> List[str]:
-        return [str(c) for c in range(self.cols) if state[0][c] == " "]
+    def from_bitboards(self, x: int, o: int) -> ConnectFourState:
+        """Build the position with stones ``x`` and ``o`` (see ``ConnectFourState``)."""
+        state = ConnectFourState(x, o, x | o, (x | o).bit_count())
+        if self._has_line(x):
+            state.winner = 0
+        elif self._has_line(o):
+            state.winner = 1
+        state.key = self._compute_key(state)
+        return state
 
-    def apply_action(self, state: List[List[str]], action: str) -> List[List[str]]:
-        col = int(action)
-        if state[0][col] != " ":
-            raise ValueError("Invalid move")
-        piece = self._current_player(state)
-        new_state = [row.copy() for row in state]
-        for r in range(self.rows - 1, -1, -1):
-            if new_state[r][col] == " ":
-                new_state[r][col] = piece
-                break
-        return new_state
-
-    def is_terminal(self, state: List[List[str]]) -> bool:
-        return self.get_winner(state) is not None or all(state[0][c] != " " for c in range(self.cols))
-
-    def get_winner(self, state: List[List[str]]) -> int | None:
+    def valid_actions(self, state: ConnectFourState) -> List[str]:
+        mask = state.mask
+        return [str(c) for c in range(self.cols) if not mask & self.top[c]]
+
+    def apply_action(self, state: ConnectFourState, action: str) -> ConnectFourState:
+        return self.apply_action_id(state, self.str_to_action(state, action))
+
+    def is_terminal(self, state: ConnectFourState) -> bool:
+        return state.winner is not None or state.moves == self.rows * self.cols
+
+    def get_winner(self, state: ConnectFourState) -> int | None:
+        return state.winner
+
+    def current_player(self, state: ConnectFourState) -> int:
+        return state.moves % 2
+
+    def render(self, state: ConnectFourState) -> str:
+        rows = []
         for r in range(self.rows):
+            h = self.rows - 1 - r
+            cells = []
             for c in range(self.cols):
-                piece = state[r][c]
-                if piece == " ":
-                    continue
-                if self._check_direction(state, r, c, 1, 0, piece):
-                    return 0 if piece == "X" else 1
-                if self._check_direction(state, r, c, 0, 1, piece):
-                    return 0 if piece == "X" else 1
-                if self._check_direction(state, r, c, 1, 1, piece):
-                    return 0 if piece == "X" else 1
-                if self._check_direction(state, r, c, 1, -1, piece):
-                    return 0 if piece == "X" else 1
-        return None
-
-    def render(self, state: List[List[str]]) -> str:
-        rows = ["|".join(row) for row in state]
+                bit = 1 << (c * self.height + h)
+                cells.append("X" if state.x & bit else "O" if state.o & bit else " ")
+            rows.append("|".join(cells))
         board = "\n".join(rows)
         return f"```\n{board}\n```"
 
-    def _check_direction(self, state: List[List[str]], r: int, c: int, dr: int, dc: int, piece: str) -> bool:
-        for i in range(1, self.connect):
-            nr, nc = r + dr * i, c + dc * i
-            if nr < 0 or nr >= self.rows or nc < 0 or nc >= self.cols:
-                return False
-            if state[nr][nc] != piece:
-                return False
-        return True
-
-    def _current_player(self, state: List[List[str]]) -> str:
-        flat = sum(state, [])
-        x_count = flat.count("X")
-        o_count = flat.count("O")
-        return "X" if x_count == o_count else "O"
+    def state_key(self, state: ConnectFourState) -> int:
+        return state.key
+
+    def canonical_state(self, state: ConnectFourState) -> Tuple[int, int]:
+        return canonical_key(self._pieces(state), self.symmetry_keys)
+
+    def to_canonical_action(self, state: ConnectFourState, action_id: int, transform: int) -> int:
+        return self.cols - 1 - action_id if transform else action_id
+
+    def from_canonical_action(self, state: ConnectFourState, action_id: int, transform: int) -> int:
+        return self.cols - 1 - action_id if transform else action_id
+
+    def num_actions(self) -> int:
+        return self.cols
+
+    def legal_action_ids(self, state: ConnectFourState) -> List[int]:
+        mask = state.mask
+        return [c for c in range(self.cols) if not mask & self.top[c]]
+
+    def apply_action_id(self, state: ConnectFourState, col: int) -> ConnectFourState:
+        if col < 0 or col >= self.cols or state.mask & self.top[col]:
+            raise ValueError("Invalid move")
+        mask = state.mask | (state.mask + self.bottom[col])
+        move = mask ^ state.mask
+        player = state.moves % 2
+        key = state.key ^ self.zobrist[move.bit_length() - 1][player]
+        if player == 0:
+            x = state.x | move
+            winner = state.winner
+            if winner is None and self._has_line(x):
+                winner = 0
+            return ConnectFourState(x, state.o, mask, state.moves + 1, winner, key)
+        o = state.o | move
+        winner = state.winner
+        if winner is None and self._has_line(o):
+            winner = 1
+        return ConnectFourState(state.x, o, mask, state.moves + 1, winner, key)
+
+    def push(self, state: ConnectFourState, action: str) -> None:
+        col = self.str_to_action(state, action)
+        if col < 0 or col >= self.cols or state.mask & self.top[col]:
+            raise ValueError("Invalid move")
+        if state.undo is None:
+            state.undo = []
+        state.undo.append((col, state.winner))
+        move = (state.mask + self.bottom[col]) & ~state.mask
+        state.mask |= move
+        player = state.moves % 2
+        state.key ^= self.zobrist[move.bit_length() - 1][player]
+        if player == 0:
+            state.x |= move
+            if state.winner is None and self._has_line(state.x):
+                state.winner = 0
+        else:
+            state.o |= move
+            if state.winner is None and self._has_line(state.o):
+                state.winner = 1
+        state.moves += 1
+
+    def pop(self, state: ConnectFourState) -> None:
+        if not state.undo:
+            raise ValueError("No move to undo")
+        col, state.winner = state.undo.pop()
+        if not state.undo:
+            state.undo = None
+        column = state.mask & (((1 << self.height) - 1) << (col * self.height))
+        move = 1 << (column.bit_length() - 1)
+        state.mask ^= move
+        state.moves -= 1
+        player = state.moves % 2
+        state.key ^= self.zobrist[move.bit_length() - 1][player]
+        if player == 0:
+            state.x ^= move
+        else:
+            state.o ^= move
+
+    def action_to_str(self, state: ConnectFourState, action_id: int) -> str:
+        return str(action_id)
+
+    def str_to_action(self, state: ConnectFourState, action: str) -> int:
+        return int(action)
+
+    def _has_line(self, bits: int) -> bool:
+        for shift in self.shifts:
+            m = bits
+            for i in range(1, self.connect):
+                m &= bits >> (shift * i)
+                if not m:
+                    break
+            if m:
+                return True
+        return False
+
+    def _compute_key(self, state: ConnectFourState) -> int:
+        key = 0
+        for bit, player in self._pieces(state):
+            key ^= self.zobrist[bit][player]
+        return key
+
+    def _pieces(self, state: ConnectFourState) -> Iterator[Tuple[int, int]]:
+        """``(bit, player)`` for every stone."""
+        for player, bits in enumerate((state.x, state.o)):
+            while bits:
+                low = bits & -bits
+                yield low.bit_length() - 1, player
+                bits ^= low
+
+    def _current_player(self, state: ConnectFourState) -> str:
+        return "X" if state.moves % 2 == 0 else "O"
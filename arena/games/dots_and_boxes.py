@@ -1,60 +1,107 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Set
+from dataclasses import dataclass, field
+from typing import List, Tuple
 
 from ..base import Game
+from ..hashing import zobrist_table
+
+
+@dataclass(slots=True)
+class DotsAndBoxesState:
+    """Position as integers only, so copying a state is O(1).
+
+    Bit ``e`` of ``edges`` is set once edge ``e`` is drawn.  ``sides`` packs
+    a 3-bit count of drawn sides per box (box ``i`` at bits ``3 * i``), and
+    ``owned`` holds a box bitmask per player.
+    """
+
+    edges: int
+    sides: int
+    owned: Tuple[int, int]
+    player: int  # side to move
+    key: int = 0  # Zobrist key, updated incrementally
+    undo: List[tuple] | None = field(default=None, repr=False, compare=False)  # see Game.push
 
 
 class DotsAndBoxes(Game):
-    """Simplified Dots and Boxes on an n x n grid."""
+    """Simplified Dots and Boxes on an n x n grid.
+
+    Players simply alternate unless ``extra_turns`` is set, in which case
+    completing a box earns another move as in the real game.
+    """
 
-    def __init__(self, size: int = 2):
+    def __init__(self, size: int = 2, extra_turns: bool = False):
         self.size = size
+        self.extra_turns = extra_turns
         self.h_edges = (size + 1) * size
         self.total_edges = 2 * size * (size + 1)
-        # Precompute edge sets for each box
-        self.box_to_edges: List[Set[int]] = []
+        self.full = (1 << self.total_edges) - 1
+        # Boxes next to each edge (one or two), and the amount to add to the
+        # packed side counters when the edge is drawn.
+        self.edge_boxes: List[Tuple[int, ...]] = [() for _ in range(self.total_edges)]
         for r in range(size):
             for c in range(size):
-                top = self._h_edge_index(r, c)
-                bottom = self._h_edge_index(r + 1, c)
-                left = self._v_edge_index(r, c)
-                right = self._v_edge_index(r, c + 1)
-                self.box_to_edges.append({top, bottom, left, right})
+                box = r * size + c
+                for edge in (
+                    self._h_edge_index(r, c),
+                    self._h_edge_index(r + 1, c),
+                    self._v_edge_index(r, c),
+                    self._v_edge_index(r, c + 1),
+                ):
+                    self.edge_boxes[edge] += (box,)
+        self.edge_sides = [sum(1 << (3 * box) for box in boxes) for boxes in self.edge_boxes]
+        self.edge_names = [str(edge) for edge in range(self.total_edges)]
+        self.edge_keys = zobrist_table(self.total_edges, 1, f"dots_and_boxes:{size}:edges")
+        self.box_keys = zobrist_table(size * size, 2, f"dots_and_boxes:{size}:boxes")
+        self.side_key = zobrist_table(1, 1, f"dots_and_boxes:{size}:side")[0][0]
 
-    def reset(self) -> Dict[str, Any]:
-        return {"edges": set(), "boxes": [None] * (self.size * self.size)}
+    def reset(self) -> DotsAndBoxesState:
+        return DotsAndBoxesState(0, 0, (0, 0), 0)
 
-    def valid_actions(self, state: Dict[str, Any]) -> List[str]:
-        return [str(i) for i in range(self.total_edges) if i not in state["edges"]]
+    def valid_actions(self, state: DotsAndBoxesState) -> List[str]:
+        names = self.edge_names
+        return [names[edge] for edge in self.legal_action_ids(state)]
 
-    def apply_action(self, state: Dict[str, Any], action: str) -> Dict[str, Any]:
-        edge = int(action)
-        if edge < 0 or edge >= self.total_edges or edge in state["edges"]:
-            raise ValueError("Invalid move")
-        new_state = {"edges": set(state["edges"]), "boxes": state["boxes"].copy()}
-        new_state["edges"].add(edge)
-        player = self._current_player(state)
-        for idx, edges in enumerate(self.box_to_edges):
-            if new_state["boxes"][idx] is None and edges.issubset(new_state["edges"]):
-                new_state["boxes"][idx] = player
-        return new_state
-
-    def is_terminal(self, state: Dict[str, Any]) -> bool:
-        return len(state["edges"]) == self.total_edges
-
-    def get_winner(self, state: Dict[str, Any]) -> int | None:
+    def apply_action(self, state: DotsAndBoxesState, action: str) -> DotsAndBoxesState:
+        return self.apply_action_id(state, self.str_to_action(state, action))
+
+    def apply_action_id(self, state: DotsAndBoxesState, edge: int) -> DotsAndBoxesState:
+        return DotsAndBoxesState(*self._successor(state, edge))
+
+    def push(self, state: DotsAndBoxesState, action: str) -> None:
+        fields = self._successor(state, self.str_to_action(state, action))
+        if state.undo is None:
+            state.undo = []
+        state.undo.append((state.edges, state.sides, state.owned, state.player, state.key))
+        state.edges, state.sides, state.owned, state.player, state.key = fields
+
+    def pop(self, state: DotsAndBoxesState) -> None:
+        if not state.undo:
+            raise ValueError("No move to undo")
+        state.edges, state.sides, state.owned, state.player, state.key = state.undo.pop()
+        if not state.undo:
+            state.undo = None
+
+    def is_terminal(self, state: DotsAndBoxesState) -> bool:
+        return state.edges == self.full
+
+    def get_winner(self, state: DotsAndBoxesState) -> int | None:
         if not self.is_terminal(state):
             return None
-        p0 = state["boxes"].count(0)
-        p1 = state["boxes"].count(1)
+        p0 = state.owned[0].bit_count()
+        p1 = state.owned[1].bit_count()
         if p0 > p1:
             return 0
         if p1 > p0:
             return 1
         return None
 
-    def render(self, state: Dict[str, Any]) -> str:
+    def current_player(self, state: DotsAndBoxesState) -> int:
+        return state.player
+
+    def render(self, state: DotsAndBoxesState) -> str:
+        edges = state.edges
         lines: List[str] = []
         for r in range(self.size + 1):
             # Dots and horizontal edges
@@ -62,7 +109,7 @@ class DotsAndBoxes(Game):
             for c in range(self.size):
                 line += "*"
                 edge_idx = self._h_edge_index(r, c)
-                line += "---" if edge_idx in state["edges"] else "   "
+                line += "---" if edges >> edge_idx & 1 else "   "
             line += "*"
             lines.append(line)
             if r < self.size:
@@ -70,18 +117,53 @@ class DotsAndBoxes(Game):
                 line = ""
                 for c in range(self.size):
                     edge_idx = self._v_edge_index(r, c)
-                    line += "|" if edge_idx in state["edges"] else " "
-                    owner = state["boxes"][r * self.size + c]
-                    token = "X" if owner == 0 else "O" if owner == 1 else " "
+                    line += "|" if edges >> edge_idx & 1 else " "
+                    box = r * self.size + c
+                    token = "X" if state.owned[0] >> box & 1 else "O" if state.owned[1] >> box & 1 else " "
                     line += f" {token} "
                 edge_idx = self._v_edge_index(r, self.size)
-                line += "|" if edge_idx in state["edges"] else " "
+                line += "|" if edges >> edge_idx & 1 else " "
                 lines.append(line)
         board = "\n".join(lines)
         return f"```\n{board}\n```"
 
-    def _current_player(self, state: Dict[str, Any]) -> int:
-        return len(state["edges"]) % 2
+    def state_key(self, state: DotsAndBoxesState) -> int:
+        return state.key
+
+    def num_actions(self) -> int:
+        return self.total_edges
+
+    def legal_action_ids(self, state: DotsAndBoxesState) -> List[int]:
+        # Reading the bits from the binary string is faster than peeling
+        # them off one at a time on wide boards.
+        free = bin(self.full & ~state.edges)[:1:-1]
+        return [edge for edge, bit in enumerate(free) if bit == "1"]
+
+    def action_to_str(self, state: DotsAndBoxesState, action_id: int) -> str:
+        return self.edge_names[action_id]
+
+    def str_to_action(self, state: DotsAndBoxesState, action: str) -> int:
+        return int(action)
+
+    def _successor(self, state: DotsAndBoxesState, edge: int) -> tuple:
+        """Fields of the state after drawing ``edge``, in ``DotsAndBoxesState`` order."""
+        if edge < 0 or edge >= self.total_edges or state.edges >> edge & 1:
+            raise ValueError("Invalid move")
+        player = state.player
+        sides = state.sides + self.edge_sides[edge]
+        key = state.key ^ self.edge_keys[edge][0]
+        owned = state.owned
+        completed = 0
+        for box in self.edge_boxes[edge]:
+            if sides >> (3 * box) & 7 == 4:
+                completed |= 1 << box
+                key ^= self.box_keys[box][player]
+        if completed:
+            owned = (owned[0] | completed, owned[1]) if player == 0 else (owned[0], owned[1] | completed)
+        if not (completed and self.extra_turns):
+            player = 1 - player
+            key ^= self.side_key
+        return state.edges | (1 << edge), sides, owned, player, key
 
     def _h_edge_index(self, r: int, c: int) -> int:
         return r * self.size + c
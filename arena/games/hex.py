@@ -1,8 +1,78 @@
 from __future__ import annotations
 
-from typing import Any, List, Tuple
+from dataclasses import dataclass
+from typing import List, Set, Tuple
 
 from ..base import Game
+from ..hashing import canonical_key, grid_symmetries, symmetry_table, zobrist_table
+
+
+class _DisjointSets:
+    """Union-find over a grid of nodes, stored as rows shared between versions.
+
+    Nodes are ids ``row * width + col``.  ``fork`` copies only the list of
+    row references; a row is copied the first time a fork writes to it, so a
+    new version costs O(rows) plus the rows it touches.  Union by rank keeps
+    ``find`` logarithmic without path compression, which would otherwise
+    write to shared rows on every lookup.
+    """
+
+    __slots__ = ("width", "parent", "rank", "_owned")
+
+    def __init__(self, width: int, parent: List[List[int]], rank: List[List[int]]):
+        self.width = width
+        self.parent = parent
+        self.rank = rank
+        self._owned: Set[int] = set()
+
+    @classmethod
+    def create(cls, rows: int, width: int) -> "_DisjointSets":
+        parent = [list(range(r * width, (r + 1) * width)) for r in range(rows)]
+        rank = [[0] * width for _ in range(rows)]
+        return cls(width, parent, rank)
+
+    def fork(self) -> "_DisjointSets":
+        return _DisjointSets(self.width, self.parent.copy(), self.rank.copy())
+
+    def find(self, node: int) -> int:
+        w = self.width
+        parent = self.parent
+        while True:
+            up = parent[node // w][node % w]
+            if up == node:
+                return node
+            node = up
+
+    def union(self, a: int, b: int) -> None:
+        a = self.find(a)
+        b = self.find(b)
+        if a == b:
+            return
+        w = self.width
+        rank_a = self.rank[a // w][a % w]
+        rank_b = self.rank[b // w][b % w]
+        if rank_a < rank_b:
+            a, b = b, a
+        self._own(b // w)[b % w] = a
+        if rank_a == rank_b:
+            self._own(a // w, rank=True)[a % w] += 1
+
+    def _own(self, row: int, rank: bool = False) -> List[int]:
+        key = -row - 1 if rank else row
+        rows = self.rank if rank else self.parent
+        if key not in self._owned:
+            rows[row] = rows[row].copy()
+            self._owned.add(key)
+        return rows[row]
+
+
+@dataclass(slots=True)
+class HexState:
+    board: List[List[str]]  # rows are shared between states; never mutate in place
+    groups: _DisjointSets
+    moves: int = 0
+    winner: int | None = None
+    key: int = 0  # Zobrist key, updated incrementally
 
 
 class Hex(Game):
@@ -18,82 +88,123 @@ class Hex(Game):
             (1, -1),
             (1, 0),
         ]
+        # Cells are nodes (r, c); the four board edges are virtual nodes in an
+        # extra row below the board.
+        self.width = max(size, 4)
+        edge_row = size * self.width
+        self.left, self.right, self.top, self.bottom = range(edge_row, edge_row + 4)
+        self.zobrist = zobrist_table(size * size, 2, f"hex:{size}")
+        # Rotating the board by 180 degrees keeps each player's edges, so it
+        # is the one symmetry that preserves the rules.
+        self.symmetries = grid_symmetries(size, size, (0, 2))
+        self.symmetry_keys = symmetry_table(self.zobrist, self.symmetries)
 
-    def reset(self) -> List[List[str]]:
-        return [[" "] * self.size for _ in range(self.size)]
+    def reset(self) -> HexState:
+        board = [[" "] * self.size for _ in range(self.size)]
+        return HexState(board, _DisjointSets.create(self.size + 1, self.width))
 
-    def valid_actions(self, state: List[List[str]]) -> List[str]:
+    def valid_actions(self, state: HexState) -> List[str]:
         actions = []
         for r in range(self.size):
             for c in range(self.size):
-                if state[r][c] == " ":
+                if state.board[r][c] == " ":
                     actions.append(f"{r},{c}")
         return actions
 
-    def apply_action(self, state: List[List[str]], action: str) -> List[List[str]]:
-        r_s, c_s = action.split(",")
-        r, c = int(r_s), int(c_s)
-        if r < 0 or r >= self.size or c < 0 or c >= self.size:
+    def apply_action(self, state: HexState, action: str) -> HexState:
+        return self.apply_action_id(state, self.str_to_action(state, action))
+
+    def apply_action_id(self, state: HexState, action_id: int) -> HexState:
+        if not 0 <= action_id < self.size * self.size:
             raise ValueError("Invalid move")
-        if state[r][c] != " ":
+        r, c = divmod(action_id, self.size)
+        if state.board[r][c] != " ":
             raise ValueError("Invalid move")
         piece = self._current_player(state)
-        new_state = [row.copy() for row in state]
-        new_state[r][c] = piece
-        return new_state
+        board = state.board.copy()
+        board[r] = board[r].copy()
+        board[r][c] = piece
 
-    def is_terminal(self, state: List[List[str]]) -> bool:
-        if self.get_winner(state) is not None:
+        groups = state.groups.fork()
+        node = r * self.width + c
+        for dr, dc in self.dirs:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < self.size and 0 <= nc < self.size and board[nr][nc] == piece:
+                groups.union(node, nr * self.width + nc)
+        n = self.size - 1
+        winner = state.winner
+        if piece == "X":
+            if c == 0:
+                groups.union(node, self.left)
+            if c == n:
+                groups.union(node, self.right)
+            if winner is None and groups.find(self.left) == groups.find(self.right):
+                winner = 0
+        else:
+            if r == 0:
+                groups.union(node, self.top)
+            if r == n:
+                groups.union(node, self.bottom)
+            if winner is None and groups.find(self.top) == groups.find(self.bottom):
+                winner = 1
+        key = state.key ^ self.zobrist[r * self.size + c][0 if piece == "X" else 1]
+        return HexState(board, groups, state.moves + 1, winner, key)
+
+    def is_terminal(self, state: HexState) -> bool:
+        if state.winner is not None:
             return True
-        return all(cell != " " for row in state for cell in row)
+        return state.moves == self.size * self.size
 
-    def get_winner(self, state: List[List[str]]) -> int | None:
-        if self._has_path(state, "X"):
-            return 0
-        if self._has_path(state, "O"):
-            return 1
-        return None
+    def get_winner(self, state: HexState) -> int | None:
+        return state.winner
 
-    def render(self, state: List[List[str]]) -> str:
+    def current_player(self, state: HexState) -> int:
+        return state.moves % 2
+
+    def render(self, state: HexState) -> str:
         rows = []
         indent = ""
         for r in range(self.size):
-            rows.append(indent + " ".join(state[r]))
+            rows.append(indent + " ".join(state.board[r]))
             indent += " "
         board = "\n".join(rows)
         return f"```\n{board}\n```"
 
-    def _current_player(self, state: List[List[str]]) -> str:
-        flat = [cell for row in state for cell in row]
-        x_count = flat.count("X")
-        o_count = flat.count("O")
-        return "X" if x_count == o_count else "O"
+    def state_key(self, state: HexState) -> int:
+        return state.key
+
+    def canonical_state(self, state: HexState) -> Tuple[int, int]:
+        n = self.size
+        pieces = (
+            (r * n + c, 0 if cell == "X" else 1)
+            for r, row in enumerate(state.board)
+            for c, cell in enumerate(row)
+            if cell != " "
+        )
+        return canonical_key(pieces, self.symmetry_keys)
+
+    def to_canonical_action(self, state: HexState, action_id: int, transform: int) -> int:
+        return self.size * self.size - 1 - action_id if transform else action_id
 
-    def _has_path(self, state: List[List[str]], piece: str) -> bool:
-        from collections import deque
+    def from_canonical_action(self, state: HexState, action_id: int, transform: int) -> int:
+        return self.size * self.size - 1 - action_id if transform else action_id
 
+    def num_actions(self) -> int:
+        return self.size * self.size
+
+    def legal_action_ids(self, state: HexState) -> List[int]:
         n = self.size
-        visited = set()
-        queue = deque()
-        if piece == "X":
-            for r in range(n):
-                if state[r][0] == piece:
-                    queue.append((r, 0))
-                    visited.add((r, 0))
-            goal = lambda r, c: c == n - 1
-        else:
-            for c in range(n):
-                if state[0][c] == piece:
-                    queue.append((0, c))
-                    visited.add((0, c))
-            goal = lambda r, c: r == n - 1
-        while queue:
-            r, c = queue.popleft()
-            if goal(r, c):
-                return True
-            for dr, dc in self.dirs:
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < n and 0 <= nc < n and (nr, nc) not in visited and state[nr][nc] == piece:
-                    visited.add((nr, nc))
-                    queue.append((nr, nc))
-        return False
+        return [r * n + c for r in range(n) for c in range(n) if state.board[r][c] == " "]
+
+    def action_to_str(self, state: HexState, action_id: int) -> str:
+        return f"{action_id // self.size},{action_id % self.size}"
+
+    def str_to_action(self, state: HexState, action: str) -> int:
+        r_s, c_s = action.split(",")
+        r, c = int(r_s), int(c_s)
+        if r < 0 or r >= self.size or c < 0 or c >= self.size:
+            raise ValueError("Invalid move")
+        return r * self.size + c
+
+    def _current_player(self, state: HexState) -> str:
+        return "X" if state.moves % 2 == 0 else "O"
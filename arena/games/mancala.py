@@ -18,8 +18,10 @@ class Mancala(Game):
         return [str(i) for i in range(6) if board[offset + i] > 0]
 
     def apply_action(self, state: Tuple[List[int], int], action: str) -> Tuple[List[int], int]:
+        return self.apply_action_id(state, self.str_to_action(state, action))
+
+    def apply_action_id(self, state: Tuple[List[int], int], pit: int) -> Tuple[List[int], int]:
         board, player = state
-        pit = int(action)
         if pit < 0 or pit >= 6:
             raise ValueError("Invalid pit index")
         idx = pit if player == 0 else 7 + pit
@@ -71,6 +73,23 @@ class Mancala(Game):
             return 1
         return None
 
+    def current_player(self, state: Tuple[List[int], int]) -> int:
+        return state[1]
+
+    def num_actions(self) -> int:
+        return 6
+
+    def legal_action_ids(self, state: Tuple[List[int], int]) -> List[int]:
+        board, player = state
+        offset = 0 if player == 0 else 7
+        return [i for i in range(6) if board[offset + i] > 0]
+
+    def action_to_str(self, state: Tuple[List[int], int], action_id: int) -> str:
+        return str(action_id)
+
+    def str_to_action(self, state: Tuple[List[int], int], action: str) -> int:
+        return int(action)
+
     def render(self, state: Tuple[List[int], int]) -> str:
         board, _ = state
         top = " ".join(str(board[i]) for i in range(12, 6, -1))
@@ -1,176 +1,295 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from dataclasses import dataclass, field
+from typing import Any, List, Tuple
 
 from ..base import Game
+from ..hashing import zobrist_table
+
+_PIECES = "PNBRQKpnbrqk"
+_ZOBRIST = zobrist_table(36, len(_PIECES), "mini_chess")
+_SIDE_KEY = zobrist_table(1, 1, "mini_chess:side")[0][0]
+
+_ROWS = _COLS = 6
+_SQUARES = _ROWS * _COLS
+_START = "rnqknr" + "p" * 6 + " " * 12 + "P" * 6 + "RNQKNR"
+
+# Move tables --------------------------------------------------------
+#
+# Squares are numbered ``r * 6 + c`` with row 0 black's back rank.  Every
+# table lists targets in the order the original per-piece generators used,
+# so move lists (and seeded games) are unchanged.
+
+_PAWN, _KNIGHT, _ROOK, _QUEEN, _KING, _INERT = range(6)
+_KIND = {"P": _PAWN, "N": _KNIGHT, "R": _ROOK, "Q": _QUEEN, "K": _KING, "B": _INERT}
+_KIND.update({p.lower(): kind for p, kind in _KIND.items()})
+
+_KNIGHT_DELTAS = [(2, 1), (1, 2), (-1, 2), (-2, 1), (-2, -1), (-1, -2), (1, -2), (2, -1)]
+_KING_DELTAS = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc]
+# Rook directions first, so a rook uses the first four rays of a queen.
+_RAY_DELTAS = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+
+def _on_board(r: int, c: int) -> bool:
+    return 0 <= r < _ROWS and 0 <= c < _COLS
+
+
+def _steps(deltas: List[Tuple[int, int]]) -> List[Tuple[int, ...]]:
+    return [
+        tuple((r + dr) * _COLS + c + dc for dr, dc in deltas if _on_board(r + dr, c + dc))
+        for r in range(_ROWS)
+        for c in range(_COLS)
+    ]
+
+
+def _rays(r: int, c: int) -> Tuple[Tuple[int, ...], ...]:
+    rays = []
+    for dr, dc in _RAY_DELTAS:
+        ray = []
+        nr, nc = r + dr, c + dc
+        while _on_board(nr, nc):
+            ray.append(nr * _COLS + nc)
+            nr += dr
+            nc += dc
+        rays.append(tuple(ray))
+    return tuple(rays)
+
+
+def _pawn_tables(dr: int) -> Tuple[List[int], List[Tuple[int, ...]]]:
+    pushes, captures = [], []
+    for r in range(_ROWS):
+        for c in range(_COLS):
+            pushes.append((r + dr) * _COLS + c if _on_board(r + dr, c) else -1)
+            captures.append(tuple((r + dr) * _COLS + c + dc for dc in (-1, 1) if _on_board(r + dr, c + dc)))
+    return pushes, captures
+
+
+_KNIGHT_TARGETS = _steps(_KNIGHT_DELTAS)
+_KING_TARGETS = _steps(_KING_DELTAS)
+_RAYS = [_rays(r, c) for r in range(_ROWS) for c in range(_COLS)]
+_PAWN_PUSHES, _PAWN_CAPTURES = zip(_pawn_tables(-1), _pawn_tables(1))  # indexed by side
+
+
+def _coord(square: int) -> str:
+    r, c = divmod(square, _COLS)
+    return f"{chr(ord('a') + c)}{_ROWS - r}"
+
+
+# Action ids are from_square * 36 + to_square.
+_ACTION_NAMES = [_coord(src) + _coord(dst) for src in range(_SQUARES) for dst in range(_SQUARES)]
+_ACTION_IDS = {name: i for i, name in enumerate(_ACTION_NAMES)}
+
+
+@dataclass(slots=True)
+class MiniChessState:
+    """Position as 36 squares plus incrementally maintained derived data.
+
+    ``white`` and ``black`` are occupancy bitboards (bit ``i`` is square
+    ``i``), which double as the piece lists, and ``kings`` marks the squares
+    holding a king.  For compatibility with code written against the older
+    dict states, ``state["board"]`` and ``state["turn"]`` read and replace
+    the position.  The board read that way is a tuple of row tuples: edit
+    it by assigning a whole new board.
+    """
+
+    squares: List[str]
+    turn: int  # 0 for white, 1 for black
+    white: int = field(default=0, compare=False)
+    black: int = field(default=0, compare=False)
+    kings: int = field(default=0, compare=False)
+    key: int = field(default=0, compare=False)  # Zobrist key, updated incrementally
+    moves: List[int] | None = field(default=None, repr=False, compare=False)  # legal ids, filled in lazily
+    undo: List[tuple] | None = field(default=None, repr=False, compare=False)  # see Game.push
+
+    @classmethod
+    def from_squares(cls, squares: List[str], turn: int) -> "MiniChessState":
+        state = cls(list(squares), turn)
+        state._refresh()
+        return state
+
+    def __getitem__(self, name: str) -> Any:
+        if name == "board":
+            return tuple(tuple(self.squares[r * _COLS : (r + 1) * _COLS]) for r in range(_ROWS))
+        if name == "turn":
+            return "white" if self.turn == 0 else "black"
+        raise KeyError(name)
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        if name == "board":
+            self.squares = [piece for row in value for piece in row]
+        elif name == "turn":
+            self.turn = 0 if value == "white" else 1
+        else:
+            raise KeyError(name)
+        self._refresh()
+
+    def _refresh(self) -> None:
+        self.white = self.black = self.kings = 0
+        self.key = _SIDE_KEY if self.turn else 0
+        for square, piece in enumerate(self.squares):
+            if piece == " ":
+                continue
+            if piece.isupper():
+                self.white |= 1 << square
+            else:
+                self.black |= 1 << square
+            if piece in "Kk":
+                self.kings |= 1 << square
+            self.key ^= _ZOBRIST[square][_PIECES.index(piece)]
+        self.moves = None
+        self.undo = None
 
 
 class MiniChess(Game):
     """6x6 chess variant based on Los Alamos chess."""
 
     def __init__(self):
-        self.rows = 6
-        self.cols = 6
-
-    def reset(self) -> Dict[str, Any]:
-        board = [
-            ["r", "n", "q", "k", "n", "r"],
-            ["p"] * self.cols,
-            [" "] * self.cols,
-            [" "] * self.cols,
-            ["P"] * self.cols,
-            ["R", "N", "Q", "K", "N", "R"],
-        ]
-        return {"board": board, "turn": "white"}
-
-    def valid_actions(self, state: Dict[str, Any]) -> List[str]:
-        board = state["board"]
-        turn = state["turn"]
-        actions: List[str] = []
-        for r in range(self.rows):
-            for c in range(self.cols):
-                piece = board[r][c]
-                if piece == " ":
-                    continue
-                if turn == "white" and piece.isupper():
-                    actions.extend(self._piece_moves(board, r, c, piece, True))
-                elif turn == "black" and piece.islower():
-                    actions.extend(self._piece_moves(board, r, c, piece, False))
-        return actions
-
-    def apply_action(self, state: Dict[str, Any], action: str) -> Dict[str, Any]:
-        if action not in self.valid_actions(state):
+        self.rows = _ROWS
+        self.cols = _COLS
+
+    def reset(self) -> MiniChessState:
+        return MiniChessState.from_squares(list(_START), 0)
+
+    def valid_actions(self, state: MiniChessState) -> List[str]:
+        return [_ACTION_NAMES[action_id] for action_id in self._moves(state)]
+
+    def apply_action(self, state: MiniChessState, action: str) -> MiniChessState:
+        return self.apply_action_id(state, self.str_to_action(state, action))
+
+    def apply_action_id(self, state: MiniChessState, action_id: int) -> MiniChessState:
+        if action_id not in self._moves(state):
             raise ValueError("Invalid move")
-        board = [row.copy() for row in state["board"]]
-        sr, sc = self._parse_coord(action[:2])
-        dr, dc = self._parse_coord(action[2:])
-        piece = board[sr][sc]
-        board[sr][sc] = " "
-        board[dr][dc] = piece
-        turn = "black" if state["turn"] == "white" else "white"
-        return {"board": board, "turn": turn}
-
-    def is_terminal(self, state: Dict[str, Any]) -> bool:
-        return self.get_winner(state) is not None or not self.valid_actions(state)
-
-    def get_winner(self, state: Dict[str, Any]) -> int | None:
-        flat = sum(state["board"], [])
-        if "K" not in flat:
+        child = MiniChessState(state.squares.copy(), state.turn, state.white, state.black, state.kings, state.key)
+        self._play(child, action_id)
+        return child
+
+    def push(self, state: MiniChessState, action: str) -> None:
+        action_id = self.str_to_action(state, action)
+        if action_id not in self._moves(state):
+            raise ValueError("Invalid move")
+        record = (action_id, state.squares[action_id % _SQUARES], state.white, state.black, state.kings, state.key, state.moves)
+        self._play(state, action_id)
+        if state.undo is None:
+            state.undo = []
+        state.undo.append(record)
+
+    def pop(self, state: MiniChessState) -> None:
+        if not state.undo:
+            raise ValueError("No move to undo")
+        action_id, captured, state.white, state.black, state.kings, state.key, state.moves = state.undo.pop()
+        if not state.undo:
+            state.undo = None
+        src, dst = divmod(action_id, _SQUARES)
+        state.squares[src] = state.squares[dst]
+        state.squares[dst] = captured
+        state.turn = 1 - state.turn
+
+    def is_terminal(self, state: MiniChessState) -> bool:
+        return self.get_winner(state) is not None or not self._moves(state)
+
+    def get_winner(self, state: MiniChessState) -> int | None:
+        if not state.kings & state.white:
             return 1
-        if "k" not in flat:
+        if not state.kings & state.black:
             return 0
         return None
 
-    def render(self, state: Dict[str, Any]) -> str:
-        board = state["board"]
+    def current_player(self, state: MiniChessState) -> int:
+        return state.turn
+
+    def render(self, state: MiniChessState) -> str:
+        squares = state.squares
         rows = []
         for r in range(self.rows - 1, -1, -1):
-            rows.append("|".join(board[r]))
+            rows.append("|".join(squares[r * _COLS : (r + 1) * _COLS]))
         board_str = "\n".join(rows)
         return f"Turn: {state['turn']}\n```\n{board_str}\n```"
 
+    def state_key(self, state: MiniChessState) -> int:
+        return state.key
+
+    def num_actions(self) -> int:
+        return _SQUARES * _SQUARES
+
+    def legal_action_ids(self, state: MiniChessState) -> List[int]:
+        return list(self._moves(state))
+
+    def action_to_str(self, state: MiniChessState, action_id: int) -> str:
+        return _ACTION_NAMES[action_id]
+
+    def str_to_action(self, state: MiniChessState, action: str) -> int:
+        action_id = _ACTION_IDS.get(action)
+        if action_id is None:
+            raise ValueError("Invalid move")
+        return action_id
+
     # internal helpers -------------------------------------------------
 
-    def _parse_coord(self, coord: str) -> Tuple[int, int]:
-        col = ord(coord[0]) - ord("a")
-        row = self.rows - int(coord[1])
-        return row, col
-
-    def _format_coord(self, r: int, c: int) -> str:
-        return f"{chr(ord('a') + c)}{self.rows - r}"
-
-    def _piece_moves(
-        self, board: List[List[str]], r: int, c: int, piece: str, white: bool
-    ) -> List[str]:
-        moves: List[str] = []
-        if piece.upper() == "P":
-            moves.extend(self._pawn_moves(board, r, c, white))
-        elif piece.upper() == "R":
-            moves.extend(self._linear_moves(board, r, c, white, directions=[(1,0),(-1,0),(0,1),(0,-1)]))
-        elif piece.upper() == "N":
-            moves.extend(self._knight_moves(board, r, c, white))
-        elif piece.upper() == "Q":
-            moves.extend(self._linear_moves(board, r, c, white, directions=[(1,0),(-1,0),(0,1),(0,-1),(1,1),(1,-1),(-1,1),(-1,-1)]))
-        elif piece.upper() == "K":
-            moves.extend(self._king_moves(board, r, c, white))
-        return [self._format_coord(r, c) + self._format_coord(dr, dc) for dr, dc in moves]
-
-    def _in_bounds(self, r: int, c: int) -> bool:
-        return 0 <= r < self.rows and 0 <= c < self.cols
-
-    def _is_enemy(self, board: List[List[str]], r: int, c: int, white: bool) -> bool:
-        piece = board[r][c]
-        if piece == " ":
-            return False
-        return piece.islower() if white else piece.isupper()
-
-    def _is_empty(self, board: List[List[str]], r: int, c: int) -> bool:
-        return board[r][c] == " "
-
-    def _pawn_moves(self, board: List[List[str]], r: int, c: int, white: bool) -> List[Tuple[int, int]]:
-        moves = []
-        dr = -1 if white else 1
-        nr = r + dr
-        if self._in_bounds(nr, c) and self._is_empty(board, nr, c):
-            moves.append((nr, c))
-        for dc in (-1, 1):
-            nc = c + dc
-            if self._in_bounds(nr, nc) and self._is_enemy(board, nr, nc, white):
-                moves.append((nr, nc))
-        return moves
+    def _play(self, state: MiniChessState, action_id: int) -> None:
+        """Make the move ``action_id`` on ``state`` in place."""
+        src, dst = divmod(action_id, _SQUARES)
+        squares = state.squares
+        piece = squares[src]
+        captured = squares[dst]
+        squares[src] = " "
+        squares[dst] = piece
+        src_bit, dst_bit = 1 << src, 1 << dst
+        key = state.key ^ _SIDE_KEY ^ _ZOBRIST[src][_PIECES.index(piece)] ^ _ZOBRIST[dst][_PIECES.index(piece)]
+        if captured != " ":
+            key ^= _ZOBRIST[dst][_PIECES.index(captured)]
+            state.kings &= ~dst_bit
+        if state.turn == 0:
+            state.white ^= src_bit | dst_bit
+            state.black &= ~dst_bit
+        else:
+            state.black ^= src_bit | dst_bit
+            state.white &= ~dst_bit
+        if state.kings & src_bit:
+            state.kings ^= src_bit | dst_bit
+        state.key = key
+        state.turn = 1 - state.turn
+        state.moves = None
 
-    def _linear_moves(
-        self,
-        board: List[List[str]],
-        r: int,
-        c: int,
-        white: bool,
-        directions: List[Tuple[int, int]],
-    ) -> List[Tuple[int, int]]:
-        moves = []
-        for dr, dc in directions:
-            nr, nc = r + dr, c + dc
-            while self._in_bounds(nr, nc):
-                if self._is_empty(board, nr, nc):
-                    moves.append((nr, nc))
-                elif self._is_enemy(board, nr, nc, white):
-                    moves.append((nr, nc))
-                    break
-                else:
-                    break
-                nr += dr
-                nc += dc
+    def _moves(self, state: MiniChessState) -> List[int]:
+        moves = state.moves
+        if moves is None:
+            moves = state.moves = self._generate(state)
         return moves
 
-    def _knight_moves(self, board: List[List[str]], r: int, c: int, white: bool) -> List[Tuple[int, int]]:
-        deltas = [
-            (2, 1),
-            (1, 2),
-            (-1, 2),
-            (-2, 1),
-            (-2, -1),
-            (-1, -2),
-            (1, -2),
-            (2, -1),
-        ]
-        moves = []
-        for dr, dc in deltas:
-            nr, nc = r + dr, c + dc
-            if self._in_bounds(nr, nc) and (
-                self._is_empty(board, nr, nc) or self._is_enemy(board, nr, nc, white)
-            ):
-                moves.append((nr, nc))
+    def _generate(self, state: MiniChessState) -> List[int]:
+        side = state.turn
+        own, enemy = (state.white, state.black) if side == 0 else (state.black, state.white)
+        occupied = own | enemy
+        squares = state.squares
+        pushes, captures = _PAWN_PUSHES[side], _PAWN_CAPTURES[side]
+        moves: List[int] = []
+        append = moves.append
+        pieces = own
+        while pieces:
+            low = pieces & -pieces
+            pieces ^= low
+            src = low.bit_length() - 1
+            base = src * _SQUARES
+            kind = _KIND[squares[src]]
+            if kind == _PAWN:
+                dst = pushes[src]
+                if dst >= 0 and not occupied >> dst & 1:
+                    append(base + dst)
+                for dst in captures[src]:
+                    if enemy >> dst & 1:
+                        append(base + dst)
+            elif kind == _KNIGHT or kind == _KING:
+                for dst in (_KNIGHT_TARGETS if kind == _KNIGHT else _KING_TARGETS)[src]:
+                    if not own >> dst & 1:
+                        append(base + dst)
+            elif kind != _INERT:
+                rays = _RAYS[src] if kind == _QUEEN else _RAYS[src][:4]
+                for ray in rays:
+                    for dst in ray:
+                        if own >> dst & 1:
+                            break
+                        append(base + dst)
+                        if enemy >> dst & 1:
+                            break
         return moves
 
-    def _king_moves(self, board: List[List[str]], r: int, c: int, white: bool) -> List[Tuple[int, int]]:
-        moves = []
-        for dr in (-1, 0, 1):
-            for dc in (-1, 0, 1):
-                if dr == 0 and dc == 0:
-                    continue
-                nr, nc = r + dr, c + dc
-                if not self._in_bounds(nr, nc):
-                    continue
-                if self._is_empty(board, nr, nc) or self._is_enemy(board, nr, nc, white):
-                    moves.append((nr, nc))
-        return moves
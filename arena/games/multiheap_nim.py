@@ -1,12 +1,31 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import List
 
 from ..base import Game
 
 
+@dataclass(slots=True)
+class MultiHeapNimState:
+    """Heap sizes and the player to move.
+
+    ``state[i]`` and ``len(state)`` read the heaps as in the older plain-list
+    states.
+    """
+
+    heaps: List[int]
+    player: int = 0
+
+    def __getitem__(self, i: int) -> int:
+        return self.heaps[i]
+
+    def __len__(self) -> int:
+        return len(self.heaps)
+
+
 class MultiHeapNim(Game):
-    """Nim variant with multiple heaps."""
+    """Nim variant with multiple heaps; whoever takes the last stick wins."""
 
     def __init__(self, heaps: List[int] | None = None, max_take: int | None = 3):
         if heaps is None:
@@ -14,13 +33,15 @@ class MultiHeapNim(Game):
         self.initial_heaps = list(heaps)
         self.max_take = max_take
         self.total = sum(heaps)
+        # Largest single take; action ids are heap * take_limit + take - 1.
+        self.take_limit = max([*heaps, 1]) if max_take is None else max_take
 
-    def reset(self) -> List[int]:
-        return self.initial_heaps.copy()
+    def reset(self) -> MultiHeapNimState:
+        return MultiHeapNimState(self.initial_heaps.copy())
 
-    def valid_actions(self, state: List[int]) -> List[str]:
+    def valid_actions(self, state: MultiHeapNimState) -> List[str]:
         actions: List[str] = []
-        for i, heap in enumerate(state):
+        for i, heap in enumerate(state.heaps):
             if heap == 0:
                 continue
             limit = heap if self.max_take is None else min(self.max_take, heap)
@@ -28,34 +49,71 @@ class MultiHeapNim(Game):
                 actions.append(f"{i},{t}")
         return actions
 
-    def apply_action(self, state: List[int], action: str) -> List[int]:
+    def apply_action(self, state: MultiHeapNimState, action: str) -> MultiHeapNimState:
         try:
             heap_idx_str, take_str = action.split(",")
             heap_idx = int(heap_idx_str)
             take = int(take_str)
         except ValueError as exc:
             raise ValueError("Invalid action format") from exc
-        if heap_idx < 0 or heap_idx >= len(state):
+        return self._take(state, heap_idx, take)
+
+    def apply_action_id(self, state: MultiHeapNimState, action_id: int) -> MultiHeapNimState:
+        if action_id < 0:
+            raise ValueError("Invalid heap index")
+        heap_idx, take = divmod(action_id, self.take_limit)
+        return self._take(state, heap_idx, take + 1)
+
+    def _take(self, state: MultiHeapNimState, heap_idx: int, take: int) -> MultiHeapNimState:
+        if heap_idx < 0 or heap_idx >= len(state.heaps):
             raise ValueError("Invalid heap index")
-        heap = state[heap_idx]
+        heap = state.heaps[heap_idx]
         if take < 1 or take > heap:
             raise ValueError("Invalid number to take")
         if self.max_take is not None and take > self.max_take:
             raise ValueError("Invalid number to take")
-        new_state = state.copy()
-        new_state[heap_idx] -= take
-        return new_state
+        heaps = state.heaps.copy()
+        heaps[heap_idx] -= take
+        return MultiHeapNimState(heaps, 1 - state.player)
 
-    def is_terminal(self, state: List[int]) -> bool:
-        return all(h == 0 for h in state)
+    def is_terminal(self, state: MultiHeapNimState) -> bool:
+        return not any(state.heaps)
 
-    def get_winner(self, state: List[int]) -> int | None:
+    def get_winner(self, state: MultiHeapNimState) -> int | None:
         if not self.is_terminal(state):
             return None
-        moves_made = self.total - sum(state)
-        return (moves_made - 1) % 2
+        # The player who made the last move took the last stick.
+        return 1 - state.player
+
+    def current_player(self, state: MultiHeapNimState) -> int:
+        return state.player
+
+    def num_actions(self) -> int:
+        return len(self.initial_heaps) * self.take_limit
+
+    def legal_action_ids(self, state: MultiHeapNimState) -> List[int]:
+        ids: List[int] = []
+        for i, heap in enumerate(state.heaps):
+            limit = min(self.take_limit, heap)
+            ids.extend(range(i * self.take_limit, i * self.take_limit + limit))
+        return ids
+
+    def action_to_str(self, state: MultiHeapNimState, action_id: int) -> str:
+        heap_idx, take = divmod(action_id, self.take_limit)
+        return f"{heap_idx},{take + 1}"
+
+    def str_to_action(self, state: MultiHeapNimState, action: str) -> int:
+        try:
+            heap_idx_str, take_str = action.split(",")
+            heap_idx = int(heap_idx_str)
+            take = int(take_str)
+        except ValueError as exc:
+            raise ValueError("Invalid action format") from exc
+        if not 1 <= take <= self.take_limit:
+            raise ValueError("Invalid number to take")
+        return heap_idx * self.take_limit + take - 1
 
-    def render(self, state: List[int]) -> str:
-        lines = [f"{i}: {'|' * heap}" for i, heap in enumerate(state)]
+    def render(self, state: MultiHeapNimState) -> str:
+        lines = [f"{i}: {'|' * heap}" for i, heap in enumerate(state.heaps)]
         board = "\n".join(lines)
         return f"```\n{board}\n```"
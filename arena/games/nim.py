@@ -1,38 +1,65 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Tuple
 
 from ..base import Game
 
 
 class Nim(Game):
-    """Simple impartial game of Nim with a single heap."""
+    """Simple impartial game of Nim with a single heap.
+
+    The state is ``(remaining, player_to_move)``; whoever takes the last
+    stick wins.
+    """
 
     def __init__(self, total: int = 12, max_take: int = 3):
         self.total = total
         self.max_take = max_take
 
-    def reset(self) -> int:
-        return self.total
+    def reset(self) -> Tuple[int, int]:
+        return self.total, 0
+
+    def valid_actions(self, state: Tuple[int, int]) -> List[str]:
+        remaining, _ = state
+        return [str(i) for i in range(1, min(self.max_take, remaining) + 1)]
 
-    def valid_actions(self, state: int) -> List[str]:
-        return [str(i) for i in range(1, min(self.max_take, state) + 1)]
+    def apply_action(self, state: Tuple[int, int], action: str) -> Tuple[int, int]:
+        return self.apply_action_id(state, self.str_to_action(state, action))
 
-    def apply_action(self, state: int, action: str) -> int:
-        take = int(action)
-        if take < 1 or take > self.max_take or take > state:
+    def apply_action_id(self, state: Tuple[int, int], action_id: int) -> Tuple[int, int]:
+        remaining, player = state
+        take = action_id + 1
+        if take < 1 or take > self.max_take or take > remaining:
             raise ValueError("Invalid move")
-        return state - take
+        return remaining - take, 1 - player
 
-    def is_terminal(self, state: int) -> bool:
-        return state == 0
+    def is_terminal(self, state: Tuple[int, int]) -> bool:
+        return state[0] == 0
 
-    def get_winner(self, state: int) -> int | None:
-        if state != 0:
+    def get_winner(self, state: Tuple[int, int]) -> int | None:
+        remaining, player = state
+        if remaining != 0:
             return None
-        moves_made = self.total - state
-        return (moves_made - 1) % 2
+        return 1 - player
+
+    def current_player(self, state: Tuple[int, int]) -> int:
+        return state[1]
+
+    # Action id k takes k + 1 sticks.
+
+    def num_actions(self) -> int:
+        return self.max_take
+
+    def legal_action_ids(self, state: Tuple[int, int]) -> List[int]:
+        return list(range(min(self.max_take, state[0])))
+
+    def action_to_str(self, state: Tuple[int, int], action_id: int) -> str:
+        return str(action_id + 1)
+
+    def str_to_action(self, state: Tuple[int, int], action: str) -> int:
+        return int(action) - 1
 
-    def render(self, state: int) -> str:
-        sticks = "|" * state
-        return f"Remaining: {state}\n```\n{sticks}\n```"
+    def render(self, state: Tuple[int, int]) -> str:
+        remaining, _ = state
+        sticks = "|" * remaining
+        return f"Remaining: {remaining}\n```\n{sticks}\n```"
@@ -1,103 +1,251 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from dataclasses import dataclass, field
+from typing import Iterator, List, Tuple
 
 from ..base import Game
+from ..hashing import canonical_key, grid_symmetries, inverse_permutations, symmetry_table, zobrist_table
+
+
+@dataclass(slots=True)
+class OthelloState:
+    """Bitboard position; square ``(r, c)`` is bit ``r * size + c``."""
+
+    x: int  # discs of player 0
+    o: int  # discs of player 1
+    player: int  # side to move
+    key: int = 0  # Zobrist key, updated incrementally
+    # Legal-move bitmasks, filled in lazily and shared by every query on this state.
+    moves: int | None = field(default=None, repr=False, compare=False)
+    opponent_moves: int | None = field(default=None, repr=False, compare=False)
+    undo: List[tuple] | None = field(default=None, repr=False, compare=False)  # see Game.push
 
 
 class Othello(Game):
     """Othello/Reversi implementation for two players."""
 
     def __init__(self, size: int = 8):
+        if size < 2 or size % 2:
+            raise ValueError("Board size must be a positive even number")
         self.size = size
+        n = size
+        self.full = (1 << (n * n)) - 1
+        first_col = sum(1 << (r * n) for r in range(n))
+        last_col = first_col << (n - 1)
+        # (shift, mask of squares a one-step shift may land on) per direction;
+        # the mask stops rays from wrapping between board edges.
+        self.rays: Tuple[Tuple[int, int], ...] = tuple(
+            (dr * n + dc, self.full & ~(first_col if dc == 1 else last_col if dc == -1 else 0))
+            for dr, dc in self._directions()
+        )
+        steps = []
+        step = 1
+        while step < n:
+            steps.append(step)
+            step *= 2
+        self.fill_steps = tuple(steps)
+        self.zobrist = zobrist_table(n * n, 2, f"othello:{n}")
+        self.side_key = zobrist_table(1, 1, f"othello:{n}:side")[0][0]
+        # The rules are unchanged by every rotation and reflection of the board.
+        self.symmetries = grid_symmetries(n, n)
+        self.inverses = inverse_permutations(self.symmetries)
+        self.symmetry_keys = symmetry_table(self.zobrist, self.symmetries)
 
-    def reset(self) -> Dict[str, Any]:
-        board = [[" "] * self.size for _ in range(self.size)]
-        mid = self.size // 2 - 1
-        board[mid][mid] = "O"
-        board[mid + 1][mid + 1] = "O"
-        board[mid][mid + 1] = "X"
-        board[mid + 1][mid] = "X"
-        return {"board": board, "player": "X"}
-
-    def valid_actions(self, state: Dict[str, Any]) -> List[str]:
-        board = state["board"]
-        player = state["player"]
-        actions = self._valid_actions_for_player(board, player)
-        if actions:
-            return [f"{r},{c}" for r, c in actions]
-        return ["pass"]
-
-    def apply_action(self, state: Dict[str, Any], action: str) -> Dict[str, Any]:
-        board = state["board"]
-        player = state["player"]
-        opponent = "O" if player == "X" else "X"
-        new_board = [row.copy() for row in board]
+    def reset(self) -> OthelloState:
+        n = self.size
+        mid = n // 2 - 1
+        o = (1 << (mid * n + mid)) | (1 << ((mid + 1) * n + mid + 1))
+        x = (1 << (mid * n + mid + 1)) | (1 << ((mid + 1) * n + mid))
+        return self.from_bitboards(x, o, 0)
 
-        if action == "pass":
-            return {"board": new_board, "player": opponent}
+    def from_bitboards(self, x: int, o: int, player: int) -> OthelloState:
+        """Build the position with discs ``x`` and ``o`` and ``player`` to move."""
+        state = OthelloState(x, o, player)
+        state.key = self._compute_key(state)
+        return state
 
-        r, c = map(int, action.split(","))
-        if (r, c) not in self._valid_actions_for_player(board, player):
-            raise ValueError("Invalid move")
+    def valid_actions(self, state: OthelloState) -> List[str]:
+        moves = self._moves(state)
+        if not moves:
+            return ["pass"]
+        n = self.size
+        actions = []
+        while moves:
+            low = moves & -moves
+            idx = low.bit_length() - 1
+            actions.append(f"{idx // n},{idx % n}")
+            moves ^= low
+        return actions
+
+    def apply_action(self, state: OthelloState, action: str) -> OthelloState:
+        return self.apply_action_id(state, self.str_to_action(state, action))
+
+    def is_terminal(self, state: OthelloState) -> bool:
+        if (state.x | state.o) == self.full:
+            return True
+        return not self._moves(state) and not self._opponent_moves(state)
 
-        new_board[r][c] = player
-        for dr, dc in self._directions():
-            flips: List[Tuple[int, int]] = []
-            rr, cc = r + dr, c + dc
-            while 0 <= rr < self.size and 0 <= cc < self.size and new_board[rr][cc] == opponent:
-                flips.append((rr, cc))
-                rr += dr
-                cc += dc
-            if flips and 0 <= rr < self.size and 0 <= cc < self.size and new_board[rr][cc] == player:
-                for fr, fc in flips:
-                    new_board[fr][fc] = player
-        return {"board": new_board, "player": opponent}
-
-    def is_terminal(self, state: Dict[str, Any]) -> bool:
-        board = state["board"]
-        current = state["player"]
-        opponent = "O" if current == "X" else "X"
-        full = all(cell != " " for row in board for cell in row)
-        no_moves = not self._valid_actions_for_player(board, current) and not self._valid_actions_for_player(board, opponent)
-        return full or no_moves
-
-    def get_winner(self, state: Dict[str, Any]) -> int | None:
-        board = state["board"]
-        x_count = sum(row.count("X") for row in board)
-        o_count = sum(row.count("O") for row in board)
+    def get_winner(self, state: OthelloState) -> int | None:
+        x_count = state.x.bit_count()
+        o_count = state.o.bit_count()
         if x_count == o_count:
             return None
         return 0 if x_count > o_count else 1
 
-    def render(self, state: Dict[str, Any]) -> str:
-        board = state["board"]
-        rows = ["|".join(row) for row in board]
+    def current_player(self, state: OthelloState) -> int:
+        return state.player
+
+    def render(self, state: OthelloState) -> str:
+        n = self.size
+        rows = []
+        for r in range(n):
+            cells = []
+            for c in range(n):
+                bit = 1 << (r * n + c)
+                cells.append("X" if state.x & bit else "O" if state.o & bit else " ")
+            rows.append("|".join(cells))
         board_str = "\n".join(rows)
         return f"```\n{board_str}\n```"
 
-    def _valid_actions_for_player(self, board: List[List[str]], player: str) -> List[Tuple[int, int]]:
-        opponent = "O" if player == "X" else "X"
-        actions: List[Tuple[int, int]] = []
-        for r in range(self.size):
-            for c in range(self.size):
-                if board[r][c] != " ":
-                    continue
-                if self._would_flip(board, r, c, player, opponent):
-                    actions.append((r, c))
-        return actions
+    def state_key(self, state: OthelloState) -> int:
+        return state.key
+
+    def canonical_state(self, state: OthelloState) -> Tuple[int, int]:
+        return canonical_key(self._pieces(state), self.symmetry_keys, self.side_key if state.player else 0)
+
+    def to_canonical_action(self, state: OthelloState, action_id: int, transform: int) -> int:
+        return action_id if action_id == self.size * self.size else self.symmetries[transform][action_id]
+
+    def from_canonical_action(self, state: OthelloState, action_id: int, transform: int) -> int:
+        return action_id if action_id == self.size * self.size else self.inverses[transform][action_id]
+
+    def num_actions(self) -> int:
+        return self.size * self.size + 1
+
+    def legal_action_ids(self, state: OthelloState) -> List[int]:
+        moves = self._moves(state)
+        if not moves:
+            return [self.size * self.size]
+        ids = []
+        while moves:
+            low = moves & -moves
+            ids.append(low.bit_length() - 1)
+            moves ^= low
+        return ids
+
+    def apply_action_id(self, state: OthelloState, action_id: int) -> OthelloState:
+        return OthelloState(*self._successor(state, action_id))
+
+    def push(self, state: OthelloState, action: str) -> None:
+        fields = self._successor(state, self.str_to_action(state, action))
+        if state.undo is None:
+            state.undo = []
+        state.undo.append((state.x, state.o, state.player, state.key, state.moves, state.opponent_moves))
+        state.x, state.o, state.player, state.key, state.moves, state.opponent_moves = fields
+
+    def pop(self, state: OthelloState) -> None:
+        if not state.undo:
+            raise ValueError("No move to undo")
+        state.x, state.o, state.player, state.key, state.moves, state.opponent_moves = state.undo.pop()
+        if not state.undo:
+            state.undo = None
+
+    def _successor(self, state: OthelloState, action_id: int) -> tuple:
+        """Fields of the state after ``action_id``, in ``OthelloState`` order."""
+        n = self.size
+        if action_id == n * n:
+            key = state.key ^ self.side_key
+            return state.x, state.o, 1 - state.player, key, state.opponent_moves, state.moves
+        if not 0 <= action_id < n * n:
+            raise ValueError("Invalid move")
+        square = 1 << action_id
+        if not self._moves(state) & square:
+            raise ValueError("Invalid move")
+
+        own, opp = (state.x, state.o) if state.player == 0 else (state.o, state.x)
+        flips = 0
+        for shift, mask in self.rays:
+            line = self._fill(square, opp & mask, shift)
+            if self._shift(line, shift) & mask & own:
+                flips |= line ^ square
+        own |= square | flips
+        opp &= ~flips
+        player = state.player
+        key = state.key ^ self.side_key ^ self.zobrist[action_id][player]
+        while flips:
+            low = flips & -flips
+            cell = self.zobrist[low.bit_length() - 1]
+            key ^= cell[0] ^ cell[1]
+            flips ^= low
+        if player == 0:
+            return own, opp, 1, key, None, None
+        return opp, own, 0, key, None, None
+
+    def action_to_str(self, state: OthelloState, action_id: int) -> str:
+        n = self.size
+        if action_id == n * n:
+            return "pass"
+        return f"{action_id // n},{action_id % n}"
+
+    def str_to_action(self, state: OthelloState, action: str) -> int:
+        n = self.size
+        if action == "pass":
+            return n * n
+        r, c = map(int, action.split(","))
+        if not (0 <= r < n and 0 <= c < n):
+            raise ValueError("Invalid move")
+        return r * n + c
+
+    def _compute_key(self, state: OthelloState) -> int:
+        key = self.side_key if state.player else 0
+        for square, player in self._pieces(state):
+            key ^= self.zobrist[square][player]
+        return key
+
+    def _pieces(self, state: OthelloState) -> Iterator[Tuple[int, int]]:
+        """``(square, player)`` for every disc."""
+        for player, bits in enumerate((state.x, state.o)):
+            while bits:
+                low = bits & -bits
+                yield low.bit_length() - 1, player
+                bits ^= low
+
+    def _moves(self, state: OthelloState) -> int:
+        if state.moves is None:
+            own, opp = (state.x, state.o) if state.player == 0 else (state.o, state.x)
+            state.moves = self._move_mask(own, opp)
+        return state.moves
+
+    def _opponent_moves(self, state: OthelloState) -> int:
+        if state.opponent_moves is None:
+            own, opp = (state.o, state.x) if state.player == 0 else (state.x, state.o)
+            state.opponent_moves = self._move_mask(own, opp)
+        return state.opponent_moves
+
+    def _move_mask(self, own: int, opp: int) -> int:
+        empty = self.full & ~(own | opp)
+        moves = 0
+        for shift, mask in self.rays:
+            # Rays of opponent discs starting next to one of ours, then one more step.
+            line = self._fill(own, opp & mask, shift) & ~own
+            moves |= self._shift(line, shift) & mask & empty
+        return moves
+
+    def _fill(self, gen: int, pro: int, shift: int) -> int:
+        """Occluded fill: extend ``gen`` along ``shift`` through ``pro`` squares.
+
+        Parallel-prefix (Kogge-Stone) form: after step ``k`` each square of
+        ``pro`` knows whether the ``2**k`` squares behind it are all in ``pro``.
+        """
+        for step in self.fill_steps:
+            gen |= pro & self._shift(gen, shift * step)
+            pro &= self._shift(pro, shift * step)
+        return gen
 
-    def _would_flip(self, board: List[List[str]], r: int, c: int, player: str, opponent: str) -> bool:
-        for dr, dc in self._directions():
-            rr, cc = r + dr, c + dc
-            found_opponent = False
-            while 0 <= rr < self.size and 0 <= cc < self.size and board[rr][cc] == opponent:
-                rr += dr
-                cc += dc
-                found_opponent = True
-            if found_opponent and 0 <= rr < self.size and 0 <= cc < self.size and board[rr][cc] == player:
-                return True
-        return False
+    def _shift(self, bits: int, shift: int) -> int:
+        if shift > 0:
+            return (bits << shift) & self.full
+        return bits >> -shift
 
     def _directions(self) -> List[Tuple[int, int]]:
         return [
@@ -1,8 +1,40 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Set, Tuple
 
 from ..base import Game
+from ..hashing import zobrist_table
+
+# Distance of a cell that cannot reach the goal row.
+UNREACHABLE = -1
+# Wall configurations whose shortest-path data each game keeps.
+_PATHS_CACHE_SIZE = 2048
+
+
+class _Paths:
+    """Shortest-path data for one wall configuration.
+
+    Cached by the game and shared by every state with the same walls; pawn
+    positions do not matter because paths ignore pawns.
+    ``dist[p]`` is player ``p``'s distance to its goal row from every cell.
+    ``cuts[p]`` describes the walls that would disconnect some cells from
+    that goal: a map from each such edge ``(a, b)`` (``a < b``) to the root
+    of the cut-off subtree of a depth-first search from the goal, plus the
+    entry and exit times of that search.  Both are filled in lazily.
+    """
+
+    __slots__ = ("walls", "dist", "cuts")
+
+    def __init__(self, walls: Tuple[FrozenSet[Tuple[int, int]], FrozenSet[Tuple[int, int]]]):
+        self.walls = walls
+        self.dist: List[List[int] | None] = [None, None]
+        self.cuts: List[Tuple[Dict[Tuple[int, int], int], List[int], List[int]] | None] = [None, None]
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Paths) and self.walls == other.walls
+
+    def __repr__(self) -> str:
+        return f"_Paths({len(self.walls[0])} h, {len(self.walls[1])} v)"
 
 
 class Quoridor(Game):
@@ -12,62 +44,91 @@ class Quoridor(Game):
         self.size = size
         self.walls_per_player = walls_per_player
         self.start_positions = [(0, size // 2), (size - 1, size // 2)]
+        self.pawn_keys = zobrist_table(size * size, 2, f"quoridor:{size}:pawns")
+        self.wall_keys = zobrist_table((size - 1) ** 2, 2, f"quoridor:{size}:walls")
+        self.remaining_keys = zobrist_table(walls_per_player + 1, 2, f"quoridor:{size}:remaining")
+        self.side_key = zobrist_table(1, 1, f"quoridor:{size}:side")[0][0]
+        self._paths_cache: Dict[Tuple[FrozenSet, FrozenSet], _Paths] = {}
+
+    # The paths cache is rebuilt on demand rather than copied into each
+    # match or worker process.
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_paths_cache"] = {}
+        return state
 
     def reset(self) -> Dict[str, Any]:
-        return {
+        state = {
             "pos": [self.start_positions[0], self.start_positions[1]],
             "h_walls": set(),
             "v_walls": set(),
             "remaining": [self.walls_per_player, self.walls_per_player],
             "current": 0,
         }
+        state["key"] = self._compute_key(state)
+        return state
 
     def valid_actions(self, state: Dict[str, Any]) -> List[str]:
-        actions: List[str] = []
-        player = state["current"]
-        r, c = state["pos"][player]
-        opponent_pos = state["pos"][1 - player]
-
-        if r > 0 and (r - 1, c) not in state["h_walls"] and opponent_pos != (r - 1, c):
-            actions.append("U")
-        if r < self.size - 1 and (r, c) not in state["h_walls"] and opponent_pos != (r + 1, c):
-            actions.append("D")
-        if c > 0 and (r, c - 1) not in state["v_walls"] and opponent_pos != (r, c - 1):
-            actions.append("L")
-        if c < self.size - 1 and (r, c) not in state["v_walls"] and opponent_pos != (r, c + 1):
-            actions.append("R")
-
-        if state["remaining"][player] > 0:
-            for rr in range(self.size - 1):
-                for cc in range(self.size - 1):
-                    if (rr, cc) not in state["h_walls"]:
-                        actions.append(f"H {rr} {cc}")
-                    if (rr, cc) not in state["v_walls"]:
-                        actions.append(f"V {rr} {cc}")
-        return actions
+        return [self.action_to_str(state, action_id) for action_id in self.legal_action_ids(state)]
 
     def apply_action(self, state: Dict[str, Any], action: str) -> Dict[str, Any]:
-        player = state["current"]
+        return self.apply_action_id(state, self.str_to_action(state, action))
+
+    def apply_action_id(self, state: Dict[str, Any], action_id: int) -> Dict[str, Any]:
         new_state = {
             "pos": state["pos"].copy(),
             "h_walls": state["h_walls"].copy(),
             "v_walls": state["v_walls"].copy(),
             "remaining": state["remaining"].copy(),
-            "current": 1 - player,
+            "current": state["current"],
+            "key": self.state_key(state),
         }
+        self._play(new_state, action_id)
+        return new_state
 
-        parts = action.split()
-        if parts[0] in {"U", "D", "L", "R"}:
+    def push(self, state: Dict[str, Any], action: str) -> None:
+        action_id = self.str_to_action(state, action)
+        record = (action_id, state["pos"][state["current"]], state.get("key"))
+        self._play(state, action_id)
+        state.setdefault("undo", []).append(record)
+
+    def pop(self, state: Dict[str, Any]) -> None:
+        if not state.get("undo"):
+            raise ValueError("No move to undo")
+        action_id, pos, key = state["undo"].pop()
+        if not state["undo"]:
+            del state["undo"]
+        player = 1 - state["current"]
+        state["current"] = player
+        if action_id < 4:
+            state["pos"][player] = pos
+        else:
+            kind, index = divmod(action_id - 4, (self.size - 1) ** 2)
+            state["v_walls" if kind else "h_walls"].remove(divmod(index, self.size - 1))
+            state["remaining"][player] += 1
+        if key is None:
+            state.pop("key", None)
+        else:
+            state["key"] = key
+
+    def _play(self, state: Dict[str, Any], action_id: int) -> None:
+        """Apply ``action_id`` to ``state`` in place."""
+        if not 0 <= action_id < self.num_actions():
+            raise ValueError("Unknown action")
+        player = state["current"]
+
+        if action_id < 4:
             r, c = state["pos"][player]
-            if parts[0] == "U":
+            if action_id == 0:  # "U"
                 nr, nc = r - 1, c
                 if nr < 0 or (r - 1, c) in state["h_walls"]:
                     raise ValueError("Invalid move")
-            elif parts[0] == "D":
+            elif action_id == 1:  # "D"
                 nr, nc = r + 1, c
                 if nr >= self.size or (r, c) in state["h_walls"]:
                     raise ValueError("Invalid move")
-            elif parts[0] == "L":
+            elif action_id == 2:  # "L"
                 nr, nc = r, c - 1
                 if nc < 0 or (r, c - 1) in state["v_walls"]:
                     raise ValueError("Invalid move")
@@ -77,28 +138,34 @@ class Quoridor(Game):
                     raise ValueError("Invalid move")
             if (nr, nc) == state["pos"][1 - player]:
                 raise ValueError("Cannot move onto opponent")
-            new_state["pos"][player] = (nr, nc)
-        elif parts[0] in {"H", "V"}:
-            if len(parts) != 3:
-                raise ValueError("Invalid action format")
-            rr, cc = int(parts[1]), int(parts[2])
-            if rr < 0 or rr >= self.size - 1 or cc < 0 or cc >= self.size - 1:
-                raise ValueError("Wall out of bounds")
-            if new_state["remaining"][player] <= 0:
-                raise ValueError("No walls remaining")
-            if parts[0] == "H":
-                if (rr, cc) in state["h_walls"]:
-                    raise ValueError("Wall already present")
-                new_state["h_walls"].add((rr, cc))
-            else:
-                if (rr, cc) in state["v_walls"]:
-                    raise ValueError("Wall already present")
-                new_state["v_walls"].add((rr, cc))
-            new_state["remaining"][player] -= 1
+            state["pos"][player] = (nr, nc)
+            if "key" in state:
+                state["key"] ^= self.side_key ^ self._pawn_key(r, c, player) ^ self._pawn_key(nr, nc, player)
         else:
-            raise ValueError("Unknown action")
-
-        return new_state
+            kind, index = divmod(action_id - 4, (self.size - 1) ** 2)
+            rr, cc = divmod(index, self.size - 1)
+            if state["remaining"][player] <= 0:
+                raise ValueError("No walls remaining")
+            walls = state["v_walls" if kind else "h_walls"]
+            if (rr, cc) in walls:
+                raise ValueError("Wall already present")
+            paths = self._paths(state)
+            if self._blocks(state, paths, kind, index):
+                raise ValueError("Wall blocks a path")
+            walls.add((rr, cc))
+            child = self._with_wall(paths, kind, index)
+            if child.walls not in self._paths_cache:
+                self._remember(child)
+            state["remaining"][player] -= 1
+            if "key" in state:
+                left = state["remaining"][player]
+                state["key"] ^= (
+                    self.side_key
+                    ^ self.wall_keys[index][kind]
+                    ^ self.remaining_keys[left + 1][player]
+                    ^ self.remaining_keys[left][player]
+                )
+        state["current"] = 1 - player
 
     def is_terminal(self, state: Dict[str, Any]) -> bool:
         if state["pos"][0][0] == self.size - 1:
@@ -114,6 +181,9 @@ class Quoridor(Game):
             return 1
         return None
 
+    def current_player(self, state: Dict[str, Any]) -> int:
+        return state["current"]
+
     def render(self, state: Dict[str, Any]) -> str:
         board = [["." for _ in range(self.size)] for _ in range(self.size)]
         board[state["pos"][0][0]][state["pos"][0][1]] = "0"
@@ -128,3 +198,231 @@ class Quoridor(Game):
             f"Remaining: {state['remaining']}"
         )
 
+    def state_key(self, state: Dict[str, Any]) -> int:
+        # States built by hand carry no key; work it out without storing it.
+        key = state.get("key")
+        return self._compute_key(state) if key is None else key
+
+    # Action ids: pawn moves U, D, L, R are 0-3, then one id per horizontal
+    # wall slot followed by one per vertical wall slot.
+
+    def num_actions(self) -> int:
+        return 4 + 2 * (self.size - 1) ** 2
+
+    def legal_action_ids(self, state: Dict[str, Any]) -> List[int]:
+        ids: List[int] = []
+        player = state["current"]
+        r, c = state["pos"][player]
+        opponent_pos = state["pos"][1 - player]
+
+        if r > 0 and (r - 1, c) not in state["h_walls"] and opponent_pos != (r - 1, c):
+            ids.append(0)
+        if r < self.size - 1 and (r, c) not in state["h_walls"] and opponent_pos != (r + 1, c):
+            ids.append(1)
+        if c > 0 and (r, c - 1) not in state["v_walls"] and opponent_pos != (r, c - 1):
+            ids.append(2)
+        if c < self.size - 1 and (r, c) not in state["v_walls"] and opponent_pos != (r, c + 1):
+            ids.append(3)
+
+        if state["remaining"][player] > 0:
+            paths = self._paths(state)
+            slots = (self.size - 1) ** 2
+            index = 0
+            for rr in range(self.size - 1):
+                for cc in range(self.size - 1):
+                    if (rr, cc) not in state["h_walls"] and not self._blocks(state, paths, 0, index):
+                        ids.append(4 + index)
+                    if (rr, cc) not in state["v_walls"] and not self._blocks(state, paths, 1, index):
+                        ids.append(4 + slots + index)
+                    index += 1
+        return ids
+
+    def action_to_str(self, state: Dict[str, Any], action_id: int) -> str:
+        if action_id < 4:
+            return "UDLR"[action_id]
+        kind, index = divmod(action_id - 4, (self.size - 1) ** 2)
+        rr, cc = divmod(index, self.size - 1)
+        return f"{'HV'[kind]} {rr} {cc}"
+
+    def str_to_action(self, state: Dict[str, Any], action: str) -> int:
+        parts = action.split()
+        if parts and parts[0] in {"U", "D", "L", "R"}:
+            return "UDLR".index(parts[0])
+        if parts and parts[0] in {"H", "V"}:
+            if len(parts) != 3:
+                raise ValueError("Invalid action format")
+            rr, cc = int(parts[1]), int(parts[2])
+            if rr < 0 or rr >= self.size - 1 or cc < 0 or cc >= self.size - 1:
+                raise ValueError("Wall out of bounds")
+            slots = (self.size - 1) ** 2
+            return 4 + (slots if parts[0] == "V" else 0) + rr * (self.size - 1) + cc
+        raise ValueError("Unknown action")
+
+    def distances(self, state: Dict[str, Any]) -> Tuple[int, int]:
+        """Each pawn's shortest-path length to its goal row, ignoring pawns."""
+        paths = self._paths(state)
+        (r0, c0), (r1, c1) = state["pos"]
+        return self._dist(paths, 0)[r0 * self.size + c0], self._dist(paths, 1)[r1 * self.size + c1]
+
+    def distance_map(self, state: Dict[str, Any], player: int) -> List[int]:
+        """``player``'s distance to its goal row from every cell ``r * size + c``.
+
+        Cells cut off by walls hold ``UNREACHABLE``.  The list is shared
+        between states and must not be modified.
+        """
+        return self._dist(self._paths(state), player)
+
+    # Shortest paths ---------------------------------------------------
+    #
+    # Walls only ever remove edges, so a wall leaves a player's distances
+    # unchanged unless it removes the last neighbour one step closer to the
+    # goal of some cell; only then is the distance map recomputed.  Whether a
+    # wall would disconnect a pawn is answered in O(1) from the bridges of
+    # the cell graph, found once per wall configuration.
+
+    def _paths(self, state: Dict[str, Any]) -> _Paths:
+        walls = (frozenset(state["h_walls"]), frozenset(state["v_walls"]))
+        paths = self._paths_cache.get(walls)
+        if paths is None:
+            paths = self._remember(_Paths(walls))
+        return paths
+
+    def _remember(self, paths: _Paths) -> _Paths:
+        cache = self._paths_cache
+        cache[paths.walls] = paths
+        if len(cache) > _PATHS_CACHE_SIZE:
+            cache.pop(next(iter(cache)), None)  # oldest first
+        return paths
+
+    def _neighbours(self, walls: Tuple[FrozenSet, FrozenSet], cell: int) -> List[int]:
+        n = self.size
+        h_walls, v_walls = walls
+        r, c = divmod(cell, n)
+        result = []
+        if r > 0 and (r - 1, c) not in h_walls:
+            result.append(cell - n)
+        if r < n - 1 and (r, c) not in h_walls:
+            result.append(cell + n)
+        if c > 0 and (r, c - 1) not in v_walls:
+            result.append(cell - 1)
+        if c < n - 1 and (r, c) not in v_walls:
+            result.append(cell + 1)
+        return result
+
+    def _goal_cells(self, player: int) -> range:
+        n = self.size
+        row = n - 1 if player == 0 else 0
+        return range(row * n, row * n + n)
+
+    def _dist(self, paths: _Paths, player: int) -> List[int]:
+        dist = paths.dist[player]
+        if dist is None:
+            dist = [UNREACHABLE] * (self.size * self.size)
+            frontier = list(self._goal_cells(player))
+            for cell in frontier:
+                dist[cell] = 0
+            for cell in frontier:  # grows while iterating: breadth-first
+                step = dist[cell] + 1
+                for nxt in self._neighbours(paths.walls, cell):
+                    if dist[nxt] == UNREACHABLE:
+                        dist[nxt] = step
+                        frontier.append(nxt)
+            paths.dist[player] = dist
+        return dist
+
+    def _wall_edge(self, kind: int, index: int) -> Tuple[int, int]:
+        rr, cc = divmod(index, self.size - 1)
+        a = rr * self.size + cc
+        return (a, a + 1) if kind else (a, a + self.size)
+
+    def _with_wall(self, paths: _Paths, kind: int, index: int) -> _Paths:
+        h_walls, v_walls = paths.walls
+        wall = divmod(index, self.size - 1)
+        walls = (h_walls, v_walls | {wall}) if kind else (h_walls | {wall}, v_walls)
+        child = _Paths(walls)
+        a, b = self._wall_edge(kind, index)
+        for player, dist in enumerate(paths.dist):
+            if dist is None:
+                continue
+            if dist[a] == dist[b] + 1:
+                far = a
+            elif dist[b] == dist[a] + 1:
+                far = b
+            else:
+                child.dist[player] = dist  # the edge is on no shortest path
+                continue
+            closer = dist[far] - 1
+            if any(dist[cell] == closer for cell in self._neighbours(walls, far)):
+                child.dist[player] = dist  # another shortest path survives
+        return child
+
+    def _cuts(self, paths: _Paths, player: int) -> Tuple[Dict[Tuple[int, int], int], List[int], List[int]]:
+        cuts = paths.cuts[player]
+        if cuts is None:
+            cuts = paths.cuts[player] = self._bridges(paths.walls, player)
+        return cuts
+
+    def _bridges(
+        self, walls: Tuple[FrozenSet, FrozenSet], player: int
+    ) -> Tuple[Dict[Tuple[int, int], int], List[int], List[int]]:
+        # Iterative Tarjan bridge search from a virtual node joined to the
+        # whole goal row.  Removing bridge (u, v), v the child, cuts off
+        # exactly the cells entered during v's subtree.
+        cells = self.size * self.size
+        goal = cells
+        goal_cells = self._goal_cells(player)
+        tin = [-1] * (cells + 1)
+        tout = [-1] * (cells + 1)
+        low = [0] * (cells + 1)
+        bridges: Dict[Tuple[int, int], int] = {}
+        timer = 0
+        tin[goal] = low[goal] = timer
+        stack = [(goal, -1, iter(goal_cells))]
+        while stack:
+            node, parent, children = stack[-1]
+            for nxt in children:
+                if nxt == parent:
+                    continue
+                if tin[nxt] == -1:
+                    timer += 1
+                    tin[nxt] = low[nxt] = timer
+                    neighbours = self._neighbours(walls, nxt)
+                    if nxt in goal_cells:
+                        neighbours.append(goal)
+                    stack.append((nxt, node, iter(neighbours)))
+                    break
+                low[node] = min(low[node], tin[nxt])
+            else:
+                stack.pop()
+                tout[node] = timer + 1
+                if parent >= 0:
+                    low[parent] = min(low[parent], low[node])
+                    if parent != goal and low[node] > tin[parent]:
+                        bridges[(min(node, parent), max(node, parent))] = node
+        return bridges, tin, tout
+
+    def _blocks(self, state: Dict[str, Any], paths: _Paths, kind: int, index: int) -> bool:
+        """Would the wall ``(kind, index)`` cut either pawn off from its goal?
+
+        ``paths`` belongs to the walls of ``state``.
+        """
+        edge = self._wall_edge(kind, index)
+        for player, (r, c) in enumerate(state["pos"]):
+            bridges, tin, tout = self._cuts(paths, player)
+            root = bridges.get(edge)
+            if root is not None and tin[root] <= tin[r * self.size + c] < tout[root]:
+                return True
+        return False
+
+    def _compute_key(self, state: Dict[str, Any]) -> int:
+        key = self.side_key if state["current"] else 0
+        for player, (r, c) in enumerate(state["pos"]):
+            key ^= self._pawn_key(r, c, player)
+            key ^= self.remaining_keys[state["remaining"][player]][player]
+        for kind, walls in enumerate((state["h_walls"], state["v_walls"])):
+            for rr, cc in walls:
+                key ^= self.wall_keys[rr * (self.size - 1) + cc][kind]
+        return key
+
+    def _pawn_key(self, r: int, c: int, player: int) -> int:
+        return self.pawn_keys[r * self.size + c][player]
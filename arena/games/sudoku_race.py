@@ -1,77 +1,246 @@
 from __future__ import annotations
 
-from typing import List
+import math
+import os
+from dataclasses import dataclass
+from typing import List, Sequence
 
 from ..base import Game
 
+# Preset puzzle used for tests
+_DEFAULT_PUZZLE = [
+    [1, 0, 0, 4],
+    [0, 0, 0, 0],
+    [0, 0, 0, 0],
+    [3, 0, 0, 2],
+]
+
+# Single-character cell values: "." or "0" is empty, then 1-9 and A-Z for 10
+# and up (enough for 25x25 boards).
+_DIGITS = "123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+@dataclass(slots=True)
+class SudokuState:
+    """Grid values plus the used-value bitmask of every row, column and box.
+
+    Bit ``v - 1`` of ``rows[r]`` is set when value ``v`` is in row ``r``, and
+    likewise for ``cols`` and ``boxes`` (boxes numbered row-major), so the
+    values still allowed in a cell are one mask intersection away.
+    ``state[r][c]`` reads the grid as in the older list-of-lists states.
+    """
+
+    grid: List[List[int]]
+    rows: List[int]
+    cols: List[int]
+    boxes: List[int]
+    givens: int  # number of prefilled cells
+    filled: int  # number of filled cells, givens included
+
+    def __getitem__(self, r: int) -> List[int]:
+        return self.grid[r]
+
+
+def parse_puzzle(text: str) -> List[List[int]]:
+    """Parse one puzzle into a grid of ints (0 for empty).
+
+    ``text`` is either n*n single characters (``.`` or ``0`` for empty cells,
+    ``1``-``9`` then ``A``-``Z`` for 10 and up; whitespace is ignored) or n*n
+    numbers separated by commas or whitespace.
+    """
+    values = None if "," in text else _parse_chars(text)
+    if values is None:
+        try:
+            values = [int(token) for token in text.replace(",", " ").split()]
+        except ValueError as e:
+            raise ValueError("Puzzle values must be integers") from e
+    size = _grid_size(len(values))
+    if size is None:
+        raise ValueError(f"Puzzle has {len(values)} cells; expected n*n with n a square")
+    if any(not 0 <= v <= size for v in values):
+        raise ValueError("Puzzle value out of range")
+    return [values[r * size : (r + 1) * size] for r in range(size)]
+
+
+def _parse_chars(text: str) -> List[int] | None:
+    """Values of a one-character-per-cell puzzle, or None if it is not one."""
+    chars = "".join(text.split()).upper()
+    if _grid_size(len(chars)) is None or any(ch not in _DIGITS and ch not in ".0" for ch in chars):
+        return None
+    return [0 if ch in ".0" else _DIGITS.index(ch) + 1 for ch in chars]
+
+
+def _grid_size(cells: int) -> int | None:
+    size = math.isqrt(cells)
+    if size == 0 or size * size != cells or math.isqrt(size) ** 2 != size:
+        return None
+    return size
+
+
+def load_puzzles(path: str | os.PathLike[str]) -> List[List[List[int]]]:
+    """Read puzzles from a file of givens, one puzzle per line.
+
+    Blank lines and lines starting with ``#`` are skipped.
+    """
+    with open(path, encoding="utf-8") as f:
+        return [parse_puzzle(line) for line in f if line.strip() and not line.lstrip().startswith("#")]
+
 
 class SudokuRace(Game):
-    """Simple 4x4 Sudoku race where players fill the board."""
+    """Sudoku race where players take turns filling an n x n board (n = k*k).
 
-    def __init__(self, size: int = 4):
-        if size != 4:
-            raise ValueError("Only 4x4 Sudoku supported")
+    The board starts from ``puzzle`` (a grid or a string accepted by
+    ``parse_puzzle``), whose dimensions override ``size``.  Without one, 4x4
+    games use a preset puzzle and larger boards start empty.
+
+    The game ends when the board is full or no digit fits any empty cell;
+    either way the player to move loses, so filling the last cell wins.
+    """
+
+    def __init__(self, size: int = 4, puzzle: Sequence[Sequence[int]] | str | None = None):
+        if isinstance(puzzle, str):
+            puzzle = parse_puzzle(puzzle)
+        if puzzle is not None:
+            size = len(puzzle)
+        sub = math.isqrt(size)
+        if size < 1 or sub * sub != size:
+            raise ValueError("Sudoku size must be a perfect square")
         self.size = size
-        self.sub = 2  # subgrid size
-
-    def reset(self) -> List[List[int]]:
-        # Preset puzzle used for tests
-        return [
-            [1, 0, 0, 4],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [3, 0, 0, 2],
-        ]
-
-    def valid_actions(self, state: List[List[int]]) -> List[str]:
-        actions: List[str] = []
-        for r in range(self.size):
-            for c in range(self.size):
-                if state[r][c] != 0:
-                    continue
-                for v in range(1, self.size + 1):
-                    if self._is_valid_move(state, r, c, v):
-                        actions.append(f"{r},{c},{v}")
-        return actions
+        self.sub = sub  # subgrid size
+        if puzzle is None:
+            puzzle = _DEFAULT_PUZZLE if size == 4 else [[0] * size for _ in range(size)]
+        if any(len(row) != size or any(not 0 <= v <= size for v in row) for row in puzzle):
+            raise ValueError("Puzzle does not match the board size")
+        self.puzzle = [list(row) for row in puzzle]
+        self.full = (1 << size) - 1
+        # Box index of every cell, row-major
+        self.box_of = [[(r // sub) * sub + c // sub for c in range(size)] for r in range(size)]
+        self._initial = self._build(self.puzzle)
 
-    def apply_action(self, state: List[List[int]], action: str) -> List[List[int]]:
-        try:
-            r, c, v = map(int, action.split(","))
-        except Exception as e:
-            raise ValueError("Action must be 'row,col,value'") from e
-        if not (0 <= r < self.size and 0 <= c < self.size and 1 <= v <= self.size):
+    @classmethod
+    def from_file(cls, path: str | os.PathLike[str], index: int = 0) -> "SudokuRace":
+        """Create a game from puzzle ``index`` of a file read by ``load_puzzles``."""
+        return cls(puzzle=load_puzzles(path)[index])
+
+    def reset(self) -> SudokuState:
+        initial = self._initial
+        return SudokuState(
+            [row.copy() for row in initial.grid],
+            initial.rows.copy(),
+            initial.cols.copy(),
+            initial.boxes.copy(),
+            initial.givens,
+            initial.filled,
+        )
+
+    def valid_actions(self, state: SudokuState) -> List[str]:
+        return [self.action_to_str(state, action_id) for action_id in self.legal_action_ids(state)]
+
+    def apply_action(self, state: SudokuState, action: str) -> SudokuState:
+        return self.apply_action_id(state, self.str_to_action(state, action))
+
+    def apply_action_id(self, state: SudokuState, action_id: int) -> SudokuState:
+        if not 0 <= action_id < self.num_actions():
             raise ValueError("Action out of bounds")
-        if state[r][c] != 0:
+        cell, v = divmod(action_id, self.size)
+        r, c = divmod(cell, self.size)
+        if state.grid[r][c] != 0:
             raise ValueError("Cell already filled")
-        if not self._is_valid_move(state, r, c, v):
+        b = self.box_of[r][c]
+        bit = 1 << v
+        if (state.rows[r] | state.cols[c] | state.boxes[b]) & bit:
             raise ValueError("Invalid move")
-        new_state = [row.copy() for row in state]
-        new_state[r][c] = v
-        return new_state
+        grid = state.grid.copy()
+        grid[r] = grid[r].copy()
+        grid[r][c] = v + 1
+        rows, cols, boxes = state.rows.copy(), state.cols.copy(), state.boxes.copy()
+        rows[r] |= bit
+        cols[c] |= bit
+        boxes[b] |= bit
+        return SudokuState(grid, rows, cols, boxes, state.givens, state.filled + 1)
 
-    def is_terminal(self, state: List[List[int]]) -> bool:
-        return all(cell != 0 for row in state for cell in row)
+    def is_terminal(self, state: SudokuState) -> bool:
+        return state.filled == self.size * self.size or not self._can_move(state)
 
-    def get_winner(self, state: List[List[int]]) -> int | None:
+    def get_winner(self, state: SudokuState) -> int | None:
         if not self.is_terminal(state):
             return None
-        moves = sum(cell != 0 for row in state for cell in row)
-        return (moves - 1) % 2
+        # The player who made the last move wins.
+        return 1 - self.current_player(state)
+
+    def current_player(self, state: SudokuState) -> int:
+        return (state.filled - state.givens) % 2
+
+    # Action ids are (row * size + col) * size + value - 1.
+
+    def num_actions(self) -> int:
+        return self.size ** 3
+
+    def legal_action_ids(self, state: SudokuState) -> List[int]:
+        n = self.size
+        full = self.full
+        rows, cols, boxes = state.rows, state.cols, state.boxes
+        ids: List[int] = []
+        for r, row in enumerate(state.grid):
+            row_mask = rows[r]
+            box_row = self.box_of[r]
+            for c, value in enumerate(row):
+                if value:
+                    continue
+                free = full & ~(row_mask | cols[c] | boxes[box_row[c]])
+                base = (r * n + c) * n
+                while free:
+                    low = free & -free
+                    ids.append(base + low.bit_length() - 1)
+                    free ^= low
+        return ids
+
+    def action_to_str(self, state: SudokuState, action_id: int) -> str:
+        cell, v = divmod(action_id, self.size)
+        return f"{cell // self.size},{cell % self.size},{v + 1}"
 
-    def render(self, state: List[List[int]]) -> str:
-        lines = [" ".join(str(v) if v != 0 else "." for v in row) for row in state]
+    def str_to_action(self, state: SudokuState, action: str) -> int:
+        try:
+            r, c, v = map(int, action.split(","))
+        except Exception as e:
+            raise ValueError("Action must be 'row,col,value'") from e
+        if not (0 <= r < self.size and 0 <= c < self.size and 1 <= v <= self.size):
+            raise ValueError("Action out of bounds")
+        return (r * self.size + c) * self.size + v - 1
+
+    def render(self, state: SudokuState) -> str:
+        width = len(str(self.size))
+        lines = [" ".join(str(v).rjust(width) if v != 0 else ".".rjust(width) for v in row) for row in state.grid]
         board = "\n".join(lines)
         return f"```\n{board}\n```"
 
-    def _is_valid_move(self, state: List[List[int]], r: int, c: int, v: int) -> bool:
-        if any(state[r][i] == v for i in range(self.size)):
-            return False
-        if any(state[i][c] == v for i in range(self.size)):
-            return False
-        sr = (r // self.sub) * self.sub
-        sc = (c // self.sub) * self.sub
-        for i in range(sr, sr + self.sub):
-            for j in range(sc, sc + self.sub):
-                if state[i][j] == v:
-                    return False
-        return True
+    def _can_move(self, state: SudokuState) -> bool:
+        """Does some digit fit some empty cell?"""
+        full = self.full
+        rows, cols, boxes = state.rows, state.cols, state.boxes
+        for r, row in enumerate(state.grid):
+            row_mask = rows[r]
+            box_row = self.box_of[r]
+            for c, value in enumerate(row):
+                if not value and full & ~(row_mask | cols[c] | boxes[box_row[c]]):
+                    return True
+        return False
+
+    def _build(self, grid: List[List[int]]) -> SudokuState:
+        n = self.size
+        rows, cols, boxes = [0] * n, [0] * n, [0] * n
+        filled = 0
+        for r in range(n):
+            for c in range(n):
+                v = grid[r][c]
+                if not v:
+                    continue
+                bit = 1 << (v - 1)
+                b = self.box_of[r][c]
+                if (rows[r] | cols[c] | boxes[b]) & bit:
+                    raise ValueError("Puzzle givens conflict")
+                rows[r] |= bit
+                cols[c] |= bit
+                boxes[b] |= bit
+                filled += 1
+        return SudokuState([row.copy() for row in grid], rows, cols, boxes, filled, filled)
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, List
+from typing import Any, List, Tuple
 
 from ..base import Game
+from ..hashing import canonical_key, grid_symmetries, inverse_permutations, symmetry_table, zobrist_table
+
+_ZOBRIST = zobrist_table(9, 2, "tictactoe")
+# All eight rotations and reflections of the board (see grid_symmetries).
+_SYMMETRIES = grid_symmetries(3, 3)
+_INVERSES = inverse_permutations(_SYMMETRIES)
+_SYMMETRY_KEYS = symmetry_table(_ZOBRIST, _SYMMETRIES)
 
 
 class TicTacToe(Game):
@@ -15,12 +22,7 @@ class TicTacToe(Game):
         return [str(i) for i, cell in enumerate(state) if cell == " "]
 
     def apply_action(self, state: List[str], action: str) -> List[str]:
-        idx = int(action)
-        if state[idx] != " ":
-            raise ValueError("Invalid move")
-        new_state = state.copy()
-        new_state[idx] = self._current_player(state)
-        return new_state
+        return self.apply_action_id(state, self.str_to_action(state, action))
 
     def is_terminal(self, state: List[str]) -> bool:
         return self.get_winner(state) is not None or all(cell != " " for cell in state)
@@ -41,11 +43,51 @@ class TicTacToe(Game):
                 return 0 if state[a] == "X" else 1
         return None
 
+    def current_player(self, state: List[str]) -> int:
+        return 0 if state.count("X") == state.count("O") else 1
+
     def render(self, state: List[str]) -> str:
         rows = ["|".join(state[i : i + 3]) for i in range(0, 9, 3)]
         board = "\n-----\n".join(rows)
         return f"```\n{board}\n```"
 
+    def state_key(self, state: List[str]) -> int:
+        # Nine cells are cheaper to rehash than to track on a bare list state.
+        key = 0
+        for i, cell in enumerate(state):
+            if cell != " ":
+                key ^= _ZOBRIST[i][0 if cell == "X" else 1]
+        return key
+
+    def canonical_state(self, state: List[str]) -> Tuple[int, int]:
+        pieces = ((i, 0 if cell == "X" else 1) for i, cell in enumerate(state) if cell != " ")
+        return canonical_key(pieces, _SYMMETRY_KEYS)
+
+    def to_canonical_action(self, state: List[str], action_id: int, transform: int) -> int:
+        return _SYMMETRIES[transform][action_id]
+
+    def from_canonical_action(self, state: List[str], action_id: int, transform: int) -> int:
+        return _INVERSES[transform][action_id]
+
+    def num_actions(self) -> int:
+        return 9
+
+    def legal_action_ids(self, state: List[str]) -> List[int]:
+        return [i for i, cell in enumerate(state) if cell == " "]
+
+    def apply_action_id(self, state: List[str], action_id: int) -> List[str]:
+        if not 0 <= action_id < 9 or state[action_id] != " ":
+            raise ValueError("Invalid move")
+        new_state = state.copy()
+        new_state[action_id] = self._current_player(state)
+        return new_state
+
+    def action_to_str(self, state: List[str], action_id: int) -> str:
+        return str(action_id)
+
+    def str_to_action(self, state: List[str], action: str) -> int:
+        return int(action)
+
     def _current_player(self, state: List[str]) -> str:
         x_count = state.count("X")
         o_count = state.count("O")
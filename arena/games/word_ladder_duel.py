@@ -1,19 +1,31 @@
 from __future__ import annotations
 
-from typing import Any, List, Tuple, Iterable
+from functools import lru_cache
+from typing import Any, FrozenSet, List, Tuple, Iterable
 
 from ..base import Game
+from ..word_index import WordIndex
 
 
 class WordLadderDuel(Game):
-    """Two-player word ladder race from start to goal."""
+    """Two-player word ladder race from start to goal.
 
-    def __init__(self, start: str, goal: str, dictionary: Iterable[str] | None = None):
+    ``dictionary`` may be a list of words or a prebuilt ``WordIndex``; pass
+    the same index (e.g. from ``WordIndex.open``) to every match to share it.
+    Games given equal word lists share one index built on first use.  Words
+    must be letters a-z, in any case.  Without a dictionary any string of
+    letters is a word.
+    """
+
+    def __init__(self, start: str, goal: str, dictionary: Iterable[str] | WordIndex | None = None):
         if len(start) != len(goal):
             raise ValueError("start and goal must be the same length")
         self.start = start.lower()
         self.goal = goal.lower()
-        self.dictionary = set(w.lower() for w in dictionary) if dictionary else None
+        if isinstance(dictionary, WordIndex):
+            self.dictionary: WordIndex | None = dictionary
+        else:
+            self.dictionary = _index(frozenset(w.lower() for w in dictionary)) if dictionary else None
         self.alphabet = "abcdefghijklmnopqrstuvwxyz"
 
     def reset(self) -> Tuple[str, int]:
@@ -21,6 +33,10 @@ class WordLadderDuel(Game):
 
     def valid_actions(self, state: Tuple[str, int]) -> List[str]:
         word, _ = state
+        if self.dictionary is not None:
+            neighbours = self.dictionary.neighbours(word)
+            if neighbours is not None:
+                return neighbours
         actions: List[str] = []
         for i, ch in enumerate(word):
             for new_ch in self.alphabet:
@@ -52,6 +68,80 @@ class WordLadderDuel(Game):
             return None
         return (count - 1) % 2
 
+    def current_player(self, state: Tuple[str, int]) -> int:
+        return state[1] % 2
+
+    # Action ids are position * 26 + letter, relative to the current word.
+
+    def num_actions(self) -> int:
+        return len(self.start) * len(self.alphabet)
+
+    def legal_action_ids(self, state: Tuple[str, int]) -> List[int]:
+        word, _ = state
+        if self.dictionary is not None:
+            neighbours = self.dictionary.neighbours(word)
+            if neighbours is not None:
+                return [self._action_id(word, n) for n in neighbours]
+        ids: List[int] = []
+        for i, ch in enumerate(word):
+            for j, new_ch in enumerate(self.alphabet):
+                if new_ch == ch:
+                    continue
+                if self.dictionary is None or word[:i] + new_ch + word[i + 1 :] in self.dictionary:
+                    ids.append(i * len(self.alphabet) + j)
+        return ids
+
+    def apply_action_id(self, state: Tuple[str, int], action_id: int) -> Tuple[str, int]:
+        if not 0 <= action_id < self.num_actions():
+            raise ValueError("Invalid move")
+        word, count = state
+        i, j = divmod(action_id, len(self.alphabet))
+        if word[i] == self.alphabet[j]:
+            raise ValueError("Action must change exactly one letter")
+        candidate = word[:i] + self.alphabet[j] + word[i + 1 :]
+        if self.dictionary is not None and candidate not in self.dictionary:
+            raise ValueError("Word not in dictionary")
+        return (candidate, count + 1)
+
+    def action_to_str(self, state: Tuple[str, int], action_id: int) -> str:
+        word, _ = state
+        i, j = divmod(action_id, len(self.alphabet))
+        return word[:i] + self.alphabet[j] + word[i + 1 :]
+
+    def str_to_action(self, state: Tuple[str, int], action: str) -> int:
+        word, _ = state
+        action = action.lower()
+        if len(action) != len(word):
+            raise ValueError("Invalid word length")
+        diffs = [i for i, (a, b) in enumerate(zip(word, action)) if a != b]
+        if len(diffs) != 1 or action[diffs[0]] not in self.alphabet:
+            raise ValueError("Action must change exactly one letter")
+        return diffs[0] * len(self.alphabet) + self.alphabet.index(action[diffs[0]])
+
+    def distance_to_goal(self, state: Tuple[str, int]) -> int | None:
+        """Fewest moves left to reach the goal, or None if it cannot be reached.
+
+        With a dictionary this reads the index's BFS table for the goal.
+        """
+        word, _ = state
+        if self.dictionary is None:
+            return sum(a != b for a, b in zip(word, self.goal))
+        if word == self.goal or word in self.dictionary:
+            return self.dictionary.distance(word, self.goal)
+        # A start word missing from the dictionary is one move from its neighbours.
+        distances = [self.dictionary.distance(w, self.goal) for w in self.valid_actions(state)]
+        return min((d + 1 for d in distances if d is not None), default=None)
+
+    def _action_id(self, word: str, neighbour: str) -> int:
+        i = next(i for i, (a, b) in enumerate(zip(word, neighbour)) if a != b)
+        return i * len(self.alphabet) + ord(neighbour[i]) - ord("a")
+
     def render(self, state: Tuple[str, int]) -> str:
         word, _ = state
         return f"Current: {word} -> Goal: {self.goal}"
+
+
+@lru_cache(maxsize=16)
+def _index(words: FrozenSet[str]) -> WordIndex:
+    """Index of ``words``, shared by every game given the same list."""
+    return WordIndex.build(words)
@@ -0,0 +1,168 @@
+"""Sprague-Grundy solver and perfect player for Nim and MultiHeapNim.
+
+Both games are sums of subtraction games: a heap of ``n`` sticks loses ``t``
+sticks for some ``t`` in the subtraction set (``1..max_take``, or any number
+without a limit).  A position is lost for the player to move exactly when the
+XOR of its heaps' Grundy values is 0.
+
+Grundy values of a finite subtraction set are eventually periodic.
+``SubtractionGame`` computes them until the last ``max(moves)`` values repeat
+and then answers any heap size from the cached period, so heaps of millions
+cost the same as heaps of ten.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .base import Game, Player
+from .games.multiheap_nim import MultiHeapNim
+from .games.nim import Nim
+
+
+class SubtractionGame:
+    """Grundy values and winning takes for one heap of a subtraction game.
+
+    ``moves`` is the subtraction set; None allows taking any number of
+    sticks, whose Grundy value is simply the heap size.
+    """
+
+    def __init__(self, moves: Iterable[int] | None):
+        self.moves = None if moves is None else tuple(sorted(set(moves)))
+        if self.moves is not None and (not self.moves or self.moves[0] < 1):
+            raise ValueError("Subtraction set must hold positive takes")
+        self.values: List[int] = []
+        self.preperiod = 0
+        self.period = 1
+        # _takes[n][target]: a take from heap n reaching Grundy value target
+        self._takes: List[Dict[int, int]] = []
+        if self.moves is not None:
+            self._find_period()
+
+    def grundy(self, heap: int) -> int:
+        if self.moves is None:
+            return heap
+        return self.values[self._representative(heap)]
+
+    def take_to(self, heap: int, target: int) -> int | None:
+        """A legal take leaving a heap of Grundy value ``target``, if any."""
+        if self.moves is None:
+            return heap - target if target < heap else None
+        return self._takes[self._representative(heap)].get(target)
+
+    def _representative(self, heap: int) -> int:
+        """A small heap with the same Grundy value and winning takes as ``heap``."""
+        # Past the preperiod plus one window every take lands in the
+        # periodic part, so the takes repeat with the values.
+        start = self.preperiod + self.moves[-1]
+        if heap < start:
+            return heap
+        return start + (heap - start) % self.period
+
+    def _find_period(self) -> None:
+        window = self.moves[-1]
+        values = self.values
+        seen: Dict[Tuple[int, ...], int] = {}
+        while True:
+            self._extend()
+            n = len(values)
+            # Values depend only on the previous ``window`` ones, so a
+            # repeated window repeats forever after.
+            if n >= window:
+                first = seen.setdefault(tuple(values[n - window :]), n)
+                if first != n:
+                    self.preperiod = first - window
+                    self.period = n - first
+                    break
+        # _representative needs the preperiod, one window and one period.
+        keep = self.preperiod + window + self.period
+        while len(values) < keep:
+            self._extend()
+        del values[keep:], self._takes[keep:]
+
+    def _extend(self) -> None:
+        n = len(self.values)
+        options: Dict[int, int] = {}  # Grundy value reached -> smallest take
+        for t in self.moves:
+            if t > n:
+                break
+            options.setdefault(self.values[n - t], t)
+        g = 0
+        while g in options:
+            g += 1
+        self.values.append(g)
+        self._takes.append({v: t for v, t in options.items() if v < g})
+
+
+@lru_cache(maxsize=None)
+def subtraction_game(max_take: int | None) -> SubtractionGame:
+    """The shared ``SubtractionGame`` for takes of 1..``max_take`` (None: any)."""
+    return SubtractionGame(None if max_take is None else range(1, max_take + 1))
+
+
+def _position(game: Game, state: Any) -> Tuple[List[int], SubtractionGame]:
+    if isinstance(game, Nim):
+        return [state[0]], subtraction_game(game.max_take)
+    if isinstance(game, MultiHeapNim):
+        return list(state.heaps), subtraction_game(game.max_take)
+    raise TypeError(f"{type(game).__name__} is not a Nim game")
+
+
+def _action(game: Game, heap: int, take: int) -> str:
+    return str(take) if isinstance(game, Nim) else f"{heap},{take}"
+
+
+def nim_value(game: Game, state: Any) -> int:
+    """XOR of the heaps' Grundy values; 0 means the player to move loses."""
+    heaps, rules = _position(game, state)
+    value = 0
+    for heap in heaps:
+        value ^= rules.grundy(heap)
+    return value
+
+
+def winning_action(game: Game, state: Any) -> str | None:
+    """A move to a position of value 0, or None if the player to move is lost.
+
+    Takes O(heaps) once the game's Grundy period is known.
+    """
+    heaps, rules = _position(game, state)
+    grundy = [rules.grundy(heap) for heap in heaps]
+    value = 0
+    for g in grundy:
+        value ^= g
+    if value == 0:
+        return None
+    for i, g in enumerate(grundy):
+        if g ^ value < g:
+            return _action(game, i, rules.take_to(heaps[i], g ^ value))
+    raise AssertionError("nonzero Nim value without a winning move")
+
+
+def score_move(game: Game, state: Any, action: str) -> float:
+    """Rate ``action``: 1.0 if it keeps the best result available, else 0.0.
+
+    From a won position only moves to a position of value 0 score 1.0; from
+    a lost position every move does, since perfect play wins regardless.
+    """
+    after = game.apply_action(state, action)  # rejects illegal moves
+    if nim_value(game, state) == 0:
+        return 1.0
+    return 1.0 if nim_value(game, after) == 0 else 0.0
+
+
+class PerfectNimPlayer(Player):
+    """Plays Nim and MultiHeapNim perfectly using Grundy values.
+
+    In a lost position it takes one stick from the largest heap, dragging
+    the game out in the hope of a mistake.
+    """
+
+    def select_action(self, game: Game, state: Any) -> str:
+        action = winning_action(game, state)
+        if action is None:
+            heaps, _ = _position(game, state)
+            heap = max(range(len(heaps)), key=heaps.__getitem__)
+            action = _action(game, heap, 1)
+        return action
@@ -0,0 +1,96 @@
+"""Stable state keys shared by the games.
+
+Keys must be identical in every process so that caches and tablebases built
+in one worker can be used by another; Python's built-in ``hash`` of strings is
+salted per process, so it is never used here.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+from typing import Iterable, List, Tuple
+
+
+def zobrist_table(features: int, values: int, seed: str) -> List[List[int]]:
+    """Return ``features`` x ``values`` random 64-bit keys, reproducible from ``seed``."""
+    rng = random.Random(seed)
+    return [[rng.getrandbits(64) for _ in range(values)] for _ in range(features)]
+
+
+def stable_hash(text: str) -> int:
+    """Return a 64-bit hash of ``text`` that does not vary between processes."""
+    digest = hashlib.blake2b(text.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+# Symmetry -----------------------------------------------------------------
+#
+# A board symmetry is a permutation ``perm`` of the squares: the piece on
+# square ``s`` moves to ``perm[s]``.  Zobrist keys of every symmetric image of
+# a position can then be computed in one pass over its pieces, and the
+# smallest one serves as the key of the whole equivalence class.
+
+
+def grid_symmetries(rows: int, cols: int, transforms: Iterable[int] = range(8)) -> List[List[int]]:
+    """Square permutations of a ``rows`` x ``cols`` grid numbered ``r * cols + c``.
+
+    Transforms are numbered: 0 identity, 1-3 rotations by 90, 180 and 270
+    degrees, 4 left-right mirror, 5 top-bottom mirror, 6 transpose and 7
+    anti-transpose.  Rotations by 90 degrees and transposes need a square grid.
+    """
+    n = rows - 1
+    m = cols - 1
+    images = [
+        lambda r, c: (r, c),
+        lambda r, c: (c, n - r),
+        lambda r, c: (n - r, m - c),
+        lambda r, c: (m - c, r),
+        lambda r, c: (r, m - c),
+        lambda r, c: (n - r, c),
+        lambda r, c: (c, r),
+        lambda r, c: (m - c, n - r),
+    ]
+    perms = []
+    for t in transforms:
+        if t in (1, 3, 6, 7) and rows != cols:
+            raise ValueError("Transform needs a square grid")
+        perm = []
+        for r in range(rows):
+            for c in range(cols):
+                ir, ic = images[t](r, c)
+                perm.append(ir * cols + ic)
+        perms.append(perm)
+    return perms
+
+
+def inverse_permutations(perms: List[List[int]]) -> List[List[int]]:
+    inverses = []
+    for perm in perms:
+        inverse = [0] * len(perm)
+        for square, image in enumerate(perm):
+            inverse[image] = square
+        inverses.append(inverse)
+    return inverses
+
+
+def symmetry_table(table: List[List[int]], perms: List[List[int]]) -> List[List[Tuple[int, ...]]]:
+    """``result[square][value]``: the key of that piece's image under each permutation."""
+    return [[tuple(table[perm[square]][v] for perm in perms) for v in range(len(row))] for square, row in enumerate(table)]
+
+
+def canonical_key(
+    pieces: Iterable[Tuple[int, int]], table: List[List[Tuple[int, ...]]], base: int = 0
+) -> Tuple[int, int]:
+    """Smallest key over the symmetric images of a position, and its transform.
+
+    ``pieces`` are ``(square, value)`` pairs, ``table`` comes from
+    ``symmetry_table`` and ``base`` is XORed into every key (e.g. a side to
+    move key).  Ties go to the lowest transform, so symmetric positions keep
+    the identity.
+    """
+    keys = [base] * len(table[0][0])
+    for square, value in pieces:
+        keys = [k ^ z for k, z in zip(keys, table[square][value])]
+    best = min(keys)
+    return best, keys.index(best)
@@ -0,0 +1,74 @@
+"""Players that ask a language model for their moves.
+
+A ``Model`` turns a prompt into a reply.  ``LLMPlayer`` fills a prompt
+template from the game and its rendered state, sends it to the model and
+reads the first valid action out of the reply.  Tests and benchmarks plug in
+local fakes; real clients wrap an HTTP API behind the same two members.
+"""
+
+from __future__ import annotations
+
+import re
+from abc import ABC, abstractmethod
+from typing import Any, List
+
+from .base import Game, Player
+
+DEFAULT_TEMPLATE = (
+    "You are playing {game}. Current position:\n"
+    "{state}\n"
+    "Valid actions: {actions}\n"
+    "Reply with exactly one of the valid actions."
+)
+
+
+class Model(ABC):
+    """A text completion model identified by ``model_id``."""
+
+    model_id: str
+
+    @abstractmethod
+    def complete(self, prompt: str) -> str:
+        """Return the model's reply to `prompt`."""
+
+
+def build_prompt(template: str, game: Game, state: Any, actions: List[str], rendered: str | None = None) -> str:
+    """Fill ``{game}``, ``{state}`` and ``{actions}`` in `template`.
+
+    Pass `rendered` if the caller already has ``game.render(state)``.
+    """
+    if rendered is None:
+        rendered = game.render(state)
+    return template.format(game=type(game).__name__, state=rendered, actions=", ".join(actions))
+
+
+def parse_action(reply: str, actions: List[str]) -> str:
+    """Return the valid action in `reply`: the whole reply if it is one,
+    otherwise the earliest action appearing as a separate token."""
+    reply = reply.strip()
+    if reply in actions:
+        return reply
+    best = None
+    for action in actions:
+        match = re.search(rf"(?<![\w,]){re.escape(action)}(?![\w,])", reply)
+        if match and (best is None or (match.start(), -len(action)) < best[0]):
+            best = ((match.start(), -len(action)), action)
+    if best is None:
+        raise ValueError(f"Model reply contains no valid action: {reply!r}")
+    return best[1]
+
+
+class LLMPlayer(Player):
+    """Player that prompts ``model`` with ``template`` for every move."""
+
+    def __init__(self, model: Model, template: str = DEFAULT_TEMPLATE):
+        self.model = model
+        self.template = template
+
+    def select_action(self, game: Game, state: Any) -> str:
+        actions = game.valid_actions(state)
+        return self.ask(build_prompt(self.template, game, state, actions), actions)
+
+    def ask(self, prompt: str, actions: List[str]) -> str:
+        """Send a ready-made `prompt`; return the action chosen from `actions`."""
+        return parse_action(self.model.complete(prompt), actions)
@@ -0,0 +1,244 @@
+"""Cross-match batching of model requests.
+
+Concurrent matches each ask for one completion at a time, so an inference
+server sees a stream of single-prompt requests and pays its per-request
+overhead for every one.  ``BatchingModel`` sits between the players and a
+``BatchModel`` backend: prompts from every match queue up and a background
+thread sends them as one ``complete_batch`` call as soon as the queue
+reaches ``FlushPolicy.max_batch_size`` or its oldest prompt has waited
+``FlushPolicy.max_delay`` seconds.  Each reply is routed back to the caller
+that sent its prompt.
+
+``BatchingModel`` is itself a ``Model``, so ``LLMPlayer`` (and
+``CachingPlayer`` on top of it) batch transparently when matches run in
+threads.  Matches on an event loop use ``BatchedLLMPlayer``, which awaits the
+reply instead of blocking a thread.
+
+The flush thread stops once no prompt has arrived for
+``FlushPolicy.max_idle`` seconds, so it does not outlive the matches using
+it, and any model still running when the interpreter exits is closed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+from .base import AsyncPlayer, Game
+from .llm import DEFAULT_TEMPLATE, Model, build_prompt, parse_action
+
+
+class BatchModel(ABC):
+    """A model server that answers many prompts in one request."""
+
+    model_id: str
+
+    @abstractmethod
+    def complete_batch(self, prompts: List[str]) -> List[str]:
+        """Return one reply per prompt, in order."""
+
+
+@dataclass(frozen=True)
+class FlushPolicy:
+    """When queued prompts are sent: at ``max_batch_size`` prompts, or once
+    the oldest has waited ``max_delay`` seconds, whichever comes first.
+    The flush thread exits after ``max_idle`` seconds without prompts."""
+
+    max_batch_size: int = 32
+    max_delay: float = 0.01
+    max_idle: float = 1.0
+
+    def __post_init__(self):
+        if self.max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if self.max_delay < 0:
+            raise ValueError("max_delay must not be negative")
+        if self.max_idle <= 0:
+            raise ValueError("max_idle must be positive")
+
+
+@dataclass
+class BatchStats:
+    batches: int = 0
+    requests: int = 0
+    size_flushes: int = 0  # batches sent because they were full
+    total_delay: float = 0.0  # seconds prompts spent queued, summed
+    max_delay: float = 0.0
+    sizes: Counter = field(default_factory=Counter)  # batch size -> count
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.requests / self.batches if self.batches else 0.0
+
+    @property
+    def mean_delay(self) -> float:
+        return self.total_delay / self.requests if self.requests else 0.0
+
+
+_LIVE: "weakref.WeakSet[BatchingModel]" = weakref.WeakSet()  # closed at exit
+
+
+@atexit.register
+def _close_all() -> None:
+    """Send what is still queued before the flush threads are killed."""
+    for model in list(_LIVE):
+        model.close()
+
+
+class BatchingModel(Model):
+    """Queue prompts from many callers and send them to ``backend`` in batches.
+
+    Safe to call from any number of threads.  ``close`` (or leaving a
+    ``with`` block) sends whatever is still queued and stops the flush
+    thread; a later ``complete`` starts it again.
+
+    Copies made within a process (``play_match`` deep-copies players for
+    every match) are the model itself, so prompts from every match share one
+    queue and ``stats`` accumulate on the object the caller holds.  A model
+    pickled into a worker process gets its own queue there, and ``stats``
+    counting only that process's batches.
+    """
+
+    def __init__(self, backend: BatchModel, policy: FlushPolicy | None = None):
+        self.backend = backend
+        self.model_id = backend.model_id  # cached replies stay valid with or without batching
+        self.policy = FlushPolicy() if policy is None else policy
+        self.stats = BatchStats()
+        self._init_queue()
+
+    def _init_queue(self) -> None:
+        self._pending: List[Tuple[str, Future, float]] = []  # (prompt, reply, time queued)
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None  # the flush thread; cleared to stop it
+        _LIVE.add(self)
+
+    def __copy__(self) -> "BatchingModel":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "BatchingModel":
+        return self
+
+    # The queue and flush thread cannot follow a model into another process.
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        for name in ("_pending", "_cond", "_thread"):
+            del state[name]
+        state["stats"] = BatchStats()
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._init_queue()
+
+    def __enter__(self) -> "BatchingModel":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # Requests ---------------------------------------------------------
+
+    def submit(self, prompt: str) -> Future:
+        """Queue `prompt`; the returned future resolves to its reply."""
+        future: Future = Future()
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="arena-batcher", daemon=True)
+                self._thread.start()
+            self._pending.append((prompt, future, time.monotonic()))
+            # The flush thread only needs waking to start a deadline or
+            # to send a full batch early.
+            if len(self._pending) == 1 or len(self._pending) >= self.policy.max_batch_size:
+                self._cond.notify()
+        return future
+
+    def complete(self, prompt: str) -> str:
+        return self.submit(prompt).result()
+
+    async def acomplete(self, prompt: str) -> str:
+        return await asyncio.wrap_future(self.submit(prompt))
+
+    def close(self) -> None:
+        with self._cond:
+            thread = self._thread
+            if thread is None:
+                return
+            # The old thread drains the queue; a ``submit`` from here on
+            # starts a new one rather than racing its exit.
+            self._thread = None
+            self._cond.notify()
+        thread.join()
+
+    # Flushing ---------------------------------------------------------
+
+    def _run(self) -> None:
+        policy = self.policy
+        while True:
+            with self._cond:
+                closing = self._thread is not threading.current_thread()
+                while not self._pending and not closing:
+                    idle = not self._cond.wait(policy.max_idle)
+                    closing = self._thread is not threading.current_thread()
+                    if idle and not self._pending and not closing:
+                        self._thread = None  # the next ``submit`` starts a new thread
+                        return
+                if not self._pending:
+                    return
+                deadline = self._pending[0][2] + policy.max_delay
+                while len(self._pending) < policy.max_batch_size and not closing:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    self._cond.wait(timeout)
+                    closing = self._thread is not threading.current_thread()
+                batch = self._pending[: policy.max_batch_size]
+                del self._pending[: policy.max_batch_size]
+            self._send(batch)
+
+    def _send(self, batch: List[Tuple[str, Future, float]]) -> None:
+        now = time.monotonic()
+        delays = [now - queued for _, _, queued in batch]
+        # An old flush thread may still be draining after ``close`` while a
+        # new one runs, so the counters are only touched under the lock.
+        with self._cond:
+            stats = self.stats
+            stats.batches += 1
+            stats.requests += len(batch)
+            stats.sizes[len(batch)] += 1
+            if len(batch) == self.policy.max_batch_size:
+                stats.size_flushes += 1
+            stats.total_delay += sum(delays)
+            stats.max_delay = max(stats.max_delay, *delays)
+        try:
+            replies = self.backend.complete_batch([prompt for prompt, _, _ in batch])
+            if len(replies) != len(batch):
+                raise ValueError(f"Backend returned {len(replies)} replies for {len(batch)} prompts")
+        except Exception as e:
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+        for (_, future, _), reply in zip(batch, replies):
+            future.set_result(reply)
+
+
+class BatchedLLMPlayer(AsyncPlayer):
+    """``LLMPlayer`` for the event loop: awaits its reply from a shared
+    ``BatchingModel`` so hundreds of matches fill each batch."""
+
+    def __init__(self, model: BatchingModel, template: str = DEFAULT_TEMPLATE):
+        self.model = model
+        self.template = template
+
+    async def select_action(self, game: Game, state: Any) -> str:
+        actions = game.valid_actions(state)
+        reply = await self.model.acomplete(build_prompt(self.template, game, state, actions))
+        return parse_action(reply, actions)
@@ -0,0 +1,292 @@
+"""Two-tier cache of model decisions, shared between processes.
+
+Tournaments replay the same openings against the same models many times.
+``CachingPlayer`` wraps an ``LLMPlayer`` and looks each decision up by a key
+built from the model id, the prompt template, the game class and the
+rendered state before paying for a model call.
+
+``ResponseCache`` keeps recent entries in an in-process LRU and, given a
+path, every entry in a SQLite database.  The database runs in WAL mode with
+a busy timeout, so any number of worker processes can read and write the
+same file at once; each process opens its own connection on first use,
+including after a fork.  Entries expire ``max_age`` seconds after they were
+written, and the least recently used ones are evicted once a tier holds more
+than its limit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Tuple
+
+from .base import Game, Player
+from .llm import LLMPlayer, build_prompt
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+"""
+
+
+def cache_key(model_id: str, template: str, game: Game, rendered: str) -> str:
+    """Key of a decision; stable across processes and runs."""
+    game_class = f"{type(game).__module__}.{type(game).__qualname__}"
+    text = "\x1f".join((model_id, template, game_class, rendered))
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    stale: int = 0  # entries found but rejected by the caller, counted as misses too
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """In-memory LRU in front of an optional SQLite file.
+
+    ``memory_entries`` and ``max_entries`` bound the two tiers.  The disk
+    tier is trimmed every ``evict_every`` writes rather than on each one,
+    so it may briefly hold a few entries more than ``max_entries``.
+    ``max_age`` (seconds, None for no limit) applies to both tiers.
+
+    Copies made within a process (``play_match`` deep-copies players for
+    every match) are the cache itself, so entries and ``stats`` accumulate
+    on the object the caller holds.  A cache pickled into a worker process
+    is a new object there, with the memory tier as it was and ``stats``
+    counting only that process's lookups; it shares just the disk tier.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        memory_entries: int = 4096,
+        max_entries: int | None = 1_000_000,
+        max_age: float | None = None,
+        evict_every: int = 256,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = None if path is None else os.path.abspath(path)
+        self.memory_entries = memory_entries
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.evict_every = evict_every
+        self.clock = clock
+        self.stats = CacheStats()
+        self._memory: OrderedDict[str, Tuple[str, float]] = OrderedDict()  # key -> (value, created)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid = 0
+        self._writes = 0
+
+    def __copy__(self) -> "ResponseCache":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ResponseCache":
+        return self
+
+    # Connections and locks cannot follow a cache into another process, so
+    # they are reopened on demand.
+
+    def __getstate__(self) -> Dict[str, Any]:
+        with self._lock:
+            state = self.__dict__.copy()
+            state["_memory"] = self._memory.copy()
+        state["_lock"] = state["_conn"] = None
+        state["stats"] = CacheStats()
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    # Lookups ----------------------------------------------------------
+
+    def get(self, key: str, accept: Callable[[str], bool] | None = None) -> str | None:
+        """Return the value cached for `key`, or None on a miss.
+
+        A value failing ``accept`` is dropped from both tiers and counted as
+        stale, so the caller can recompute and ``put`` a fresh one.
+        """
+        with self._lock:
+            now = self.clock()
+            value = self._memory_get(key, now)
+            tier = "memory"
+            if value is None and self.path is not None:
+                value = self._disk_get(key, now)
+                tier = "disk"
+            if value is not None and accept is not None and not accept(value):
+                self.stats.stale += 1
+                self._delete(key)
+                value = None
+            if value is None:
+                self.stats.misses += 1
+            elif tier == "memory":
+                self.stats.memory_hits += 1
+            else:
+                self.stats.disk_hits += 1
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        with self._lock:
+            now = self.clock()
+            self._memory_put(key, value, now)
+            if self.path is None:
+                return
+            conn = self._connection()
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)", (key, value, now, now))
+            self._writes += 1
+            if self._writes % self.evict_every == 0:
+                self._evict_disk(now)
+
+    def evict(self) -> int:
+        """Drop expired and surplus entries from both tiers; return how many
+        disk entries were removed."""
+        with self._lock:
+            now = self.clock()
+            if self.max_age is not None:
+                for key in [k for k, (_, created) in self._memory.items() if now - created > self.max_age]:
+                    del self._memory[key]
+                    self.stats.evictions += 1
+            return self._evict_disk(now) if self.path is not None else 0
+
+    def __len__(self) -> int:
+        """Number of entries in the largest tier."""
+        with self._lock:
+            if self.path is None:
+                return len(self._memory)
+            return self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self.path is not None:
+                conn = self._connection()
+                with conn:
+                    conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    # Tiers ------------------------------------------------------------
+
+    def _memory_get(self, key: str, now: float) -> str | None:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        if self.max_age is not None and now - entry[1] > self.max_age:
+            del self._memory[key]
+            self.stats.evictions += 1
+            return None
+        self._memory.move_to_end(key)
+        return entry[0]
+
+    def _memory_put(self, key: str, value: str, created: float) -> None:
+        self._memory[key] = (value, created)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _disk_get(self, key: str, now: float) -> str | None:
+        conn = self._connection()
+        row = conn.execute("SELECT value, created FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, created = row
+        with conn:
+            if self.max_age is not None and now - created > self.max_age:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.stats.evictions += 1
+                return None
+            conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        # Promote, keeping the original write time so the entry ages out on schedule.
+        self._memory_put(key, value, created)
+        return value
+
+    def _delete(self, key: str) -> None:
+        self._memory.pop(key, None)
+        if self.path is not None:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def _evict_disk(self, now: float) -> int:
+        conn = self._connection()
+        removed = 0
+        with conn:
+            if self.max_age is not None:
+                removed += conn.execute("DELETE FROM responses WHERE created < ?", (now - self.max_age,)).rowcount
+            if self.max_entries is not None:
+                removed += conn.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                ).rowcount
+        self.stats.evictions += removed
+        return removed
+
+    def _connection(self) -> sqlite3.Connection:
+        pid = os.getpid()
+        if self._conn is None or self._pid != pid:
+            # A connection inherited through fork must not be used (or closed)
+            # by the child; just open a new one.
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn, self._pid = conn, pid
+        return self._conn
+
+
+class CachingPlayer(Player):
+    """Answer repeated positions from ``cache`` instead of asking the model.
+
+    A cached action that is not valid in the current state (two states can
+    render alike) is treated as a miss and replaced.
+    """
+
+    def __init__(self, player: LLMPlayer, cache: ResponseCache | None = None):
+        self.player = player
+        self.cache = ResponseCache() if cache is None else cache
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.cache.stats
+
+    def select_action(self, game: Game, state: Any) -> str:
+        player = self.player
+        actions = game.valid_actions(state)
+        rendered = game.render(state)
+        key = cache_key(player.model.model_id, player.template, game, rendered)
+        action = self.cache.get(key, accept=lambda a: a in actions)
+        if action is None:
+            action = player.ask(build_prompt(player.template, game, state, actions, rendered), actions)
+            self.cache.put(key, action)
+        return action
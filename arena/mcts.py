@@ -0,0 +1,209 @@
+"""Monte Carlo Tree Search player."""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+from .base import Game, Player
+
+
+class _Node:
+    __slots__ = ("state", "player", "parent", "children", "untried", "visits", "wins")
+
+    def __init__(self, game: Game, state: Any, parent: "_Node | None", rng: random.Random):
+        self.state = state
+        self.parent = parent
+        self.children: Dict[str, _Node] = {}
+        self.visits = 0
+        # Results for the player who moved into this node (the parent's player).
+        self.wins = 0.0
+        if game.is_terminal(state):
+            self.player: int | None = None
+            self.untried: List[str] = []
+        else:
+            self.player = game.current_player(state)
+            self.untried = game.valid_actions(state)
+            rng.shuffle(self.untried)
+
+
+def _search(
+    game: Game,
+    root: _Node,
+    deadline: float,
+    max_playouts: float,
+    rng: random.Random,
+    exploration: float,
+    max_rollout: int,
+) -> int:
+    """Run UCT iterations from ``root`` until ``deadline`` or ``max_playouts``;
+    return the playout count."""
+    playouts = 0
+    while playouts < max_playouts and time.perf_counter() < deadline:
+        node = root
+        # Selection
+        while not node.untried and node.children:
+            log_n = math.log(node.visits)
+            node = max(
+                node.children.values(),
+                key=lambda c: c.wins / c.visits + exploration * math.sqrt(log_n / c.visits),
+            )
+        # Expansion
+        if node.untried:
+            action = node.untried.pop()
+            child = _Node(game, game.apply_action(node.state, action), node, rng)
+            node.children[action] = child
+            node = child
+        # Rollout
+        state = node.state
+        for _ in range(max_rollout):
+            if game.is_terminal(state):
+                break
+            actions = game.valid_actions(state)
+            if not actions:
+                break  # stuck without a result; scored as a draw
+            state = game.apply_action(state, rng.choice(actions))
+        winner = game.get_winner(state) if game.is_terminal(state) else None
+        # Backpropagation
+        while node.parent is not None:
+            node.visits += 1
+            if winner is None:
+                node.wins += 0.5
+            elif winner == node.parent.player:
+                node.wins += 1.0
+            node = node.parent
+        node.visits += 1
+        playouts += 1
+    return playouts
+
+
+def _search_worker(
+    game: Game, state: Any, time_limit: float, max_playouts: float, seed: int, exploration: float, max_rollout: int
+) -> Tuple[Dict[str, int], int]:
+    """Search a fresh tree in a worker process and report root visit counts."""
+    rng = random.Random(seed)
+    root = _Node(game, state, None, rng)
+    playouts = _search(game, root, time.perf_counter() + time_limit, max_playouts, rng, exploration, max_rollout)
+    return {action: child.visits for action, child in root.children.items()}, playouts
+
+
+class MCTSPlayer(Player):
+    """UCT search with random rollouts.
+
+    The tree is kept between moves: on the next call the player looks for the
+    current position among the grandchildren of its last root and continues
+    from there.  With ``workers > 1`` the same position is also searched by
+    ``workers - 1`` processes with independent trees (root parallelism) and
+    their root visit counts are added to the local ones.  Requires
+    ``Game.current_player``.  After each move ``playouts`` and
+    ``playouts_per_second`` report the search throughput.
+
+    Each search stops after ``time_limit`` seconds or ``max_playouts``
+    playouts (per process), whichever comes first; either may be None.
+    With a playout budget and a seed, moves do not depend on machine speed.
+
+    The worker pool is started on the first move and shut down by ``close``,
+    by leaving a ``with`` block, or when the player is dropped.
+    """
+
+    def __init__(
+        self,
+        time_limit: float | None = 1.0,
+        exploration: float = math.sqrt(2),
+        workers: int = 1,
+        max_rollout: int = 1000,
+        seed: int | None = None,
+        max_playouts: int | None = None,
+    ):
+        if time_limit is None and max_playouts is None:
+            raise ValueError("Set time_limit, max_playouts or both")
+        self.time_limit = time_limit
+        self.max_playouts = max_playouts
+        self.exploration = exploration
+        self.workers = workers
+        self.max_rollout = max_rollout
+        self.rng = random.Random(seed)
+        self.playouts = 0
+        self.playouts_per_second = 0.0
+        self.reused_visits = 0
+        self._game: Game | None = None
+        self._root: _Node | None = None
+        self._pool: ProcessPoolExecutor | None = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pools and trees stay with the process that built them.
+        state = self.__dict__.copy()
+        state.update(_game=None, _root=None, _pool=None)
+        return state
+
+    def __enter__(self) -> "MCTSPlayer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # Per-match copies (see ``play_match``) are dropped without a close.
+        pool = self.__dict__.get("_pool")
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def select_action(self, game: Game, state: Any) -> str:
+        root = self._reroot(game, state)
+        self.reused_visits = root.visits
+        start = time.perf_counter()
+        time_limit = math.inf if self.time_limit is None else self.time_limit
+        max_playouts = math.inf if self.max_playouts is None else self.max_playouts
+        futures = []
+        if self.workers > 1:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers - 1)
+            futures = [
+                self._pool.submit(
+                    _search_worker,
+                    game,
+                    state,
+                    time_limit,
+                    max_playouts,
+                    self.rng.getrandbits(32),
+                    self.exploration,
+                    self.max_rollout,
+                )
+                for _ in range(self.workers - 1)
+            ]
+        playouts = _search(game, root, start + time_limit, max_playouts, self.rng, self.exploration, self.max_rollout)
+        counts = {action: child.visits for action, child in root.children.items()}
+        for future in futures:
+            visits, worker_playouts = future.result()
+            playouts += worker_playouts
+            for action, n in visits.items():
+                counts[action] = counts.get(action, 0) + n
+        elapsed = time.perf_counter() - start
+        self.playouts = playouts
+        self.playouts_per_second = playouts / elapsed if elapsed > 0 else 0.0
+
+        if not counts:
+            return game.valid_actions(state)[0]
+        action = max(counts, key=counts.__getitem__)
+        self._root = root.children.get(action)
+        return action
+
+    def _reroot(self, game: Game, state: Any) -> _Node:
+        """Return the subtree for ``state`` from the previous search, or a new root."""
+        if game is self._game and self._root is not None:
+            key = game.state_key(state)
+            candidates = [self._root, *self._root.children.values()]
+            for node in candidates:
+                if game.state_key(node.state) == key:
+                    node.parent = None
+                    return node
+        self._game = game
+        return _Node(game, state, None, self.rng)
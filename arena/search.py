@@ -0,0 +1,256 @@
+"""Game-agnostic alpha-beta search player."""
+
+from __future__ import annotations
+
+import copy
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from .base import Game, Player
+from .games.connect_four import ConnectFour
+from .games.mini_chess import MiniChess
+from .games.othello import Othello
+from .games.quoridor import Quoridor
+
+# Score of a won position; wins found sooner score higher.
+WIN = 1_000_000.0
+# Scores beyond this are wins or losses; no search gets near this many plies.
+_WIN_BOUND = WIN - 10_000
+
+Evaluator = Callable[[Game, Any, int], float]
+
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+
+
+class _Timeout(Exception):
+    pass
+
+
+def connect_four_eval(game: ConnectFour, state: Any, player: int) -> float:
+    """Favour stones in the central columns."""
+    own, opp = (state.x, state.o) if player == 0 else (state.o, state.x)
+    column = (1 << game.rows) - 1
+    centre = (game.cols - 1) / 2
+    score = 0.0
+    for c in range(game.cols):
+        mask = column << (c * game.height)
+        weight = game.cols - abs(c - centre)
+        score += weight * ((own & mask).bit_count() - (opp & mask).bit_count())
+    return score
+
+
+def othello_eval(game: Othello, state: Any, player: int) -> float:
+    """Corners, then mobility, then a little disc count."""
+    n = game.size
+    corners = (1 << 0) | (1 << (n - 1)) | (1 << (n * (n - 1))) | (1 << (n * n - 1))
+    own, opp = (state.x, state.o) if player == 0 else (state.o, state.x)
+    mobility = game._move_mask(own, opp).bit_count() - game._move_mask(opp, own).bit_count()
+    corner_diff = (own & corners).bit_count() - (opp & corners).bit_count()
+    return 25.0 * corner_diff + 2.0 * mobility + (own.bit_count() - opp.bit_count()) * 0.1
+
+
+_PIECE_VALUES = {"P": 1.0, "N": 3.0, "B": 3.0, "R": 5.0, "Q": 9.0, "K": 0.0}
+_PIECE_VALUES.update({p.lower(): -v for p, v in _PIECE_VALUES.items()})
+_PIECE_VALUES[" "] = 0.0
+
+
+def mini_chess_eval(game: MiniChess, state: Any, player: int) -> float:
+    """Material balance."""
+    score = sum(map(_PIECE_VALUES.__getitem__, state.squares))
+    return score if player == 0 else -score
+
+
+def quoridor_eval(game: Quoridor, state: Any, player: int) -> float:
+    """Race: the opponent's distance to goal minus ours, then spare walls."""
+    distances = game.distances(state)
+    walls = state["remaining"]
+    return 10.0 * (distances[1 - player] - distances[player]) + (walls[player] - walls[1 - player])
+
+
+EVALUATORS: Dict[type, Evaluator] = {
+    ConnectFour: connect_four_eval,
+    Othello: othello_eval,
+    MiniChess: mini_chess_eval,
+    Quoridor: quoridor_eval,
+}
+
+
+class SearchPlayer(Player):
+    """Negamax alpha-beta with iterative deepening under a time budget.
+
+    ``time_limit`` of None searches every depth up to ``max_depth``, which
+    makes the result independent of machine speed.
+
+    Works with any game implementing ``current_player``.  Leaf positions are
+    scored by ``evaluate(game, state, player)`` from ``player``'s point of
+    view; when none is given the one registered in ``EVALUATORS`` for the
+    game's class is used, falling back to 0 (search for forced results only).
+    Positions are cached in a fixed-size transposition table of
+    ``2 ** table_bits`` slots keyed by ``Game.state_key``.  With
+    ``make_unmake`` games that implement ``Game.push``/``pop`` are searched in
+    place on a private copy of the position instead of allocating a state per
+    node; this pays off for games with large states, not bitboards.
+    """
+
+    def __init__(
+        self,
+        time_limit: float | None = 1.0,
+        max_depth: int = 64,
+        evaluate: Evaluator | None = None,
+        table_bits: int = 18,
+        make_unmake: bool = False,
+    ):
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.evaluate = evaluate
+        self.make_unmake = make_unmake
+        self._in_place = False
+        self.table_mask = (1 << table_bits) - 1
+        self.table: List[Tuple[int, int, float, int, str] | None] = [None] * (1 << table_bits)
+        self.history: Dict[str, int] = {}
+        self.nodes = 0
+        self.depth_reached = 0
+        self.score = 0.0  # root score of the last completed iteration
+
+    def select_action(self, game: Game, state: Any) -> str:
+        actions = game.valid_actions(state)
+        if len(actions) == 1:
+            return actions[0]
+        evaluate = self.evaluate or EVALUATORS.get(type(game), lambda g, s, p: 0.0)
+        self._in_place = self.make_unmake and game.supports_push()
+        if self._in_place:
+            state = copy.deepcopy(state)
+        self._deadline = float("inf") if self.time_limit is None else time.perf_counter() + self.time_limit
+        self.nodes = 0
+        self.depth_reached = 0
+        self.score = 0.0
+        best = actions[0]
+        for depth in range(1, self.max_depth + 1):
+            try:
+                score, action = self._root(game, state, actions, depth, evaluate)
+            except _Timeout:
+                break
+            best = action
+            self.depth_reached = depth
+            self.score = score
+            if abs(score) >= WIN - self.max_depth:
+                break  # forced result found
+        return best
+
+    def _root(self, game: Game, state: Any, actions: List[str], depth: int, evaluate: Evaluator) -> Tuple[float, str]:
+        me = game.current_player(state)
+        alpha, beta = -float("inf"), float("inf")
+        best_action = actions[0]
+        for action in self._order(game, state, actions):
+            child = self._child(game, state, action)
+            if game.current_player(child) == me:
+                score = self._negamax(game, child, depth - 1, alpha, beta, 1, evaluate)
+            else:
+                score = -self._negamax(game, child, depth - 1, -beta, -alpha, 1, evaluate)
+            if self._in_place:
+                game.pop(state)
+            if score > alpha:
+                alpha = score
+                best_action = action
+        self._store(game.state_key(state), depth, alpha, _EXACT, best_action, 0)
+        return alpha, best_action
+
+    def _negamax(
+        self, game: Game, state: Any, depth: int, alpha: float, beta: float, ply: int, evaluate: Evaluator
+    ) -> float:
+        self.nodes += 1
+        if self.nodes & 63 == 0 and time.perf_counter() > self._deadline:
+            raise _Timeout
+        me = game.current_player(state)
+        if game.is_terminal(state):
+            winner = game.get_winner(state)
+            if winner is None:
+                return 0.0
+            return WIN - ply if winner == me else -(WIN - ply)
+        if depth <= 0:
+            return evaluate(game, state, me)
+
+        key = game.state_key(state)
+        entry = self.table[key & self.table_mask]
+        if entry is not None and entry[0] == key and entry[1] >= depth:
+            _, _, value, flag, _ = entry
+            value = _from_table(value, ply)
+            if flag == _EXACT:
+                return value
+            if flag == _LOWER and value >= beta:
+                return value
+            if flag == _UPPER and value <= alpha:
+                return value
+
+        original_alpha = alpha
+        best = -float("inf")
+        best_action = ""
+        for action in self._order(game, state, game.valid_actions(state)):
+            child = self._child(game, state, action)
+            if game.current_player(child) == me:
+                score = self._negamax(game, child, depth - 1, alpha, beta, ply + 1, evaluate)
+            else:
+                score = -self._negamax(game, child, depth - 1, -beta, -alpha, ply + 1, evaluate)
+            if self._in_place:
+                game.pop(state)
+            if score > best:
+                best = score
+                best_action = action
+            if best > alpha:
+                alpha = best
+            if alpha >= beta:
+                self.history[action] = self.history.get(action, 0) + depth * depth
+                break
+
+        if best <= original_alpha:
+            flag = _UPPER
+        elif best >= beta:
+            flag = _LOWER
+        else:
+            flag = _EXACT
+        self._store(key, depth, best, flag, best_action, ply)
+        return best
+
+    def _child(self, game: Game, state: Any, action: str) -> Any:
+        # A timeout between push and pop leaves the private copy dirty, which
+        # is fine: the search is abandoned with it.
+        if self._in_place:
+            game.push(state, action)
+            return state
+        return game.apply_action(state, action)
+
+    def _order(self, game: Game, state: Any, actions: List[str]) -> List[str]:
+        """Transposition-table move first, then by history score."""
+        key = game.state_key(state)
+        entry = self.table[key & self.table_mask]
+        tt_action = entry[4] if entry is not None and entry[0] == key else None
+        history = self.history
+        return sorted(actions, key=lambda a: (a != tt_action, -history.get(a, 0)))
+
+    def _store(self, key: int, depth: int, value: float, flag: int, action: str, ply: int) -> None:
+        slot = key & self.table_mask
+        entry = self.table[slot]
+        # Depth-preferred, but always overwrite entries for other positions.
+        if entry is None or entry[0] != key or entry[1] <= depth:
+            self.table[slot] = (key, depth, _to_table(value, ply), flag, action)
+
+
+# Win scores count plies from the root, but a position can be reached at
+# different plies.  The table stores them counted from the position itself
+# and converts back on a hit, so a reused win keeps its true distance.
+
+
+def _to_table(value: float, ply: int) -> float:
+    if value >= _WIN_BOUND:
+        return value + ply
+    if value <= -_WIN_BOUND:
+        return value - ply
+    return value
+
+
+def _from_table(value: float, ply: int) -> float:
+    if value >= _WIN_BOUND:
+        return value - ply
+    if value <= -_WIN_BOUND:
+        return value + ply
+    return value
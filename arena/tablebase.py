@@ -0,0 +1,370 @@
+"""Retrograde solver and memory-mapped tablebases for small games.
+
+``Tablebase.build`` enumerates every position reachable from the game's
+start (or from given roots), then solves them backwards from the terminal
+positions: exact win/draw/loss for the player to move and the distance to
+the end of the game with best play (fastest win, slowest loss, shortest
+drawn line).  Works with any game implementing ``Game.current_player``,
+including games with extra turns; positions never resolved (cycles) are
+draws.
+
+Positions are indexed by ``Game.state_key`` through a perfect hash
+(hash-and-displace: keys are split into buckets, and each bucket stores the
+seed that sends its keys to distinct slots).  The file holds
+
+* a header (magic, version, byte order, game class, sizes),
+* ``uint32`` bucket displacements,
+* 2-bit results packed four to a byte,
+* an 8-bit key fingerprint per slot, so most unknown positions are detected,
+* an 8- or 16-bit distance per slot.
+
+``Tablebase.open`` memory-maps a saved file, so worker processes reading the
+same tablebase share one copy through the page cache.
+"""
+
+from __future__ import annotations
+
+import heapq
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple
+
+from .base import Game
+
+_MAGIC = b"ATBL"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBBBxIII")  # magic, version, big-endian flag, distance bytes, name bytes, slots, buckets
+_BIG_ENDIAN = sys.byteorder == "big"
+_MASK64 = (1 << 64) - 1
+_SINGLETON = 1 << 31  # displacement flag: the bucket's only key sits in the slot given by the low bits
+
+# 2-bit codes; 0 marks an empty slot.
+WIN, DRAW, LOSS = 1, 2, 3
+RESULTS = {WIN: "win", DRAW: "draw", LOSS: "loss"}
+_FLIP = {WIN: LOSS, DRAW: DRAW, LOSS: WIN}
+
+
+class Entry(NamedTuple):
+    result: str  # "win", "draw" or "loss" for the player to move
+    distance: int  # plies to the end of the game with best play
+
+
+@dataclass
+class BuildStats:
+    """Progress and totals of a tablebase build.
+
+    ``progress`` callbacks receive the same object while it is being filled
+    in; ``phase`` is "enumerate", "solve", "index" or "done".
+    """
+
+    phase: str = "enumerate"
+    positions: int = 0
+    terminal: int = 0
+    edges: int = 0
+    solved: int = 0
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+    max_distance: int = 0
+    enumerate_seconds: float = 0.0
+    solve_seconds: float = 0.0
+    index_seconds: float = 0.0
+    size_bytes: int = 0
+
+    @property
+    def positions_per_second(self) -> float:
+        seconds = self.enumerate_seconds + self.solve_seconds + self.index_seconds
+        return self.positions / seconds if seconds else 0.0
+
+
+Progress = Callable[[BuildStats], None]
+
+
+def _mix(key: int, seed: int) -> int:
+    """splitmix64 finaliser of ``key`` under ``seed``."""
+    z = (key + (seed + 1) * 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def _padded(size: int) -> int:
+    return (size + 3) & ~3
+
+
+class Tablebase:
+    """Solved positions of one game, looked up by ``Game.state_key``."""
+
+    def __init__(self, buffer: bytes | mmap.mmap):
+        self._buffer = buffer
+        view = memoryview(buffer)
+        magic, version, big_endian, width, name_size, slots, buckets = _HEADER.unpack_from(view)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not a tablebase file")
+        pos = _HEADER.size
+        self.game_name = view[pos : pos + name_size].tobytes().decode("utf-8")
+        pos += _padded(name_size)
+        self.slots = slots
+        self._displacements = view[pos : pos + 4 * buckets].cast("I")
+        pos += 4 * buckets
+        if bool(big_endian) != _BIG_ENDIAN:  # built on another platform: copy and swap
+            self._displacements = array("I", self._displacements.tobytes())
+            self._displacements.byteswap()
+        self._results = view[pos : pos + (slots + 3) // 4]
+        pos += _padded((slots + 3) // 4)
+        self._fingerprints = view[pos : pos + slots]
+        pos += _padded(slots)
+        self._distances = view[pos : pos + width * slots].cast("B" if width == 1 else "H")
+        if width == 2 and bool(big_endian) != _BIG_ENDIAN:
+            self._distances = array("H", self._distances.tobytes())
+            self._distances.byteswap()
+        self.stats: BuildStats | None = None  # set by build
+
+    # Construction -----------------------------------------------------
+
+    @classmethod
+    def build(
+        cls,
+        game: Game,
+        roots: Iterable[Any] | None = None,
+        progress: Progress | None = None,
+        progress_every: int = 10_000,
+    ) -> "Tablebase":
+        """Solve every position reachable from ``roots`` (default: the start).
+
+        A non-terminal position without legal actions is scored like a
+        terminal one, by ``get_winner``.
+        """
+        if not game.tracks_player():
+            raise TypeError(f"{type(game).__name__} does not implement current_player")
+        stats = BuildStats()
+        report = progress or (lambda stats: None)
+
+        # Enumerate reachable positions breadth-first.
+        start = time.perf_counter()
+        index: Dict[int, int] = {}
+        keys: List[int] = []
+        movers = bytearray()
+        children: List[List[int]] = []
+        terminal: List[int] = []
+        outcomes: Dict[int, int] = {}
+        queue: deque = deque()
+        for root in [game.reset()] if roots is None else roots:
+            key = game.state_key(root)
+            if key not in index:
+                index[key] = len(keys)
+                keys.append(key)
+                children.append([])
+                queue.append((len(keys) - 1, root))
+        while queue:
+            i, state = queue.popleft()  # positions are expanded in index order
+            movers.append(game.current_player(state))
+            ids = [] if game.is_terminal(state) else game.legal_action_ids(state)
+            if not ids:
+                winner = game.get_winner(state)
+                outcomes[i] = DRAW if winner is None else WIN if winner == movers[i] else LOSS
+                terminal.append(i)
+            for action_id in ids:
+                child = game.apply_action_id(state, action_id)
+                key = game.state_key(child)
+                j = index.get(key)
+                if j is None:
+                    j = index[key] = len(keys)
+                    keys.append(key)
+                    children.append([])
+                    queue.append((j, child))
+                children[i].append(j)
+            stats.positions = len(keys)
+            stats.edges += len(ids)
+            if len(movers) % progress_every == 0:
+                report(stats)
+        stats.terminal = len(terminal)
+        stats.enumerate_seconds = time.perf_counter() - start
+
+        stats.phase = "solve"
+        report(stats)
+        start = time.perf_counter()
+        results, distances = cls._solve(children, movers, terminal, outcomes, stats, report, progress_every)
+        stats.solve_seconds = time.perf_counter() - start
+
+        stats.phase = "index"
+        report(stats)
+        start = time.perf_counter()
+        buffer = cls._pack(type(game).__name__, keys, results, distances)
+        stats.index_seconds = time.perf_counter() - start
+        stats.size_bytes = len(buffer)
+        stats.phase = "done"
+        report(stats)
+        tablebase = cls(buffer)
+        tablebase.stats = stats
+        return tablebase
+
+    @staticmethod
+    def _solve(children, movers, terminal, outcomes, stats, report, progress_every):
+        n = len(children)
+        parents: List[List[int]] = [[] for _ in range(n)]
+        for i, kids in enumerate(children):
+            for j in kids:
+                parents[j].append(i)
+        results = bytearray(n)
+        distances = [0] * n
+        remaining = [len(kids) for kids in children]
+        longest = [0] * n  # plies to the end through the slowest losing child
+        shortest_draw = [-1] * n  # plies to the end through the shortest drawn child
+        heap = []
+        for i in terminal:
+            results[i] = outcomes[i]
+            heap.append((0, i))
+        heapq.heapify(heap)
+        # Resolve positions in order of distance, so the first losing child
+        # found gives a position its fastest win.
+        while heap:
+            d, c = heapq.heappop(heap)
+            stats.solved += 1
+            if stats.solved % progress_every == 0:
+                report(stats)
+            for p in parents[c]:
+                if results[p]:
+                    continue
+                value = results[c] if movers[c] == movers[p] else _FLIP[results[c]]
+                if value == WIN:
+                    results[p] = WIN
+                    distances[p] = d + 1
+                    heapq.heappush(heap, (d + 1, p))
+                    continue
+                if value == DRAW and (shortest_draw[p] < 0 or d + 1 < shortest_draw[p]):
+                    shortest_draw[p] = d + 1
+                elif value == LOSS and d + 1 > longest[p]:
+                    longest[p] = d + 1
+                remaining[p] -= 1
+                if remaining[p] == 0:
+                    if shortest_draw[p] >= 0:
+                        results[p], distances[p] = DRAW, shortest_draw[p]
+                    else:
+                        results[p], distances[p] = LOSS, longest[p]
+                    heapq.heappush(heap, (distances[p], p))
+        for i in range(n):
+            if not results[i]:  # only reachable through cycles
+                results[i] = DRAW
+        stats.wins = results.count(WIN)
+        stats.draws = results.count(DRAW)
+        stats.losses = results.count(LOSS)
+        stats.max_distance = max(distances, default=0)
+        return results, distances
+
+    @staticmethod
+    def _pack(name: str, keys: List[int], results: bytearray, distances: List[int]) -> bytes:
+        n = len(keys)
+        slots = max(n, 1)
+        buckets = max(n // 2, 1)
+        members: List[List[int]] = [[] for _ in range(buckets)]
+        for i, key in enumerate(keys):
+            members[_mix(key, 0) % buckets].append(i)
+        displacements = array("I", bytes(4 * buckets))
+        slot_of = [0] * n
+        taken = bytearray(slots)
+        # Place the largest buckets first, while most slots are still free.
+        order = sorted(range(buckets), key=lambda b: -len(members[b]))
+        free = iter(range(slots))
+        for b in order:
+            bucket = members[b]
+            if len(bucket) > 1:
+                seed = 0
+                while True:
+                    targets = [_mix(keys[i], seed + 1) % slots for i in bucket]
+                    if len(set(targets)) == len(targets) and not any(taken[t] for t in targets):
+                        break
+                    seed += 1
+                displacements[b] = seed
+            elif bucket:
+                # Singletons go straight into the next free slot.
+                target = next(s for s in free if not taken[s])
+                targets = [target]
+                displacements[b] = _SINGLETON | target
+            else:
+                continue
+            for i, t in zip(bucket, targets):
+                taken[t] = 1
+                slot_of[i] = t
+
+        packed = bytearray((slots + 3) // 4)
+        fingerprints = bytearray(slots)
+        width = 1 if max(distances, default=0) < 256 else 2
+        slot_distances = array("B" if width == 1 else "H", bytes(width * slots))
+        for i, key in enumerate(keys):
+            s = slot_of[i]
+            packed[s >> 2] |= results[i] << (2 * (s & 3))
+            fingerprints[s] = _mix(key, 0) >> 56
+            slot_distances[s] = distances[i]
+
+        name_bytes = name.encode("utf-8")
+        parts = [
+            _HEADER.pack(_MAGIC, _VERSION, _BIG_ENDIAN, width, len(name_bytes), slots, buckets),
+            name_bytes.ljust(_padded(len(name_bytes)), b"\0"),
+            displacements.tobytes(),
+            bytes(packed).ljust(_padded(len(packed)), b"\0"),
+            bytes(fingerprints).ljust(_padded(slots), b"\0"),
+            slot_distances.tobytes(),
+        ]
+        return b"".join(parts)
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        with open(path, "wb") as f:
+            f.write(self._buffer)
+
+    @classmethod
+    def open(cls, path: str | os.PathLike[str]) -> "Tablebase":
+        """Memory-map a tablebase written by ``save``, cached per path."""
+        key = os.path.abspath(path)
+        tablebase = _OPEN.get(key)
+        if tablebase is None:
+            with open(key, "rb") as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            tablebase = _OPEN[key] = cls(buffer)
+        return tablebase
+
+    # Lookups ----------------------------------------------------------
+
+    def lookup(self, game: Game, state: Any) -> Entry | None:
+        """Result for the player to move in ``state``, or None if not stored."""
+        if type(game).__name__ != self.game_name:
+            raise ValueError(f"Tablebase is for {self.game_name}, not {type(game).__name__}")
+        key = game.state_key(state)
+        h = _mix(key, 0)
+        displacement = self._displacements[h % len(self._displacements)]
+        if displacement & _SINGLETON:
+            slot = displacement & ~_SINGLETON
+        else:
+            slot = _mix(key, displacement + 1) % self.slots
+        code = self._results[slot >> 2] >> (2 * (slot & 3)) & 3
+        if not code or self._fingerprints[slot] != h >> 56:
+            return None
+        return Entry(RESULTS[code], self._distances[slot])
+
+    def score_move(self, game: Game, state: Any, action: str) -> float | None:
+        """Rate ``action`` by the result it keeps for the player to move.
+
+        1.0 keeps the best result available, 0.5 drops one step (win to draw
+        or draw to loss) and 0.0 throws a win away.  None if either position
+        is missing from the tablebase.
+        """
+        before = self.lookup(game, state)
+        child = game.apply_action(state, action)
+        after = self.lookup(game, child)
+        if before is None or after is None:
+            return None
+        result = after.result
+        if game.current_player(child) != game.current_player(state):
+            result = RESULTS[_FLIP[_CODES[result]]]
+        # Codes run WIN, DRAW, LOSS, so each step down costs 0.5.
+        return 1.0 - 0.5 * (_CODES[result] - _CODES[before.result])
+
+
+_CODES = {name: code for code, name in RESULTS.items()}
+_OPEN: Dict[str, Tablebase] = {}
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import copy
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from itertools import permutations
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from .base import Game, Player
+from .engine import GameEngine
+
+
+@dataclass(frozen=True)
+class MatchJob:
+    """A single scheduled match: one game, two seated players and a seed."""
+
+    index: int
+    game_name: str
+    game: Game
+    player0_name: str
+    player0: Player
+    player1_name: str
+    player1: Player
+    seed: int
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    index: int
+    game_name: str
+    player0_name: str
+    player1_name: str
+    seed: int
+    winner: int | None  # seat index, or None for a draw
+
+
+@dataclass
+class Record:
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+
+    @property
+    def played(self) -> int:
+        return self.wins + self.losses + self.draws
+
+
+def play_match(job: MatchJob) -> MatchResult:
+    """Play ``job`` to completion with the global RNG seeded from the job.
+
+    Players are copied first so that a match never observes state left over
+    from an earlier match, whichever process it happens to run in.
+    """
+    game, player0, player1 = copy.deepcopy((job.game, job.player0, job.player1))
+    random.seed(job.seed)
+    winner = GameEngine(game, player0, player1).play()
+    return MatchResult(job.index, job.game_name, job.player0_name, job.player1_name, job.seed, winner)
+
+
+class MatchScheduler:
+    """Fan match jobs out to a process pool and stream results back.
+
+    ``workers`` of ``0`` or ``1`` runs every match in the calling process,
+    which is handy for debugging and produces exactly the same results.
+    """
+
+    def __init__(self, workers: int | None = None):
+        self.workers = workers
+
+    def run(self, jobs: Iterable[MatchJob]) -> Iterator[MatchResult]:
+        """Yield results in completion order (submission order when serial)."""
+        if self.workers is not None and self.workers <= 1:
+            for job in jobs:
+                yield play_match(job)
+            return
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = [pool.submit(play_match, job) for job in jobs]
+            for future in as_completed(futures):
+                yield future.result()
+
+
+@dataclass
+class Standings:
+    """Win/loss/draw tables per game and per pairing."""
+
+    # (game, player, opponent) -> record from ``player``'s point of view
+    pairings: Dict[Tuple[str, str, str], Record] = field(default_factory=dict)
+    results: List[MatchResult] = field(default_factory=list)
+
+    def add(self, result: MatchResult) -> None:
+        self.results.append(result)
+        names = (result.player0_name, result.player1_name)
+        for seat in (0, 1):
+            key = (result.game_name, names[seat], names[1 - seat])
+            record = self.pairings.setdefault(key, Record())
+            if result.winner is None:
+                record.draws += 1
+            elif result.winner == seat:
+                record.wins += 1
+            else:
+                record.losses += 1
+
+    def record(self, game_name: str, player: str, opponent: str | None = None) -> Record:
+        """Return ``player``'s record in ``game_name``, optionally against one opponent."""
+        total = Record()
+        for (game, name, other), record in self.pairings.items():
+            if game != game_name or name != player:
+                continue
+            if opponent is not None and other != opponent:
+                continue
+            total.wins += record.wins
+            total.losses += record.losses
+            total.draws += record.draws
+        return total
+
+    def table(self, game_name: str) -> Dict[str, Record]:
+        """Return the overall record of every player in ``game_name``."""
+        players = {name for game, name, _ in self.pairings if game == game_name}
+        return {name: self.record(game_name, name) for name in sorted(players)}
+
+
+class Tournament:
+    """Round-robin over every game and every ordered pair of players.
+
+    Each pairing is played ``rounds`` times in both seatings.  Per-match seeds
+    are drawn from ``seed`` in schedule order, so a tournament is reproducible
+    and gives identical results whether it runs serially or in parallel.
+    """
+
+    def __init__(
+        self,
+        games: Dict[str, Game],
+        players: Dict[str, Player],
+        rounds: int = 1,
+        seed: int = 0,
+        workers: int | None = None,
+    ):
+        if len(players) < 2:
+            raise ValueError("A tournament needs at least two players")
+        self.games = games
+        self.players = players
+        self.rounds = rounds
+        self.seed = seed
+        self.scheduler = MatchScheduler(workers)
+
+    def schedule(self) -> List[MatchJob]:
+        rng = random.Random(self.seed)
+        jobs: List[MatchJob] = []
+        for game_name, game in self.games.items():
+            for name0, name1 in permutations(self.players, 2):
+                for _ in range(self.rounds):
+                    jobs.append(
+                        MatchJob(
+                            len(jobs),
+                            game_name,
+                            game,
+                            name0,
+                            self.players[name0],
+                            name1,
+                            self.players[name1],
+                            rng.getrandbits(32),
+                        )
+                    )
+        return jobs
+
+    def stream(self) -> Iterator[MatchResult]:
+        """Yield match results as they finish."""
+        return self.scheduler.run(self.schedule())
+
+    def run(self) -> Standings:
+        standings = Standings()
+        for result in self.stream():
+            standings.add(result)
+        standings.results.sort(key=lambda r: r.index)
+        return standings
@@ -0,0 +1,116 @@
+"""Per-call timing traces for matches, with CSV/JSON export and merging."""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .base import Game, Player
+from .engine import EngineObserver
+
+
+@dataclass(frozen=True)
+class CallRecord:
+    match: str  # "<pid>-<n>", unique across processes
+    game: str
+    ply: int
+    player: int
+    method: str
+    seconds: float
+
+
+FIELDS = [f for f in CallRecord.__dataclass_fields__]
+
+
+class Tracer(EngineObserver):
+    """Record every call of every observed match as a ``CallRecord``.
+
+    Pass the same tracer to several engines to trace them all.  The match
+    being played is tracked per thread, so engines sharing a tracer may run
+    in different threads at once.  Traces written by different processes can
+    be combined with ``merge``.
+    """
+
+    def __init__(self, records: Iterable[CallRecord] = ()):
+        self.records: List[CallRecord] = list(records)
+        self._matches = itertools.count()
+        self._current = threading.local()  # match, game, ply and player of this thread's match
+
+    # observer hooks ----------------------------------------------------
+
+    def on_match_start(self, game: Game, players: List[Player]) -> None:
+        current = self._current
+        current.match = f"{os.getpid()}-{next(self._matches)}"
+        current.game = type(game).__name__
+        current.ply = current.player = 0
+
+    def on_turn(self, ply: int, player: int) -> None:
+        self._current.ply = ply
+        self._current.player = player
+
+    def on_call(self, method: str, seconds: float) -> None:
+        c = self._current
+        self.records.append(CallRecord(c.match, c.game, c.ply, c.player, method, seconds))
+
+    # export ------------------------------------------------------------
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Aggregate calls per (game, method, player), slowest total first."""
+        groups: Dict[Tuple[str, str, int], List[float]] = {}
+        for r in self.records:
+            groups.setdefault((r.game, r.method, r.player), []).append(r.seconds)
+        rows = []
+        for (game, method, player), times in groups.items():
+            total = sum(times)
+            rows.append(
+                {
+                    "game": game,
+                    "method": method,
+                    "player": player,
+                    "calls": len(times),
+                    "total_s": total,
+                    "mean_us": total / len(times) * 1e6,
+                    "max_us": max(times) * 1e6,
+                }
+            )
+        rows.sort(key=lambda row: row["total_s"], reverse=True)
+        return rows
+
+    def to_json(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump({"records": [asdict(r) for r in self.records]}, f)
+
+    def to_csv(self, path: str) -> None:
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            for r in self.records:
+                writer.writerow(asdict(r))
+
+    @classmethod
+    def load(cls, path: str) -> "Tracer":
+        """Read a trace written by ``to_json`` or ``to_csv``."""
+        with open(path, newline="") as f:
+            if path.endswith(".csv"):
+                rows = list(csv.DictReader(f))
+            else:
+                rows = json.load(f)["records"]
+        return cls(
+            CallRecord(row["match"], row["game"], int(row["ply"]), int(row["player"]), row["method"], float(row["seconds"]))
+            for row in rows
+        )
+
+    @classmethod
+    def merge(cls, traces: Iterable["Tracer | str"]) -> "Tracer":
+        """Combine tracers and/or trace files into one."""
+        merged = cls()
+        for trace in traces:
+            if isinstance(trace, str):
+                trace = cls.load(trace)
+            merged.records.extend(trace.records)
+        return merged
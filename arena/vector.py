@@ -0,0 +1,305 @@
+"""Batched simulators that step many games at once with NumPy.
+
+Each environment holds ``num_envs`` independent games as arrays and uses
+integer actions in ``range(num_actions)``.  ``step`` plays one move in every
+game, reports which games finished and who won, and immediately resets the
+finished games so the batch never runs dry.  ``to_state`` converts one game
+back into the matching scalar ``Game`` state, and ``action_to_str`` gives the
+scalar action string, so results can be checked move for move.
+
+Requires NumPy (``pip install agent-arena[vector]``).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Tuple
+
+import numpy as np
+
+from .games.connect_four import ConnectFour
+from .games.nim import Nim
+from .games.othello import Othello
+from .games.tictactoe import TicTacToe
+
+# Winner value reported for draws and for games that have not finished.
+NO_WINNER = -1
+
+
+class VectorEnv:
+    """Base class for batched game simulators."""
+
+    num_actions: int
+
+    def __init__(self, num_envs: int):
+        self.num_envs = num_envs
+        self.player = np.zeros(num_envs, dtype=np.int8)
+        self.games_finished = 0
+        self._all = np.arange(num_envs)
+
+    def reset(self) -> None:
+        self._reset(np.ones(self.num_envs, dtype=bool))
+
+    def legal_mask(self) -> np.ndarray:
+        """Return a ``(num_envs, num_actions)`` boolean array of legal actions."""
+        raise NotImplementedError
+
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Play ``actions[i]`` in game ``i``.
+
+        Returns ``(done, winner)``: which games ended with this move and, for
+        those, the winning player or ``NO_WINNER`` for a draw.  Finished games
+        are reset before returning.
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        if not self.legal_mask()[self._all, actions].all():
+            raise ValueError("Invalid move")
+        done, winner = self._step(actions)
+        self.games_finished += int(done.sum())
+        if done.any():
+            self._reset(done)
+        return done, winner
+
+    def sample_actions(self, rng: np.random.Generator) -> np.ndarray:
+        """Return one uniformly random legal action per game."""
+        mask = self.legal_mask()
+        return np.argmax(rng.random(mask.shape) * mask, axis=1)
+
+    def to_state(self, index: int) -> Any:
+        raise NotImplementedError
+
+    def action_to_str(self, action: int) -> str:
+        return str(int(action))
+
+    def _reset(self, which: np.ndarray) -> None:
+        raise NotImplementedError
+
+    def _step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        raise NotImplementedError
+
+
+def _shift(planes: np.ndarray, dr: int, dc: int) -> np.ndarray:
+    """Move every ``(rows, cols)`` plane by ``(dr, dc)``, filling with False."""
+    out = np.zeros_like(planes)
+    rows, cols = planes.shape[-2:]
+    dst_r = slice(max(dr, 0), rows + min(dr, 0))
+    src_r = slice(max(-dr, 0), rows + min(-dr, 0))
+    dst_c = slice(max(dc, 0), cols + min(dc, 0))
+    src_c = slice(max(-dc, 0), cols + min(-dc, 0))
+    out[..., dst_r, dst_c] = planes[..., src_r, src_c]
+    return out
+
+
+def _has_line(stones: np.ndarray, length: int) -> np.ndarray:
+    """Return, per game, whether ``stones`` (N, rows, cols) contains ``length`` in a row."""
+    n, rows, cols = stones.shape
+    found = np.zeros(n, dtype=bool)
+    for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+        span_r = rows - (length - 1) * dr
+        span_c = cols - (length - 1) * abs(dc)
+        if span_r <= 0 or span_c <= 0:
+            continue
+        start_c = (length - 1) if dc < 0 else 0
+        window = np.ones((n, span_r, span_c), dtype=bool)
+        for i in range(length):
+            r0 = i * dr
+            c0 = start_c + i * dc
+            window &= stones[:, r0 : r0 + span_r, c0 : c0 + span_c]
+        found |= window.any(axis=(1, 2))
+    return found
+
+
+class TicTacToeVector(VectorEnv):
+    """Batched ``TicTacToe``; action ``i`` marks cell ``i``."""
+
+    num_actions = 9
+    _LINES = np.array([(0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6), (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6)])
+
+    def __init__(self, num_envs: int):
+        super().__init__(num_envs)
+        self.board = np.zeros((num_envs, 9), dtype=np.int8)  # 0 empty, 1 X, 2 O
+        self.reset()
+
+    def legal_mask(self) -> np.ndarray:
+        return self.board == 0
+
+    def to_state(self, index: int) -> Any:
+        return [" XO"[v] for v in self.board[index]]
+
+    def _reset(self, which: np.ndarray) -> None:
+        self.board[which] = 0
+        self.player[which] = 0
+
+    def _step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        piece = self.player + 1
+        self.board[self._all, actions] = piece
+        lines = self.board[:, self._LINES]
+        won = (lines == piece[:, None, None]).all(axis=2).any(axis=1)
+        done = won | (self.board != 0).all(axis=1)
+        winner = np.where(won, self.player, NO_WINNER)
+        self.player ^= 1
+        return done, winner
+
+
+class ConnectFourVector(VectorEnv):
+    """Batched ``ConnectFour``; action ``c`` drops a stone in column ``c``."""
+
+    def __init__(self, num_envs: int, rows: int = 6, cols: int = 7, connect: int = 4):
+        super().__init__(num_envs)
+        self.game = ConnectFour(rows, cols, connect)
+        self.rows, self.cols, self.connect = rows, cols, connect
+        self.num_actions = cols
+        self.board = np.zeros((num_envs, rows, cols), dtype=np.int8)  # row 0 is the top
+        self.heights = np.zeros((num_envs, cols), dtype=np.int64)
+        self.reset()
+
+    def legal_mask(self) -> np.ndarray:
+        return self.heights < self.rows
+
+    def to_state(self, index: int) -> Any:
+        # The arrays do not record move order, so build the bitboards directly.
+        stones = [0, 0]
+        for r in range(self.rows):
+            for c in range(self.cols):
+                v = self.board[index, r, c]
+                if v:
+                    stones[v - 1] |= 1 << (c * self.game.height + self.rows - 1 - r)
+        return self.game.from_bitboards(*stones)
+
+    def _reset(self, which: np.ndarray) -> None:
+        self.board[which] = 0
+        self.heights[which] = 0
+        self.player[which] = 0
+
+    def _step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        piece = self.player + 1
+        rows = self.rows - 1 - self.heights[self._all, actions]
+        self.board[self._all, rows, actions] = piece
+        self.heights[self._all, actions] += 1
+        won = _has_line(self.board == piece[:, None, None], self.connect)
+        done = won | (self.heights == self.rows).all(axis=1)
+        winner = np.where(won, self.player, NO_WINNER)
+        self.player ^= 1
+        return done, winner
+
+
+class OthelloVector(VectorEnv):
+    """Batched ``Othello``; action ``r * size + c`` plays a disc, ``size**2`` passes."""
+
+    _DIRECTIONS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+    def __init__(self, num_envs: int, size: int = 8):
+        super().__init__(num_envs)
+        self.game = Othello(size)
+        self.size = size
+        self.num_actions = size * size + 1
+        self.board = np.zeros((num_envs, size, size), dtype=np.int8)  # 0 empty, 1 X, 2 O
+        self.reset()
+
+    def legal_mask(self) -> np.ndarray:
+        moves = self._moves(self.player).reshape(self.num_envs, -1)
+        no_moves = ~moves.any(axis=1)
+        return np.concatenate([moves, no_moves[:, None]], axis=1)
+
+    def to_state(self, index: int) -> Any:
+        board = self.board[index].ravel()
+        x = sum(1 << i for i in np.flatnonzero(board == 1).tolist())
+        o = sum(1 << i for i in np.flatnonzero(board == 2).tolist())
+        return self.game.from_bitboards(x, o, int(self.player[index]))
+
+    def action_to_str(self, action: int) -> str:
+        if action == self.size * self.size:
+            return "pass"
+        return f"{action // self.size},{action % self.size}"
+
+    def _reset(self, which: np.ndarray) -> None:
+        mid = self.size // 2 - 1
+        self.board[which] = 0
+        self.board[which, mid, mid] = 2
+        self.board[which, mid + 1, mid + 1] = 2
+        self.board[which, mid, mid + 1] = 1
+        self.board[which, mid + 1, mid] = 1
+        self.player[which] = 0
+
+    def _moves(self, player: np.ndarray) -> np.ndarray:
+        own = self.board == (player + 1)[:, None, None]
+        opp = self.board == (2 - player)[:, None, None]
+        empty = self.board == 0
+        moves = np.zeros_like(own)
+        for dr, dc in self._DIRECTIONS:
+            run = _shift(own, dr, dc) & opp
+            for _ in range(self.size - 3):
+                run |= _shift(run, dr, dc) & opp
+            moves |= _shift(run, dr, dc) & empty
+        return moves
+
+    def _step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        n = self.size
+        playing = actions < n * n
+        own = self.board == (self.player + 1)[:, None, None]
+        opp = self.board == (2 - self.player)[:, None, None]
+        placed = np.zeros_like(own)
+        idx = self._all[playing]
+        placed[idx, actions[playing] // n, actions[playing] % n] = True
+        flips = np.zeros_like(own)
+        for dr, dc in self._DIRECTIONS:
+            run = _shift(placed, dr, dc) & opp
+            for _ in range(n - 3):
+                run |= _shift(run, dr, dc) & opp
+            closed = (_shift(run, dr, dc) & own).any(axis=(1, 2))
+            flips |= run & closed[:, None, None]
+        self.board = np.where(placed | flips, (self.player + 1)[:, None, None], self.board).astype(np.int8)
+        self.player ^= 1
+
+        full = (self.board != 0).all(axis=(1, 2))
+        stuck = ~self._moves(self.player).any(axis=(1, 2)) & ~self._moves(self.player ^ 1).any(axis=(1, 2))
+        done = full | stuck
+        x = (self.board == 1).sum(axis=(1, 2))
+        o = (self.board == 2).sum(axis=(1, 2))
+        winner = np.where(done & (x > o), 0, np.where(done & (o > x), 1, NO_WINNER))
+        return done, winner
+
+
+class NimVector(VectorEnv):
+    """Batched ``Nim``; action ``k`` takes ``k + 1`` sticks."""
+
+    def __init__(self, num_envs: int, total: int = 12, max_take: int = 3):
+        super().__init__(num_envs)
+        self.total = total
+        self.max_take = max_take
+        self.num_actions = max_take
+        self.remaining = np.zeros(num_envs, dtype=np.int64)
+        self._takes = np.arange(1, max_take + 1)
+        self.reset()
+
+    def legal_mask(self) -> np.ndarray:
+        return self._takes[None, :] <= self.remaining[:, None]
+
+    def to_state(self, index: int) -> Any:
+        return int(self.remaining[index]), int(self.player[index])
+
+    def action_to_str(self, action: int) -> str:
+        return str(int(action) + 1)
+
+    def _reset(self, which: np.ndarray) -> None:
+        self.remaining[which] = self.total
+        self.player[which] = 0
+
+    def _step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        self.remaining -= actions + 1
+        done = self.remaining == 0
+        winner = np.where(done, self.player, NO_WINNER)
+        self.player ^= 1
+        return done, winner
+
+
+def make_vector_env(game: Any, num_envs: int) -> VectorEnv:
+    """Return the batched simulator matching the scalar ``game``."""
+    if isinstance(game, TicTacToe):
+        return TicTacToeVector(num_envs)
+    if isinstance(game, ConnectFour):
+        return ConnectFourVector(num_envs, game.rows, game.cols, game.connect)
+    if isinstance(game, Othello):
+        return OthelloVector(num_envs, game.size)
+    if isinstance(game, Nim):
+        return NimVector(num_envs, game.total, game.max_take)
+    raise ValueError(f"No vector environment for {type(game).__name__}")
@@ -0,0 +1,250 @@
+"""Build-once word graph for word ladder games.
+
+``WordIndex.build`` links every word to the words that differ from it in one
+letter and packs the result into a single buffer:
+
+* a header (magic, version, byte order and section sizes),
+* ``uint32`` offsets into a blob of the sorted words,
+* ``uint32`` adjacency offsets and the adjacency array itself,
+* optional ``int32`` BFS distance tables for chosen goal words.
+
+``save`` writes the buffer to disk and ``WordIndex.open`` memory-maps it, so
+every match (and every process) reading the same file shares one copy of the
+dictionary.  Neighbours are a slice of the adjacency array, O(degree), and
+are listed in (position, letter) order, the order word ladder actions are
+generated in.
+"""
+
+from __future__ import annotations
+
+import gc
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+_MAGIC = b"WLIX"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBB2xIIII")  # magic, version, big-endian flag, words, blob bytes, edges, tables
+_BIG_ENDIAN = sys.byteorder == "big"
+UNREACHABLE = -1
+
+
+class WordIndex:
+    """Sorted words of letters a-z with their one-letter-change neighbours."""
+
+    def __init__(self, buffer: bytes | mmap.mmap):
+        self._buffer = buffer
+        view = memoryview(buffer)
+        magic, version, big_endian, words, blob_size, edges, tables = _HEADER.unpack_from(view)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not a word index file")
+        pos = _HEADER.size
+
+        def section(fmt: str, count: int) -> memoryview | array:
+            nonlocal pos
+            data = view[pos : pos + 4 * count].cast(fmt)
+            pos += 4 * count
+            if bool(big_endian) != _BIG_ENDIAN:  # built on another platform: copy and swap
+                data = array(fmt, data.tobytes())
+                data.byteswap()
+            return data
+
+        self._word_offsets = section("I", words + 1)
+        self._blob = view[pos : pos + blob_size]
+        pos += _padded(blob_size)
+        self._adj_offsets = section("I", words + 1)
+        self._adj = section("I", edges)
+        self._tables: Dict[int, memoryview | array] = {}
+        for _ in range(tables):
+            goal = section("I", 1)[0]
+            self._tables[goal] = section("i", words)
+        self._computed: Dict[int, array] = {}  # BFS tables built on demand
+
+    # Construction -----------------------------------------------------
+
+    @classmethod
+    def build(cls, words: Iterable[str], goals: Iterable[str] = ()) -> "WordIndex":
+        """Index ``words`` in memory, storing distance tables for ``goals``.
+
+        Words are lowercased; a word with characters outside a-z raises
+        ValueError.
+        """
+        unique = sorted({w.lower() for w in words})
+        for w in unique:
+            if not (w.isascii() and w.isalpha()):
+                raise ValueError(f"Word index words must be letters a-z: {w!r}")
+        ids = {w: i for i, w in enumerate(unique)}
+        # Wildcard buckets: "c*ld" -> indices of "cold", "cald", ... in
+        # sorted order, i.e. by the letter at the wildcard.
+        buckets: Dict[str, List[int]] = {}
+        word_buckets = []
+        # Millions of small lists and no cycles: pause the cyclic GC, which
+        # would otherwise rescan them repeatedly and double the build time.
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for i, w in enumerate(unique):
+                lists = [buckets.setdefault(w[:p] + "*" + w[p + 1 :], []) for p in range(len(w))]
+                for bucket in lists:
+                    bucket.append(i)
+                word_buckets.append(lists)
+        finally:
+            if enabled:
+                gc.enable()
+        adj_offsets = array("I", [0])
+        adj = array("I")
+        for i, lists in enumerate(word_buckets):
+            for bucket in lists:
+                if len(bucket) > 1:
+                    adj.extend(bucket)
+                    del adj[len(adj) - len(bucket) + bucket.index(i)]
+            adj_offsets.append(len(adj))
+        blob = "".join(unique).encode("ascii")
+        word_offsets = array("I", [0])
+        for w in unique:
+            word_offsets.append(word_offsets[-1] + len(w))
+
+        body = [word_offsets.tobytes(), blob, bytes(_padded(len(blob)) - len(blob))]
+        body += [adj_offsets.tobytes(), adj.tobytes()]
+        counts = (len(unique), len(blob), len(adj))
+        index = cls(_HEADER.pack(_MAGIC, _VERSION, _BIG_ENDIAN, *counts, 0) + b"".join(body))
+        goal_ids = sorted({ids[g.lower()] for g in goals if g.lower() in ids})
+        if not goal_ids:
+            return index
+        for goal in goal_ids:
+            body += [array("I", [goal]).tobytes(), index._bfs(goal).tobytes()]
+        return cls(_HEADER.pack(_MAGIC, _VERSION, _BIG_ENDIAN, *counts, len(goal_ids)) + b"".join(body))
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the index to ``path``.
+
+        The file is replaced rather than overwritten, so indexes already
+        mapped from an earlier version keep reading that version.
+        """
+        tmp = f"{os.fspath(path)}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(self._buffer)
+        os.replace(tmp, path)
+
+    @classmethod
+    def open(cls, path: str | os.PathLike[str]) -> "WordIndex":
+        """Memory-map an index written by ``save``.
+
+        Indexes are cached per path, so games opening the same file share it.
+        A file changed since it was opened (by modification time or size) is
+        mapped again.
+        """
+        key = os.path.abspath(path)
+        with open(key, "rb") as f:
+            info = os.fstat(f.fileno())
+            stamp = (info.st_mtime_ns, info.st_size)
+            cached = _OPEN.get(key)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+            index = cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        _OPEN[key] = (stamp, index)
+        return index
+
+    # Lookups ----------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._word_offsets) - 1
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self.find(word) >= 0
+
+    def word(self, i: int) -> str:
+        return self._blob[self._word_offsets[i] : self._word_offsets[i + 1]].tobytes().decode("ascii")
+
+    def find(self, word: str) -> int:
+        """Return the index of ``word``, or -1 if it is not in the dictionary."""
+        try:
+            target = word.encode("ascii")
+        except UnicodeEncodeError:
+            return -1
+        offsets, blob = self._word_offsets, self._blob
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if blob[offsets[mid] : offsets[mid + 1]].tobytes() < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self) and blob[offsets[lo] : offsets[lo + 1]].tobytes() == target:
+            return lo
+        return -1
+
+    def neighbour_ids(self, i: int) -> memoryview | array:
+        return self._adj[self._adj_offsets[i] : self._adj_offsets[i + 1]]
+
+    def neighbours(self, word: str) -> List[str] | None:
+        """Words one letter away from ``word``, or None if ``word`` is not indexed."""
+        i = self.find(word)
+        if i < 0:
+            return None
+        return [self.word(j) for j in self.neighbour_ids(i)]
+
+    def distance(self, word: str, goal: str) -> int | None:
+        """Fewest moves from ``word`` to ``goal``, or None if there is no ladder.
+
+        Uses the stored table for ``goal`` if there is one, otherwise runs a
+        BFS from ``goal`` once and keeps the table.
+        """
+        if word == goal:
+            return 0
+        i, g = self.find(word), self.find(goal)
+        if i < 0 or g < 0:
+            return None
+        d = self.distance_table(g)[i]
+        return None if d == UNREACHABLE else d
+
+    def distance_table(self, goal: int) -> memoryview | array:
+        """Distance of every word to word ``goal`` (``UNREACHABLE`` if none)."""
+        table = self._tables.get(goal)
+        if table is None:
+            table = self._computed.get(goal)
+            if table is None:
+                table = self._computed[goal] = self._bfs(goal)
+        return table
+
+    def _bfs(self, goal: int) -> array:
+        dist = array("i", [UNREACHABLE]) * len(self)
+        dist[goal] = 0
+        queue = deque([goal])
+        offsets, adj = self._adj_offsets, self._adj
+        while queue:
+            i = queue.popleft()
+            d = dist[i] + 1
+            for j in adj[offsets[i] : offsets[i + 1]]:
+                if dist[j] == UNREACHABLE:
+                    dist[j] = d
+                    queue.append(j)
+        return dist
+
+
+_OPEN: Dict[str, Tuple[Tuple[int, int], WordIndex]] = {}  # path -> ((mtime_ns, size), index)
+
+
+def _padded(size: int) -> int:
+    return (size + 3) & ~3
+
+
+def ladder(index: WordIndex, start: str, goal: str) -> Tuple[str, ...] | None:
+    """A shortest ladder from ``start`` to ``goal``, following the distance table."""
+    d = index.distance(start, goal)
+    if d is None:
+        return None
+    if d == 0:
+        return (start,)
+    table = index.distance_table(index.find(goal))
+    path = [start]
+    i = index.find(start)
+    while d > 0:
+        i = next(j for j in index.neighbour_ids(i) if table[j] == d - 1)
+        d -= 1
+        path.append(index.word(i))
+    return tuple(path)
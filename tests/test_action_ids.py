@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from arena.games.checkers import Checkers
+from arena.games.connect_four import ConnectFour
+from arena.games.dots_and_boxes import DotsAndBoxes
+from arena.games.hex import Hex
+from arena.games.mancala import Mancala
+from arena.games.mini_chess import MiniChess
+from arena.games.multiheap_nim import MultiHeapNim
+from arena.games.nim import Nim
+from arena.games.othello import Othello
+from arena.games.quoridor import Quoridor
+from arena.games.sudoku_race import SudokuRace
+from arena.games.tictactoe import TicTacToe
+from arena.games.word_ladder_duel import WordLadderDuel
+
+GAMES = [
+    TicTacToe(),
+    ConnectFour(),
+    Othello(6),
+    Hex(5),
+    Checkers(),
+    Checkers(forced_jumps=True),
+    MiniChess(),
+    Quoridor(),
+    DotsAndBoxes(3),
+    DotsAndBoxes(3, extra_turns=True),
+    Mancala(),
+    Nim(),
+    MultiHeapNim(),
+    MultiHeapNim([2, 7], max_take=None),
+    SudokuRace(),
+    WordLadderDuel("cold", "warm", ["cold", "cord", "card", "ward", "warm", "word", "worm", "corm"]),
+]
+
+
+@pytest.mark.parametrize("game", GAMES, ids=lambda g: type(g).__name__)
+def test_ids_mirror_string_actions(game):
+    rng = random.Random(5)
+    for _ in range(3):
+        state = game.reset()
+        for _ in range(80):
+            if game.is_terminal(state):
+                break
+            actions = game.valid_actions(state)
+            ids = game.legal_action_ids(state)
+            if not actions:
+                break
+            assert [game.action_to_str(state, a) for a in ids] == actions
+            assert [game.str_to_action(state, a) for a in actions] == ids
+            assert all(0 <= a < game.num_actions() for a in ids)
+            i = rng.randrange(len(ids))
+            by_id = game.apply_action_id(state, ids[i])
+            state = game.apply_action(state, actions[i])
+            assert game.render(by_id) == game.render(state)
+
+
+def test_illegal_ids_rejected():
+    game = TicTacToe()
+    state = game.apply_action_id(game.reset(), 4)
+    with pytest.raises(ValueError):
+        game.apply_action_id(state, 4)
+    with pytest.raises(ValueError):
+        game.apply_action_id(state, game.num_actions())
+    with pytest.raises(ValueError):
+        ConnectFour().str_to_action(None, "x")
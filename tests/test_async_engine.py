@@ -0,0 +1,47 @@
+import asyncio
+import random
+
+from arena import AsyncGameEngine, AsyncMatchPool, AsyncPlayer, RandomPlayer, play_many
+from arena.games.nim import Nim
+
+
+class SleepyPlayer(AsyncPlayer):
+    """Stand-in for a model server that takes a while to answer.
+
+    ``peak`` is the largest number of decisions it was awaiting at once.
+    """
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.waiting = 0
+        self.peak = 0
+
+    async def select_action(self, game, state):
+        self.waiting += 1
+        self.peak = max(self.peak, self.waiting)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.waiting -= 1
+        return random.choice(game.valid_actions(state))
+
+
+def test_hundreds_of_matches_overlap():
+    player = SleepyPlayer(0)
+    engines = [AsyncGameEngine(Nim(), player, RandomPlayer()) for _ in range(300)]
+    winners = asyncio.run(play_many(engines, max_concurrent=300))
+    assert len(winners) == 300
+    assert all(w in (0, 1) for w in winners)
+    # Every match was waiting on its first decision at the same time.
+    assert player.peak == 300
+
+
+def test_pool_limits_concurrency():
+    async def run():
+        async with AsyncMatchPool(max_concurrent=4, max_pending=2) as pool:
+            futures = [await pool.submit(AsyncGameEngine(Nim(), SleepyPlayer(0.001), SleepyPlayer(0.001))) for _ in range(20)]
+        return pool, [f.result() for f in futures]
+
+    pool, winners = asyncio.run(run())
+    assert len(winners) == 20
+    assert pool.peak_active == 4
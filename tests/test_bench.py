@@ -0,0 +1,39 @@
+import copy
+import json
+
+from arena.bench import compare, run_suite
+from arena.bench.games import replay, sample_positions
+from arena.games import registry
+
+
+def test_suite_reports_every_metric_as_json():
+    results = run_suite(["TicTacToe", "WordLadderDuel"], seconds=0.05, samples=3, repeats=2)
+    json.dumps(results)
+    ttt = results["TicTacToe"]
+    assert ttt["throughput"]["games_per_sec"] > 0
+    assert set(ttt["latency"]) == {"opening", "midgame", "endgame"}
+    methods = {"valid_actions", "apply_action", "is_terminal", "get_winner", "render"}
+    assert set(ttt["latency"]["midgame"]) == methods | {"canonical_state"}  # TicTacToe has symmetries
+    assert set(results["WordLadderDuel"]["latency"]["midgame"]) == methods
+    assert ttt["peak_state_bytes"]["opening"] > 0
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    baseline = run_suite(["Nim"], seconds=0.05, samples=3, repeats=2)
+    assert compare(baseline, baseline) == []
+    slower = copy.deepcopy(baseline)
+    slower["Nim"]["throughput"]["games_per_sec"] /= 2
+    slower["Nim"]["latency"]["opening"]["render"]["p50_us"] += 50
+    regressions = compare(slower, baseline, threshold=0.2)
+    assert len(regressions) == 2
+    assert any("games_per_sec" in line for line in regressions)
+
+
+def test_positions_are_rebuilt_without_cached_moves():
+    game = registry.load("Checkers")()
+    positions = sample_positions(game, 2)
+    for line in positions["midgame"]:
+        state = replay(game, line)
+        assert state.moves is None
+        game.valid_actions(state)
+        assert replay(game, line).moves is None
@@ -1,3 +1,5 @@
+import pytest
+
 from arena.games.checkers import Checkers, CheckersState
 
 
@@ -12,3 +14,56 @@ def test_checkers_simple_capture_win():
     state = game.apply_action(state, "2,1->4,3")
     assert game.is_terminal(state)
     assert game.get_winner(state) == 0
+
+
+def _board(pieces):
+    board = [[" "] * 8 for _ in range(8)]
+    for (r, c), piece in pieces.items():
+        board[r][c] = piece
+    return board
+
+
+def test_forced_multi_jump_is_one_action():
+    game = Checkers(forced_jumps=True)
+    state = CheckersState(_board({(0, 1): "b", (1, 2): "r", (3, 4): "r", (7, 0): "r", (2, 7): "b"}), 0)
+    # the capture is compulsory, so the quiet move of (2, 7) is not offered
+    assert game.valid_actions(state) == ["0,1->2,3->4,5"]
+    state = game.apply_action(state, "0,1->2,3->4,5")
+    assert state.counts == (2, 1)
+    assert state.board[4][5] == "b" and state.board[1][2] == state.board[3][4] == " "
+    # without forced jumps captures stay optional single jumps
+    assert Checkers().valid_actions(CheckersState(_board({(0, 1): "b", (1, 2): "r"}), 0)) == ["0,1->1,0", "0,1->2,3"]
+
+
+def test_capture_tree_branches_and_crowning_ends_the_sequence():
+    game = Checkers(forced_jumps=True)
+    pieces = {(4, 3): "B", (3, 2): "r", (3, 4): "r", (1, 2): "r", (5, 0): "b", (6, 1): "r", (6, 3): "r"}
+    state = CheckersState(_board(pieces), 0)
+    assert game.valid_actions(state) == [
+        "4,3->2,1->0,3",
+        "4,3->2,5",
+        "5,0->7,2",  # crowned on landing, so the jump over (6, 3) must wait
+    ]
+    assert game.capture_sequences(state) == [[35, 17, 3], [35, 21], [40, 58]]
+    child = game.apply_action(state, "4,3->2,1->0,3")
+    assert child.counts == (2, 3) and child.board[0][3] == "B"
+
+
+def test_multi_jump_ids_are_compact_and_round_trip():
+    game = Checkers(forced_jumps=True)
+    assert game.num_actions() < 4096
+    pieces = {(4, 3): "B", (3, 2): "r", (3, 4): "r", (1, 2): "r", (5, 0): "b", (6, 1): "r", (6, 3): "r"}
+    state = CheckersState(_board(pieces), 0)
+    for action_id in game.legal_action_ids(state):
+        assert 0 <= action_id < game.num_actions()
+        assert game.str_to_action(state, game.action_to_str(state, action_id)) == action_id
+    with pytest.raises(ValueError):
+        game.str_to_action(state, "4,3->2,1->4,3->2,1")  # jumps (3, 2) twice
+
+
+def test_cached_moves_follow_the_asking_games_rule():
+    state = CheckersState(_board({(0, 1): "b", (1, 2): "r", (2, 7): "b"}), 0)
+    optional, forced = Checkers(), Checkers(forced_jumps=True)
+    assert len(optional.valid_actions(state)) == 3
+    assert forced.valid_actions(state) == ["0,1->2,3"]
+    assert len(optional.valid_actions(state)) == 3
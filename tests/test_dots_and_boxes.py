@@ -0,0 +1,90 @@
+import random
+import time
+
+from arena import GameEngine, RandomPlayer
+from arena.games.dots_and_boxes import DotsAndBoxes
+
+
+def _box_edges(game, r, c):
+    return [
+        game._h_edge_index(r, c),
+        game._h_edge_index(r + 1, c),
+        game._v_edge_index(r, c),
+        game._v_edge_index(r, c + 1),
+    ]
+
+
+def test_edge_index_lists_adjacent_boxes():
+    game = DotsAndBoxes(4)
+    for r in range(4):
+        for c in range(4):
+            for edge in _box_edges(game, r, c):
+                assert r * 4 + c in game.edge_boxes[edge]
+    assert sorted(len(boxes) for boxes in game.edge_boxes).count(1) == 4 * 4
+    assert all(1 <= len(boxes) <= 2 for boxes in game.edge_boxes)
+
+
+def test_completing_a_box_earns_another_turn():
+    game = DotsAndBoxes(2, extra_turns=True)
+    top, bottom, left, right = _box_edges(game, 0, 0)
+    state = game.reset()
+    for edge in (top, bottom, left):
+        state = game.apply_action(state, str(edge))
+    assert game.current_player(state) == 1
+    state = game.apply_action(state, str(right))
+    assert game.current_player(state) == 1
+    assert "O" in game.render(state)
+    plain = DotsAndBoxes(2)
+    state = plain.reset()
+    for edge in (top, bottom, left, right):
+        state = plain.apply_action(state, str(edge))
+    assert plain.current_player(state) == 0
+
+
+def test_double_box_move_scores_both():
+    game = DotsAndBoxes(1, extra_turns=True)
+    state = game.reset()
+    for edge in range(3):
+        state = game.apply_action(state, str(edge))
+    state = game.apply_action(state, "3")
+    assert game.is_terminal(state)
+    assert game.get_winner(state) == 1
+    game = DotsAndBoxes(2, extra_turns=True)
+    middle = game._v_edge_index(0, 1)
+    state = game.reset()
+    for edge in set(_box_edges(game, 0, 0) + _box_edges(game, 0, 1)) - {middle}:
+        state = game.apply_action(state, str(edge))
+    player = game.current_player(state)
+    state = game.apply_action(state, str(middle))
+    assert state.owned[player] == 0b11
+    assert game.current_player(state) == player
+
+
+def test_engine_follows_extra_turns():
+    class Recorder(RandomPlayer):
+        def __init__(self, index, seen):
+            super().__init__()
+            self.index = index
+            self.seen = seen
+
+        def select_action(self, game, state):
+            assert game.current_player(state) == self.index
+            self.seen.append(self.index)
+            return super().select_action(game, state)
+
+    seen = []
+    game = DotsAndBoxes(3, extra_turns=True)
+    GameEngine(game, Recorder(0, seen), Recorder(1, seen)).play()
+    assert len(seen) == game.total_edges
+    assert any(a == b for a, b in zip(seen, seen[1:]))
+
+
+def test_large_board_playout():
+    game = DotsAndBoxes(12, extra_turns=True)
+    rng = random.Random(1)
+    state = game.reset()
+    start = time.perf_counter()
+    while not game.is_terminal(state):
+        state = game.apply_action_id(state, rng.choice(game.legal_action_ids(state)))
+    assert time.perf_counter() - start < 2.0
+    assert state.owned[0].bit_count() + state.owned[1].bit_count() == 12 * 12
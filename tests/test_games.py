@@ -15,6 +15,23 @@ def test_connect_four_vertical_win():
     assert game.get_winner(state) == 0
 
 
+def test_connect_four_diagonal_win_and_render():
+    game = ConnectFour()
+    state = game.reset()
+    for m in ["0", "1", "1", "2", "2", "3", "2", "3", "3", "6", "3"]:
+        assert game.get_winner(state) is None
+        state = game.apply_action(state, m)
+    assert game.is_terminal(state)
+    assert game.get_winner(state) == 0
+    assert game.render(state).splitlines()[3:] == [
+        " | | |X| | | ",
+        " | |X|X| | | ",
+        " |X|X|O| | | ",
+        "X|O|O|O| | |O",
+        "```",
+    ]
+
+
 def test_nim_simple_win():
     game = Nim(total=3, max_take=3)
     state = game.reset()
@@ -39,7 +56,28 @@ def test_othello_simple_win():
         "3,2",
         "3,3",
     ]
-    
+    for m in moves:
+        state = game.apply_action(state, m)
+    assert game.is_terminal(state)
+    assert game.get_winner(state) == 1
+
+
+def test_othello_move_list_is_shared_per_state():
+    game = Othello(size=6)
+    state = game.reset()
+    assert state.moves is None
+    assert game.valid_actions(state) == ["1,2", "2,1", "3,4", "4,3"]
+    cached = state.moves
+    game.is_terminal(state)
+    assert state.moves is cached
+    try:
+        game.apply_action(state, "0,0")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("illegal move accepted")
+
+
 def test_mancala_simple_win():
     game = Mancala()
     # board with a single stone for player 0 to move leading to victory
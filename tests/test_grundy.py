@@ -0,0 +1,87 @@
+import random
+import time
+
+import pytest
+
+from arena import GameEngine, RandomPlayer
+from arena.games.multiheap_nim import MultiHeapNim
+from arena.games.nim import Nim
+from arena.grundy import PerfectNimPlayer, SubtractionGame, nim_value, score_move, winning_action
+
+
+def _brute_grundy(moves, limit):
+    values = []
+    for n in range(limit):
+        options = {values[n - t] for t in moves if t <= n}
+        g = 0
+        while g in options:
+            g += 1
+        values.append(g)
+    return values
+
+
+@pytest.mark.parametrize("moves", [(1, 2, 3), (2, 3, 7), (1, 4, 5), (4, 7, 13), (2,)])
+def test_periodic_values_match_recursion(moves):
+    game = SubtractionGame(moves)
+    expected = _brute_grundy(moves, 2000)
+    for n, g in enumerate(expected):
+        assert game.grundy(n) == g
+        for target in range(g):
+            t = game.take_to(n, target)
+            assert t in moves and expected[n - t] == target
+
+
+def test_huge_heaps_use_the_period():
+    game = SubtractionGame((4, 7, 13))
+    assert game.preperiod > 0 and len(game.values) < 100
+    start = time.perf_counter()
+    for heap in range(10**9, 10**9 + 1000):
+        game.grundy(heap)
+    assert time.perf_counter() - start < 0.1
+    assert game.grundy(10**9 + 3) == game.grundy(10**9 + 3 - 1000 * game.period)
+
+
+def _won(game, state, memo=None):
+    """Brute force: can the player to move force a win?"""
+    memo = {} if memo is None else memo
+    key = repr(state)
+    if key not in memo:
+        memo[key] = any(
+            not _won(game, game.apply_action(state, a), memo) for a in game.valid_actions(state)
+        )
+    return memo[key]
+
+
+@pytest.mark.parametrize("game", [Nim(15, 4), MultiHeapNim([3, 5, 6], 3), MultiHeapNim([2, 4, 7], None)])
+def test_oracle_matches_brute_force(game):
+    rng = random.Random(4)
+    state = game.reset()
+    while not game.is_terminal(state):
+        won = _won(game, state)
+        assert (nim_value(game, state) != 0) == won
+        best = winning_action(game, state)
+        assert (best is not None) == won
+        for action in game.valid_actions(state):
+            after = game.apply_action(state, action)
+            good = not won or not _won(game, after)
+            assert score_move(game, state, action) == (1.0 if good else 0.0)
+        state = game.apply_action(state, rng.choice(game.valid_actions(state)))
+
+
+def test_perfect_player_wins_won_positions():
+    for seed in range(10):
+        random.seed(seed)
+        assert GameEngine(MultiHeapNim([3, 4, 5]), PerfectNimPlayer(), RandomPlayer()).play() == 0
+        assert GameEngine(Nim(13, 3), PerfectNimPlayer(), RandomPlayer()).play() == 0
+        assert GameEngine(Nim(12, 3), RandomPlayer(), PerfectNimPlayer()).play() == 1
+    big = MultiHeapNim([10**6, 2 * 10**6 + 1, 3], max_take=5)
+    action = winning_action(big, big.reset())
+    assert nim_value(big, big.apply_action(big.reset(), action)) == 0
+
+
+def test_multiheap_winner_counts_moves_not_sticks():
+    game = MultiHeapNim([3, 1], max_take=None)
+    state = game.apply_action(game.reset(), "0,3")  # three sticks, one move
+    state = game.apply_action(state, "1,1")
+    assert game.get_winner(state) == 1
+    assert game.current_player(state) == 0
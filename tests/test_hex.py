@@ -8,3 +8,19 @@ def test_hex_left_right_win():
     for m in moves:
         state = game.apply_action(state, m)
     assert game.get_winner(state) == 0
+
+
+def test_hex_large_board_top_bottom_win_and_branching():
+    game = Hex(size=11)
+    state = game.reset()
+    for r in range(10):
+        state = game.apply_action(state, f"{r},10")  # X: left-right would need a row
+        state = game.apply_action(state, f"{r},0")  # O: builds down column 0
+    assert game.get_winner(state) is None
+    branch = game.apply_action(state, "10,10")
+    state = game.apply_action(state, "10,5")
+    state = game.apply_action(state, "10,0")
+    assert game.get_winner(state) == 1
+    assert game.is_terminal(state)
+    # The sibling position shares structure but must not see O's connection.
+    assert game.get_winner(branch) is None
@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from arena import AsyncGameEngine, GameEngine, RandomPlayer, Tournament, play_many
+from arena.games.nim import Nim
+from arena.games.tictactoe import TicTacToe
+from arena.llm import LLMPlayer
+from arena.llm_batch import BatchedLLMPlayer, BatchingModel, BatchModel, FlushPolicy
+
+
+class StubServer(BatchModel):
+    """Local inference server counting its requests.  Replies with the last
+    listed action."""
+
+    model_id = "stub"
+
+    def __init__(self):
+        self.requests = 0
+        self.prompts = 0
+
+    def complete_batch(self, prompts):
+        self.requests += 1
+        self.prompts += len(prompts)
+        return [p.split("Valid actions: ")[1].split("\n")[0].split(", ")[-1] for p in prompts]
+
+
+class Echo(BatchModel):
+    model_id = "echo"
+
+    def complete_batch(self, prompts):
+        return [p.upper() for p in prompts]
+
+
+def test_replies_are_routed_to_their_callers():
+    # 200 prompts fill exactly 25 batches, so none waits for the deadline.
+    with BatchingModel(Echo(), FlushPolicy(max_batch_size=8, max_delay=60)) as model:
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            replies = list(pool.map(model.complete, [f"p{i}" for i in range(200)]))
+    assert replies == [f"P{i}" for i in range(200)]
+    assert model.stats.requests == 200
+    assert model.stats.sizes == {8: 25} and model.stats.size_flushes == 25
+
+
+def test_full_batches_flush_before_the_deadline():
+    model = BatchingModel(Echo(), FlushPolicy(max_batch_size=4, max_delay=60))
+    futures = [model.submit(str(i)) for i in range(8)]
+    assert [f.result(timeout=5) for f in futures] == [str(i) for i in range(8)]
+    assert model.stats.sizes == {4: 2} and model.stats.size_flushes == 2
+    model.close()
+
+
+def test_deadline_flushes_a_partial_batch():
+    model = BatchingModel(Echo(), FlushPolicy(max_batch_size=100, max_delay=0.02))
+    assert model.complete("x") == "X"
+    assert model.stats.sizes == {1: 1} and model.stats.size_flushes == 0
+    assert model.stats.max_delay >= 0.02
+    model.close()
+
+
+def test_close_sends_the_remaining_prompts():
+    model = BatchingModel(Echo(), FlushPolicy(max_batch_size=100, max_delay=60))
+    future = model.submit("late")
+    model.close()
+    assert future.result(timeout=0) == "LATE"
+
+
+def test_backend_errors_reach_every_caller():
+    class Broken(BatchModel):
+        model_id = "broken"
+
+        def complete_batch(self, prompts):
+            return prompts[:1]
+
+    with BatchingModel(Broken(), FlushPolicy(max_batch_size=2, max_delay=60)) as model:
+        futures = [model.submit("a"), model.submit("b")]
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result(timeout=5)
+
+
+def test_flush_policy_is_validated():
+    with pytest.raises(ValueError):
+        FlushPolicy(max_batch_size=0)
+    with pytest.raises(ValueError):
+        FlushPolicy(max_delay=-1)
+    with pytest.raises(ValueError):
+        FlushPolicy(max_idle=0)
+
+
+def test_concurrent_async_matches_share_batches():
+    server = StubServer()
+    # Every match takes 3 of the 12 sticks four times in step, so each
+    # round of moves fills one batch and the deadline is never reached.
+    with BatchingModel(server, FlushPolicy(max_batch_size=64, max_delay=60)) as model:
+        player = BatchedLLMPlayer(model)
+        engines = [AsyncGameEngine(Nim(), player, player) for _ in range(64)]
+        winners = asyncio.run(play_many(engines, max_concurrent=64))
+    assert winners == [1] * 64
+    assert server.requests == model.stats.batches == 4
+    assert model.stats.sizes == {64: 4} and model.stats.size_flushes == 4
+
+
+def test_threaded_sync_players_batch_and_play_correctly():
+    server = StubServer()
+    model = BatchingModel(server, FlushPolicy(max_batch_size=16, max_delay=60))
+    player = LLMPlayer(model)
+    barrier = threading.Barrier(16)
+
+    def match(_):
+        barrier.wait()
+        return GameEngine(Nim(), player, player).play()
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        winners = list(pool.map(match, range(16)))
+    model.close()
+    # Always taking the most sticks from 12 with max_take 3: four moves.
+    assert winners == [1] * 16
+    assert model.stats.sizes == {16: 4} and model.stats.mean_batch_size == 16
+
+
+def _batcher_threads():
+    return [t for t in threading.enumerate() if t.name == "arena-batcher"]
+
+
+def test_tournament_matches_share_one_queue_and_stop_its_thread():
+    server = StubServer()
+    model = BatchingModel(server, FlushPolicy(max_batch_size=4, max_delay=0.001, max_idle=0.05))
+    games = {"nim": Nim(), "ttt": TicTacToe()}
+    Tournament(games, {"llm": LLMPlayer(model), "random": RandomPlayer()}, rounds=5, workers=1).run()
+    assert model.stats.batches == server.requests > 0
+    assert model.stats.requests == server.prompts
+    deadline = time.monotonic() + 5
+    while _batcher_threads() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not _batcher_threads()
+    assert model.complete("Valid actions: 1, 2\n") == "2"  # a new thread starts on demand
+    model.close()
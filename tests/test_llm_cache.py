@@ -0,0 +1,163 @@
+import copy
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from arena import GameEngine, RandomPlayer, Tournament
+from arena.games.nim import Nim
+from arena.games.tictactoe import TicTacToe
+from arena.llm import LLMPlayer, Model, parse_action
+from arena.llm_cache import CachingPlayer, ResponseCache, cache_key
+
+
+class FakeModel(Model):
+    """Local stand-in for a paid model: answers with the first listed action."""
+
+    def __init__(self, model_id="fake-1"):
+        self.model_id = model_id
+        self.calls = 0
+
+    def complete(self, prompt):
+        self.calls += 1
+        actions = prompt.split("Valid actions: ")[1].split("\n")[0]
+        return f"I will play {actions.split(', ')[0]}."
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_parse_action_finds_whole_tokens():
+    assert parse_action(" 3 \n", ["1", "2", "3"]) == "3"
+    assert parse_action("Taking 2 sticks, not 12", ["1", "2", "3"]) == "2"
+    assert parse_action("I'd go 1,2 here", ["0,1", "1,2", "2"]) == "1,2"
+    with pytest.raises(ValueError):
+        parse_action("pass", ["1", "2"])
+
+
+def test_repeated_openings_hit_the_cache():
+    model = FakeModel()
+    player = CachingPlayer(LLMPlayer(model))
+    game = TicTacToe()
+    for _ in range(5):
+        GameEngine(game, player, RandomPlayer()).play()
+    assert model.calls == player.stats.misses
+    assert player.stats.hits >= 4  # at least the opening move repeats
+    state = game.reset()
+    assert player.select_action(game, state) == LLMPlayer(FakeModel()).select_action(game, state)
+
+
+def test_key_covers_model_template_game_and_state():
+    nim, ttt = Nim(), TicTacToe()
+    render = nim.render(nim.reset())
+    key = cache_key("m", "t", nim, render)
+    assert key == cache_key("m", "t", Nim(), render)
+    assert key != cache_key("m2", "t", nim, render)
+    assert key != cache_key("m", "t2", nim, render)
+    assert key != cache_key("m", "t", ttt, render)
+    assert key != cache_key("m", "t", nim, nim.render(nim.apply_action(nim.reset(), "1")))
+
+
+def test_disk_tier_survives_new_cache(tmp_path):
+    path = tmp_path / "cache.db"
+    game = Nim()
+    state = game.reset()
+    first = CachingPlayer(LLMPlayer(FakeModel()), ResponseCache(path))
+    first.select_action(game, state)
+    first.cache.close()
+
+    model = FakeModel()
+    second = CachingPlayer(LLMPlayer(model), ResponseCache(path))
+    second.select_action(game, state)
+    second.select_action(game, state)
+    assert model.calls == 0
+    assert (second.stats.disk_hits, second.stats.memory_hits) == (1, 1)
+
+
+def test_size_and_age_eviction(tmp_path):
+    clock = Clock()
+    cache = ResponseCache(tmp_path / "cache.db", memory_entries=2, max_entries=3, max_age=60, evict_every=1, clock=clock)
+    for i in range(5):
+        clock.now += 1
+        cache.put(f"k{i}", str(i))
+    assert len(cache) == 3
+    assert cache.get("k0") is None  # least recently used, gone from both tiers
+    clock.now += 1
+    assert cache.get("k2") == "2"  # disk hit, refreshes its access time
+    clock.now += 1
+    cache.put("k5", "5")
+    assert cache.get("k2") == "2" and cache.get("k3") is None
+
+    clock.now += 61
+    assert cache.get("k5") is None  # expired
+    assert cache.evict() >= 1
+    assert len(cache) == 0
+
+
+def test_stale_entries_are_replaced():
+    cache = ResponseCache()
+    key = "k"
+    cache.put(key, "9")
+    assert cache.get(key, accept=lambda a: a in ("1", "2")) is None
+    assert cache.stats.stale == 1 and cache.stats.misses == 1
+    assert cache.get(key) is None
+
+
+def test_copies_share_the_cache_and_pickles_reopen_it(tmp_path):
+    player = CachingPlayer(LLMPlayer(FakeModel()), ResponseCache(tmp_path / "cache.db"))
+    game = Nim()
+    player.select_action(game, game.reset())
+    clone = copy.deepcopy(player)
+    assert clone.cache is player.cache
+    assert clone.select_action(game, game.reset()) == "1"
+    assert clone.player.model.calls == 1  # served from the shared cache
+    assert player.stats.memory_hits == 1
+    restored = pickle.loads(pickle.dumps(player))
+    assert restored.cache is not player.cache
+    assert restored.select_action(game, game.reset()) == "1" and restored.stats.hits == 1
+
+
+def test_tournament_matches_fill_the_callers_cache():
+    model = FakeModel()
+    player = CachingPlayer(LLMPlayer(model))
+    Tournament({"ttt": TicTacToe()}, {"llm": player, "random": RandomPlayer()}, rounds=5, workers=1).run()
+    assert player.stats.misses > 0 and player.stats.hits > 0
+    assert len(player.cache) == player.stats.misses
+
+
+def test_a_miss_renders_the_state_once():
+    class CountingTicTacToe(TicTacToe):
+        renders = 0
+
+        def render(self, state):
+            CountingTicTacToe.renders += 1
+            return super().render(state)
+
+    game = CountingTicTacToe()
+    CachingPlayer(LLMPlayer(FakeModel())).select_action(game, game.reset())
+    assert CountingTicTacToe.renders == 1
+
+
+def _worker(path, seed):
+    import random
+
+    random.seed(seed)
+    model = FakeModel()
+    player = CachingPlayer(LLMPlayer(model), ResponseCache(path, memory_entries=0))
+    for _ in range(20):
+        GameEngine(TicTacToe(), player, RandomPlayer()).play()
+    return model.calls, player.stats.hits
+
+
+def test_worker_processes_share_the_disk_tier(tmp_path):
+    path = str(tmp_path / "cache.db")
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(_worker, [path] * 4, range(4)))
+    assert all(hits > 0 for _, hits in results)
+    cache = ResponseCache(path)
+    assert 0 < len(cache) <= sum(calls for calls, _ in results)
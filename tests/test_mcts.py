@@ -0,0 +1,53 @@
+import gc
+import random
+
+import pytest
+
+from arena import GameEngine, RandomPlayer
+from arena.games.connect_four import ConnectFour
+from arena.games.hex import Hex
+from arena.games.tictactoe import TicTacToe
+from arena.mcts import MCTSPlayer
+
+
+def test_mcts_takes_immediate_win():
+    game = TicTacToe()
+    state = game.reset()
+    for m in ["0", "3", "1", "4"]:
+        state = game.apply_action(state, m)
+    assert MCTSPlayer(time_limit=None, max_playouts=2000, seed=0).select_action(game, state) == "2"
+
+
+def test_mcts_reuses_tree_after_opponent_reply():
+    game = ConnectFour()
+    player = MCTSPlayer(time_limit=None, max_playouts=2000, seed=0)
+    state = game.reset()
+    state = game.apply_action(state, player.select_action(game, state))
+    assert player.playouts == 2000 and player.playouts_per_second > 0
+    state = game.apply_action(state, "3")
+    player.select_action(game, state)
+    assert player.reused_visits > 0
+
+
+def test_mcts_with_worker_processes_beats_random():
+    random.seed(0)
+    with MCTSPlayer(time_limit=None, max_playouts=300, workers=2, seed=1) as player:
+        assert GameEngine(Hex(size=4), player, RandomPlayer()).play() == 0
+
+
+def test_dropped_player_shuts_its_pool_down():
+    game = TicTacToe()
+    player = MCTSPlayer(time_limit=None, max_playouts=50, workers=2, seed=2)
+    player.select_action(game, game.reset())
+    pool = player._pool
+    del player
+    gc.collect()
+    with pytest.raises(RuntimeError):
+        pool.submit(abs, -1)
+
+
+def test_playout_budget_makes_moves_reproducible():
+    game = ConnectFour()
+    state = game.apply_action(game.reset(), "3")
+    moves = {MCTSPlayer(time_limit=None, max_playouts=500, seed=4).select_action(game, state) for _ in range(3)}
+    assert len(moves) == 1
@@ -1,3 +1,6 @@
+import pytest
+
+from arena.bench import perft
 from arena.games.mini_chess import MiniChess
 
 
@@ -18,3 +21,31 @@ def test_mini_chess_capture_win():
 
     assert game.is_terminal(state)
     assert game.get_winner(state) == 0
+
+
+def test_dict_style_board_is_read_only():
+    game = MiniChess()
+    state = game.reset()
+    board = state["board"]
+    with pytest.raises(TypeError):
+        board[0][0] = " "
+    rows = [list(row) for row in board]
+    rows[0][0] = " "
+    state["board"] = rows
+    assert state["board"][0][0] == " " and state.squares[0] == " "
+
+
+def test_perft_node_counts():
+    game = MiniChess()
+    assert [perft(game, game.reset(), depth) for depth in range(1, 5)] == [10, 100, 1216, 14914]
+
+
+def test_move_list_is_cached_per_position():
+    game = MiniChess()
+    state = game.reset()
+    assert state.moves is None
+    ids = game.legal_action_ids(state)
+    assert state.moves == ids
+    child = game.apply_action(state, "a2a3")
+    assert child.moves is None
+    assert game.valid_actions(state) == [game.action_to_str(state, a) for a in ids]
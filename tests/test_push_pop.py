@@ -0,0 +1,79 @@
+import copy
+import random
+
+import pytest
+
+from arena.games.checkers import Checkers
+from arena.games.connect_four import ConnectFour
+from arena.games.dots_and_boxes import DotsAndBoxes
+from arena.games.mini_chess import MiniChess
+from arena.games.othello import Othello
+from arena.games.quoridor import Quoridor
+from arena.search import SearchPlayer
+
+GAMES = [
+    MiniChess(),
+    Checkers(),
+    Checkers(forced_jumps=True),
+    Othello(6),
+    ConnectFour(),
+    Quoridor(),
+    DotsAndBoxes(3),
+    DotsAndBoxes(3, extra_turns=True),
+]
+
+
+def _observe(game, state):
+    return (
+        game.render(state),
+        game.state_key(state),
+        game.valid_actions(state),
+        game.is_terminal(state),
+        game.get_winner(state),
+        game.current_player(state),
+    )
+
+
+@pytest.mark.parametrize("game", GAMES, ids=lambda g: type(g).__name__)
+@pytest.mark.parametrize("seed", range(8))
+def test_push_pop_matches_copying_api(game, seed):
+    """Random walks mixing push and pop track the states apply_action builds."""
+    rng = random.Random(seed)
+    path = [game.reset()]  # states built by apply_action
+    state = copy.deepcopy(path[0])
+    for _ in range(120):
+        if len(path) > 1 and (game.is_terminal(state) or rng.random() < 0.3):
+            game.pop(state)
+            path.pop()
+        else:
+            actions = game.valid_actions(state)
+            if not actions:
+                break
+            action = rng.choice(actions)
+            path.append(game.apply_action(path[-1], action))
+            game.push(state, action)
+        assert _observe(game, state) == _observe(game, path[-1])
+    while len(path) > 1:
+        game.pop(state)
+        path.pop()
+    assert state == path[0]
+
+
+@pytest.mark.parametrize("game", GAMES, ids=lambda g: type(g).__name__)
+def test_invalid_push_leaves_state_untouched(game):
+    state = game.reset()
+    before = copy.deepcopy(state)
+    with pytest.raises(ValueError):
+        game.pop(state)
+    with pytest.raises(ValueError):
+        game.push(state, "999" if isinstance(game, DotsAndBoxes) else "9,9")
+    assert state == before
+
+
+def test_search_does_not_mutate_the_position():
+    game = ConnectFour()
+    state = game.apply_action(game.reset(), "3")
+    before = copy.deepcopy(state)
+    action = SearchPlayer(time_limit=None, max_depth=4, make_unmake=True).select_action(game, state)
+    assert state == before
+    assert action in game.valid_actions(state)
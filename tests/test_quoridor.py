@@ -0,0 +1,105 @@
+import copy
+import random
+
+import pytest
+
+from arena.base import RandomPlayer
+from arena.engine import GameEngine
+from arena.games.quoridor import UNREACHABLE, Quoridor
+from arena.search import SearchPlayer
+
+
+def _bfs(game, state, player):
+    """Reference distance map: plain BFS from the goal row."""
+    n = game.size
+    goal = n - 1 if player == 0 else 0
+    dist = {(goal, c): 0 for c in range(n)}
+    frontier = list(dist)
+    for r, c in frontier:
+        steps = []
+        if r > 0 and (r - 1, c) not in state["h_walls"]:
+            steps.append((r - 1, c))
+        if r < n - 1 and (r, c) not in state["h_walls"]:
+            steps.append((r + 1, c))
+        if c > 0 and (r, c - 1) not in state["v_walls"]:
+            steps.append((r, c - 1))
+        if c < n - 1 and (r, c) not in state["v_walls"]:
+            steps.append((r, c + 1))
+        for cell in steps:
+            if cell not in dist:
+                dist[cell] = dist[(r, c)] + 1
+                frontier.append(cell)
+    return [dist.get((r, c), UNREACHABLE) for r in range(n) for c in range(n)]
+
+
+def _random_walls(game, state, rng, count):
+    """Place up to ``count`` random walls directly, without legality checks."""
+    slots = [(kind, rr, cc) for kind in "hv" for rr in range(game.size - 1) for cc in range(game.size - 1)]
+    for kind, rr, cc in rng.sample(slots, count):
+        state[f"{kind}_walls"].add((rr, cc))
+    return state
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_blocking_walls_match_brute_force(seed):
+    rng = random.Random(seed)
+    game = Quoridor(size=rng.choice([3, 5, 9]), walls_per_player=10)
+    state = _random_walls(game, game.reset(), rng, rng.randrange(3 * game.size))
+    if any(_bfs(game, state, p)[r * game.size + c] == UNREACHABLE for p, (r, c) in enumerate(state["pos"])):
+        return
+    assert [game.distance_map(state, p) for p in (0, 1)] == [_bfs(game, state, p) for p in (0, 1)]
+    legal = set(game.valid_actions(state))
+    for kind, walls in (("H", state["h_walls"]), ("V", state["v_walls"])):
+        for rr in range(game.size - 1):
+            for cc in range(game.size - 1):
+                if (rr, cc) in walls:
+                    continue
+                walls.add((rr, cc))
+                blocked = any(_bfs(game, state, p)[r * game.size + c] == UNREACHABLE for p, (r, c) in enumerate(state["pos"]))
+                walls.remove((rr, cc))
+                assert (f"{kind} {rr} {cc}" not in legal) == blocked
+
+
+def test_distances_follow_play_on_a_standard_board():
+    rng = random.Random(1)
+    game = Quoridor(size=9, walls_per_player=10)
+    for _ in range(5):
+        state = game.reset()
+        assert game.distances(state) == (8, 8)
+        for _ in range(80):
+            if game.is_terminal(state):
+                break
+            actions = game.valid_actions(state)
+            walls = [a for a in actions if a[0] in "HV"]
+            state = game.apply_action(state, rng.choice(walls if walls and rng.random() < 0.5 else actions))
+            expected = [_bfs(game, state, p) for p in (0, 1)]
+            assert [game.distance_map(state, p) for p in (0, 1)] == expected
+            assert all(d != UNREACHABLE for d in game.distances(state))
+
+
+def test_wall_cannot_seal_a_pawn_in():
+    game = Quoridor(size=5, walls_per_player=5)
+    state = game.reset()
+    for action in ["L", "U", "L", "U", "H 0 0"]:
+        state = game.apply_action(state, action)
+    assert state["pos"][0] == (0, 0)
+    assert "V 0 0" not in game.valid_actions(state)
+    with pytest.raises(ValueError):
+        game.apply_action(state, "V 0 0")
+
+
+def test_search_wins_the_race_on_a_standard_board():
+    random.seed(2)
+    engine = GameEngine(Quoridor(size=9, walls_per_player=10), SearchPlayer(time_limit=None, max_depth=2), RandomPlayer())
+    assert engine.play() == 0
+
+
+def test_reading_a_state_leaves_it_unchanged():
+    game = Quoridor(size=5, walls_per_player=5)
+    state = game.apply_action(game.reset(), "H 1 1")
+    before = copy.deepcopy(state)
+    game.valid_actions(state)
+    game.distances(state)
+    game.state_key(state)
+    assert state == before
+    assert game.distance_map(state, 0) is game.distance_map(game.apply_action(state, "U"), 0)
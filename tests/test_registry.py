@@ -0,0 +1,18 @@
+import arena.games
+from arena.bench import measure_import_time
+
+
+def test_registry_lists_games_without_importing_them():
+    result = measure_import_time("arena.games", repeats=1)
+    assert not [m for m in result["modules_loaded"] if m.startswith("arena.games.")]
+    names = arena.games.registry.list()
+    assert {"Othello", "TicTacToe", "WordLadderDuel"} <= set(names)
+    assert "CheckersState" not in names
+
+
+def test_games_load_on_first_access():
+    from arena.games import Othello
+
+    assert Othello.__module__ == "arena.games.othello"
+    assert arena.games.registry.load("Nim") is arena.games.Nim
+    assert "Othello" in dir(arena.games)
@@ -0,0 +1,61 @@
+import random
+
+from arena import GameEngine, RandomPlayer
+from arena.games.checkers import Checkers
+from arena.games.connect_four import ConnectFour
+from arena.games.dots_and_boxes import DotsAndBoxes
+from arena.games.hex import Hex
+from arena.games.mancala import Mancala
+from arena.games.mini_chess import MiniChess
+from arena.games.multiheap_nim import MultiHeapNim
+from arena.games.othello import Othello
+from arena.games.quoridor import Quoridor
+from arena.games.tictactoe import TicTacToe
+from arena.search import WIN, SearchPlayer
+
+
+def test_current_player_alternates():
+    rng = random.Random(0)
+    for game in [TicTacToe(), ConnectFour(), Othello(4), Hex(4), Checkers(), MiniChess(), Quoridor(), DotsAndBoxes(2), Mancala()]:
+        state = game.reset()
+        for ply in range(40):
+            if game.is_terminal(state):
+                break
+            assert game.current_player(state) == ply % 2, type(game).__name__
+            state = game.apply_action(state, rng.choice(game.valid_actions(state)))
+
+
+def test_search_takes_immediate_win_and_blocks():
+    game = ConnectFour()
+    state = game.reset()
+    for m in ["0", "6", "1", "6", "2"]:
+        state = game.apply_action(state, m)
+    # O to move must block the open three on the bottom row.
+    assert SearchPlayer(time_limit=None, max_depth=4).select_action(game, state) == "3"
+    state = game.apply_action(state, "5")
+    assert SearchPlayer(time_limit=None, max_depth=4).select_action(game, state) == "3"
+
+
+def test_search_solves_tictactoe():
+    game = TicTacToe()
+    state = game.reset()
+    player = SearchPlayer(time_limit=None, max_depth=9)
+    while not game.is_terminal(state):
+        state = game.apply_action(state, player.select_action(game, state))
+    assert game.get_winner(state) is None
+
+
+def test_search_beats_random_in_mini_chess():
+    random.seed(1)
+    engine = GameEngine(MiniChess(), SearchPlayer(time_limit=None, max_depth=2), RandomPlayer())
+    assert engine.play() == 0
+
+
+def test_win_distance_survives_transpositions():
+    # Heaps [3, 4, 2] are won in 7 plies, but the search meets the same
+    # positions at different plies; table hits must not shorten the win.
+    game = MultiHeapNim([3, 4, 5])
+    state = game.apply_action(game.reset(), "2,3")
+    player = SearchPlayer(time_limit=None, max_depth=30)
+    player.select_action(game, state)
+    assert player.score == WIN - 7
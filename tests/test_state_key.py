@@ -0,0 +1,111 @@
+import random
+import subprocess
+import sys
+
+import pytest
+
+from arena.games.checkers import Checkers, CheckersState
+from arena.games.connect_four import ConnectFour
+from arena.games.dots_and_boxes import DotsAndBoxes
+from arena.games.hex import Hex
+from arena.games.mancala import Mancala
+from arena.games.mini_chess import MiniChess
+from arena.games.nim import Nim
+from arena.games.othello import Othello
+from arena.games.quoridor import Quoridor
+from arena.games.tictactoe import TicTacToe
+
+
+GAMES = [
+    TicTacToe(),
+    ConnectFour(rows=4, cols=4, connect=3),
+    Othello(4),
+    Hex(3),
+    Checkers(),
+    MiniChess(),
+    Quoridor(size=3, walls_per_player=1),
+    DotsAndBoxes(2),
+    DotsAndBoxes(2, extra_turns=True),
+]
+
+
+@pytest.mark.parametrize("game", GAMES, ids=lambda g: type(g).__name__)
+def test_equal_positions_share_a_key(game):
+    """Random walks reach many positions by several move orders; the
+    incrementally updated key must depend on the position alone."""
+    rng = random.Random(3)
+    keys = {}  # (rendered position, player to move) -> key
+    histories = {}
+    transpositions = 0
+    for _ in range(100):
+        state = game.reset()
+        history = ()
+        for _ in range(60):
+            actions = game.valid_actions(state)
+            if game.is_terminal(state) or not actions:
+                break
+            action = rng.choice(actions)
+            state = game.apply_action(state, action)
+            history += (action,)
+            position = (game.render(state), game.current_player(state))
+            key = keys.setdefault(position, game.state_key(state))
+            assert game.state_key(state) == key
+            if histories.setdefault(position, history) != history:
+                transpositions += 1
+    assert transpositions > 0
+    assert len(set(keys.values())) == len(keys)
+
+
+def test_hand_built_states_get_keys_without_being_modified():
+    rng = random.Random(5)
+    for game in (Checkers(), Quoridor()):
+        state = game.reset()
+        for _ in range(30):
+            state = game.apply_action(state, rng.choice(game.valid_actions(state)))
+        if isinstance(game, Checkers):
+            bare = CheckersState([row.copy() for row in state.board], state.turn)
+        else:
+            bare = {k: v for k, v in state.items() if k != "key"}
+        before = repr(bare)
+        assert game.state_key(bare) == game.state_key(state)
+        assert repr(bare) == before
+        # Successors of a keyless state are keyed again.
+        action = game.valid_actions(bare)[0]
+        assert game.state_key(game.apply_action(bare, action)) == game.state_key(game.apply_action(state, action))
+
+
+def test_transpositions_share_a_key():
+    game = ConnectFour()
+    a = game.reset()
+    for m in ["0", "1", "2", "3"]:
+        a = game.apply_action(a, m)
+    b = game.reset()
+    for m in ["2", "3", "0", "1"]:
+        b = game.apply_action(b, m)
+    assert game.state_key(a) == game.state_key(b)
+    assert game.state_key(a) != game.state_key(game.apply_action(a, "4"))
+
+    othello = Othello()
+    state = othello.reset()
+    passed = othello.apply_action(state, "pass")
+    assert othello.state_key(state) != othello.state_key(passed)
+    assert othello.state_key(othello.apply_action(passed, "pass")) == othello.state_key(state)
+
+
+def test_fallback_key_is_stable():
+    assert Nim().state_key((5, 0)) == Nim().state_key((5, 0)) != Nim().state_key((5, 1))
+    game = Mancala()
+    assert game.state_key(game.reset()) == game.state_key(game.reset())
+    assert game.state_key(game.reset()) != game.state_key(game.apply_action(game.reset(), game.valid_actions(game.reset())[0]))
+
+
+def test_keys_are_the_same_in_every_process():
+    # Python's str hash is salted per process; keys must not be.
+    probe = (
+        "from arena.games.mancala import Mancala; from arena.games.quoridor import Quoridor; "
+        "m, q = Mancala(), Quoridor(); "
+        "print(m.state_key(m.apply_action(m.reset(), '2')), q.state_key(q.apply_action(q.reset(), 'H 0 0')))"
+    )
+    runs = {subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True).stdout for _ in range(2)}
+    m, q = Mancala(), Quoridor()
+    assert runs == {f"{m.state_key(m.apply_action(m.reset(), '2'))} {q.state_key(q.apply_action(q.reset(), 'H 0 0'))}\n"}
@@ -1,4 +1,12 @@
-from arena.games.sudoku_race import SudokuRace
+import random
+
+import pytest
+
+from arena import GameEngine, RandomPlayer
+from arena.games.sudoku_race import SudokuRace, load_puzzles, parse_puzzle
+
+PUZZLE_9 = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+SOLUTION_9 = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
 
 
 def test_sudoku_race_solution():
@@ -24,3 +32,79 @@ def test_sudoku_race_solution():
         current = 1 - current
     assert game.is_terminal(state)
     assert game.get_winner(state) == 1
+
+
+def _brute_force_ids(game, state):
+    n, sub = game.size, game.sub
+    ids = []
+    for r in range(n):
+        for c in range(n):
+            if state[r][c]:
+                continue
+            sr, sc = r // sub * sub, c // sub * sub
+            used = {state[r][i] for i in range(n)} | {state[i][c] for i in range(n)}
+            used |= {state[i][j] for i in range(sr, sr + sub) for j in range(sc, sc + sub)}
+            ids.extend((r * n + c) * n + v - 1 for v in range(1, n + 1) if v not in used)
+    return ids
+
+
+def test_masks_match_brute_force_on_larger_boards():
+    rng = random.Random(2)
+    for game in [SudokuRace(9, PUZZLE_9), SudokuRace(16)]:
+        state = game.reset()
+        for _ in range(60):
+            ids = game.legal_action_ids(state)
+            assert ids == _brute_force_ids(game, state)
+            if not ids:
+                break
+            state = game.apply_action_id(state, rng.choice(ids))
+
+
+def test_nine_by_nine_race_to_the_last_cell():
+    game = SudokuRace(puzzle=PUZZLE_9)
+    state = game.reset()
+    current = 0
+    while not game.is_terminal(state):
+        assert game.current_player(state) == current
+        r, c = next((r, c) for r in range(9) for c in range(9) if state[r][c] == 0)
+        state = game.apply_action(state, f"{r},{c},{SOLUTION_9[r * 9 + c]}")
+        current = 1 - current
+    assert game.get_winner(state) == 1 - current
+    with pytest.raises(ValueError):
+        game.apply_action(game.reset(), "0,2,5")  # 5 is already in row 0
+
+
+@pytest.mark.parametrize("size", [4, 9])
+def test_random_games_play_to_a_result(size):
+    rng = random.Random(size)
+    game = SudokuRace(size)
+    dead_ends = 0
+    for _ in range(40):
+        state = game.reset()
+        while not game.is_terminal(state):
+            state = game.apply_action(state, rng.choice(game.valid_actions(state)))
+        if state.filled < size * size:
+            dead_ends += 1
+            assert game.valid_actions(state) == []
+        assert game.get_winner(state) == 1 - game.current_player(state)
+    assert dead_ends > 0  # random play gets stuck on these boards
+    random.seed(size)
+    assert GameEngine(game, RandomPlayer(), RandomPlayer()).play() in (0, 1)
+
+
+def test_load_puzzles(tmp_path):
+    path = tmp_path / "puzzles.txt"
+    path.write_text("# two puzzles\n" + PUZZLE_9 + "\n\n1,0,0,4 0,0,0,0 0,0,0,0 3,0,0,2\n")
+    puzzles = load_puzzles(path)
+    assert len(puzzles) == 2
+    assert puzzles[0][0] == [5, 3, 0, 0, 7, 0, 0, 0, 0]
+    assert SudokuRace.from_file(path, 1).puzzle == SudokuRace().puzzle
+    assert SudokuRace.from_file(path).size == 9
+    assert parse_puzzle("G" + "." * 255)[0][0] == 16
+    assert parse_puzzle("55" + "." * 79)[0][:2] == [5, 5]
+    with pytest.raises(ValueError):
+        SudokuRace(puzzle="55" + "." * 79)  # conflicting givens
+    with pytest.raises(ValueError):
+        parse_puzzle("." * 80)
+    with pytest.raises(ValueError):
+        SudokuRace(6)
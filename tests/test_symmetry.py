@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from arena.games.connect_four import ConnectFour
+from arena.games.hex import Hex
+from arena.games.othello import Othello
+from arena.games.tictactoe import TicTacToe
+
+
+def _start(game, transform):
+    """The start position under ``transform``; only Othello's is not symmetric."""
+    state = game.reset()
+    if isinstance(game, Othello):
+        perm = game.symmetries[transform]
+        x = sum(1 << perm[s] for s in range(game.size**2) if state.x >> s & 1)
+        o = sum(1 << perm[s] for s in range(game.size**2) if state.o >> s & 1)
+        state = game.from_bitboards(x, o, state.player)
+    return state
+
+
+GAMES = [(TicTacToe(), 8), (ConnectFour(), 2), (ConnectFour(rows=4, cols=5, connect=3), 2), (Othello(6), 8), (Hex(5), 2)]
+
+
+@pytest.mark.parametrize(
+    "game, transforms", GAMES, ids=["TicTacToe", "ConnectFour", "ConnectFour-4x5", "Othello-6", "Hex-5"]
+)
+def test_images_share_a_canonical_key(game, transforms):
+    """Replaying a game through each transform reaches that image of every position."""
+    rng = random.Random(6)
+    for _ in range(4):
+        images = [_start(game, t) for t in range(transforms)]
+        while not game.is_terminal(images[0]):
+            state = images[0]
+            key, transform = game.canonical_state(state)
+            assert game.state_key(images[transform]) == key
+            for t, image in enumerate(images):
+                assert game.canonical_state(image)[0] == key
+                ids = game.legal_action_ids(state)
+                assert sorted(game.to_canonical_action(state, a, t) for a in ids) == game.legal_action_ids(image)
+                for a in ids:
+                    assert game.from_canonical_action(state, game.to_canonical_action(state, a, t), t) == a
+            action = rng.choice(game.legal_action_ids(state))
+            images = [game.apply_action_id(image, game.to_canonical_action(state, action, t)) for t, image in enumerate(images)]
+
+
+def test_tictactoe_positions_collapse_to_765_classes():
+    game = TicTacToe()
+    raw, canonical = set(), set()
+    frontier = [game.reset()]
+    while frontier:
+        state = frontier.pop()
+        key = game.state_key(state)
+        if key in raw:
+            continue
+        raw.add(key)
+        canonical.add(game.canonical_state(state)[0])
+        if not game.is_terminal(state):
+            frontier.extend(game.apply_action_id(state, a) for a in game.legal_action_ids(state))
+    assert (len(raw), len(canonical)) == (5478, 765)
@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from arena.games.dots_and_boxes import DotsAndBoxes
+from arena.games.mancala import Mancala
+from arena.games.tictactoe import TicTacToe
+from arena.tablebase import Tablebase
+
+_FLIP = {"win": "loss", "draw": "draw", "loss": "win"}
+
+
+def _solve(game, state, memo):
+    """Brute force: (result, distance) for the player to move."""
+    key = game.state_key(state)
+    if key in memo:
+        return memo[key]
+    if game.is_terminal(state):
+        winner = game.get_winner(state)
+        mover = game.current_player(state)
+        value = ("draw" if winner is None else "win" if winner == mover else "loss", 0)
+    else:
+        outcomes = []
+        for action in game.valid_actions(state):
+            child = game.apply_action(state, action)
+            result, distance = _solve(game, child, memo)
+            if game.current_player(child) != game.current_player(state):
+                result = _FLIP[result]
+            outcomes.append((result, distance + 1))
+        rank = {"win": 0, "draw": 1, "loss": 2}
+        best = min(rank[r] for r, _ in outcomes)
+        distances = [d for r, d in outcomes if rank[r] == best]
+        result = ("win", "draw", "loss")[best]
+        value = (result, max(distances) if result == "loss" else min(distances))
+    memo[key] = value
+    return value
+
+
+def _walk_states(game, root, seed, games=20):
+    rng = random.Random(seed)
+    for _ in range(games):
+        state = root
+        yield state
+        while not game.is_terminal(state):
+            state = game.apply_action(state, rng.choice(game.valid_actions(state)))
+            yield state
+
+
+@pytest.mark.parametrize(
+    "game, root",
+    [
+        (TicTacToe(), None),
+        (DotsAndBoxes(2, extra_turns=True), None),
+        (Mancala(), ([1, 0, 2, 0, 0, 1, 20, 0, 1, 0, 2, 0, 1, 20], 0)),
+    ],
+    ids=["TicTacToe", "DotsAndBoxes", "Mancala"],
+)
+def test_matches_brute_force(game, root):
+    tablebase = Tablebase.build(game, None if root is None else [root])
+    memo = {}
+    root = game.reset() if root is None else root
+    for state in _walk_states(game, root, seed=1):
+        assert tablebase.lookup(game, state) == _solve(game, state, memo)
+
+
+def test_saved_tablebase_is_memory_mapped(tmp_path):
+    game = TicTacToe()
+    seen = []
+    built = Tablebase.build(game, progress=lambda stats: seen.append(stats.phase), progress_every=1000)
+    assert seen[0] == "enumerate" and seen[-1] == "done" and "solve" in seen and "index" in seen
+    stats = built.stats
+    assert (stats.positions, stats.terminal) == (5478, 958)
+    assert stats.wins + stats.draws + stats.losses == stats.positions
+    assert stats.size_bytes < 5 * stats.positions
+    built.save(tmp_path / "ttt.tb")
+    opened = Tablebase.open(tmp_path / "ttt.tb")
+    assert Tablebase.open(tmp_path / "ttt.tb") is opened
+    for state in _walk_states(game, game.reset(), seed=2):
+        assert opened.lookup(game, state) == built.lookup(game, state)
+    assert opened.lookup(game, game.reset()) == ("draw", 9)
+    with pytest.raises(ValueError):
+        opened.lookup(Mancala(), Mancala().reset())
+
+
+def test_score_move():
+    game = TicTacToe()
+    tablebase = Tablebase.build(game)
+    state = game.reset()
+    assert tablebase.score_move(game, state, "4") == 1.0
+    state = game.apply_action(game.apply_action(state, "0"), "1")  # O blunders next to the corner
+    assert tablebase.lookup(game, state).result == "win"
+    assert tablebase.score_move(game, state, "4") == 1.0
+    assert tablebase.score_move(game, state, "2") == 0.5  # X lets O draw
@@ -0,0 +1,28 @@
+from arena import RandomPlayer, Tournament
+from arena.games.nim import Nim
+from arena.games.tictactoe import TicTacToe
+
+
+def _tournament(workers):
+    games = {"tictactoe": TicTacToe(), "nim": Nim()}
+    players = {"a": RandomPlayer(), "b": RandomPlayer(), "c": RandomPlayer()}
+    return Tournament(games, players, rounds=3, seed=7, workers=workers)
+
+
+def test_parallel_results_match_serial():
+    serial = _tournament(workers=1).run()
+    parallel = _tournament(workers=2).run()
+    assert [(r.index, r.winner) for r in serial.results] == [(r.index, r.winner) for r in parallel.results]
+    assert serial.pairings == parallel.pairings
+
+
+def test_standings_are_consistent():
+    standings = _tournament(workers=1).run()
+    # 2 games x 6 ordered pairings x 3 rounds
+    assert len(standings.results) == 36
+    table = standings.table("tictactoe")
+    assert sum(r.played for r in table.values()) == 2 * 18
+    assert sum(r.wins for r in table.values()) == sum(r.losses for r in table.values())
+    ab = standings.record("nim", "a", "b")
+    ba = standings.record("nim", "b", "a")
+    assert (ab.wins, ab.losses, ab.draws) == (ba.losses, ba.wins, ba.draws)
@@ -0,0 +1,87 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from arena import GameEngine, RandomPlayer
+from arena.games.connect_four import ConnectFour
+from arena.games.tictactoe import TicTacToe
+from arena.trace import Tracer
+
+
+def test_tracer_records_engine_and_player_calls():
+    random.seed(0)
+    game = TicTacToe()
+    tracer = Tracer()
+    GameEngine(game, RandomPlayer(), RandomPlayer(), observer=tracer).play()
+    assert "valid_actions" not in vars(game)  # wrappers live on a per-match copy, never on the game
+    methods = {r.method for r in tracer.records}
+    assert {"reset", "select_action", "valid_actions", "apply_action", "is_terminal", "get_winner"} <= methods
+    plies = max(r.ply for r in tracer.records)
+    selects = [r for r in tracer.records if r.method == "select_action"]
+    assert [r.ply for r in selects] == list(range(plies))
+    assert [r.player for r in selects] == [ply % 2 for ply in range(plies)]
+
+
+def test_traces_round_trip_and_merge(tmp_path):
+    random.seed(1)
+    first, second = Tracer(), Tracer()
+    GameEngine(TicTacToe(), RandomPlayer(), RandomPlayer(), observer=first).play()
+    GameEngine(ConnectFour(), RandomPlayer(), RandomPlayer(), observer=second).play()
+    first.to_json(str(tmp_path / "a.json"))
+    second.to_csv(str(tmp_path / "b.csv"))
+    merged = Tracer.merge([str(tmp_path / "a.json"), str(tmp_path / "b.csv")])
+    assert len(merged.records) == len(first.records) + len(second.records)
+    assert Tracer.load(str(tmp_path / "a.json")).records == first.records
+    summary = merged.summary()
+    assert {row["game"] for row in summary} == {"TicTacToe", "ConnectFour"}
+    selects = sum(row["calls"] for row in summary if row["method"] == "select_action")
+    assert selects == sum(r.method == "select_action" for r in merged.records)
+
+
+class CheckingPlayer(RandomPlayer):
+    """Plays randomly, checking that observing never touches the shared game."""
+
+    def __init__(self, shared):
+        self.shared = shared
+
+    def select_action(self, game, state):
+        assert game is not self.shared and type(game) is type(self.shared)
+        assert "valid_actions" not in vars(self.shared)
+        game.render(state=state)  # keyword arguments reach the game
+        return super().select_action(game, state)
+
+
+def test_concurrent_observed_matches_share_one_game():
+    random.seed(2)
+    game = TicTacToe()
+    tracers = [Tracer() for _ in range(8)]
+    player = CheckingPlayer(game)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda t: GameEngine(game, player, player, observer=t).play(), tracers))
+    assert all("render" in {r.method for r in t.records} for t in tracers)
+    assert "valid_actions" not in vars(game)
+
+
+class SlowPlayer(RandomPlayer):
+    """Plays randomly, giving other threads a turn before every move."""
+
+    def select_action(self, game, state):
+        time.sleep(0.001)
+        return super().select_action(game, state)
+
+
+def test_one_tracer_follows_matches_in_several_threads():
+    random.seed(3)
+    tracer = Tracer()
+    player = SlowPlayer()
+    games = [TicTacToe(), ConnectFour()] * 4
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda g: GameEngine(g, player, player, observer=tracer).play(), games))
+    matches = {}
+    for r in tracer.records:
+        matches.setdefault(r.match, []).append(r)
+    assert len(matches) == 8
+    for records in matches.values():
+        assert len({r.game for r in records}) == 1
+        selects = [r for r in records if r.method == "select_action"]
+        assert [r.ply for r in selects] == list(range(len(selects)))
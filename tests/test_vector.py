@@ -0,0 +1,43 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from arena.games.connect_four import ConnectFour
+from arena.games.nim import Nim
+from arena.games.othello import Othello
+from arena.games.tictactoe import TicTacToe
+from arena.vector import NO_WINNER, make_vector_env
+
+
+@pytest.mark.parametrize(
+    "game", [TicTacToe(), ConnectFour(), ConnectFour(rows=4, cols=5, connect=3), Othello(size=6), Nim(total=10, max_take=3)]
+)
+def test_vector_env_matches_scalar_game(game):
+    num_envs = 16
+    env = make_vector_env(game, num_envs)
+    states = [game.reset() for _ in range(num_envs)]
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        mask = env.legal_mask()
+        for i, state in enumerate(states):
+            legal = [env.action_to_str(a) for a in np.flatnonzero(mask[i])]
+            assert legal == game.valid_actions(state)
+        actions = env.sample_actions(rng)
+        states = [game.apply_action(s, env.action_to_str(a)) for s, a in zip(states, actions)]
+        done, winner = env.step(actions)
+        for i, state in enumerate(states):
+            assert bool(done[i]) == game.is_terminal(state)
+            if done[i]:
+                expected = game.get_winner(state)
+                assert winner[i] == (NO_WINNER if expected is None else expected)
+                states[i] = game.reset()
+            else:
+                assert game.render(env.to_state(i)) == game.render(state)
+    assert env.games_finished > 0
+
+
+def test_vector_env_rejects_illegal_actions():
+    env = make_vector_env(TicTacToe(), 2)
+    env.step(np.array([0, 0]))
+    with pytest.raises(ValueError):
+        env.step(np.array([0, 1]))
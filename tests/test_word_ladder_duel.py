@@ -1,4 +1,7 @@
+import pytest
+
 from arena.games.word_ladder_duel import WordLadderDuel
+from arena.word_index import WordIndex, ladder
 
 
 def test_word_ladder_duel_path():
@@ -10,3 +13,77 @@ def test_word_ladder_duel_path():
         state = game.apply_action(state, move)
     assert game.is_terminal(state)
     assert game.get_winner(state) == 1
+
+
+WORDS = ["cold", "cord", "card", "ward", "warm", "word", "worm", "corm", "wore", "core", "Zebra"]
+
+
+def _candidates(word, words):
+    return [
+        word[:i] + ch + word[i + 1 :]
+        for i in range(len(word))
+        for ch in "abcdefghijklmnopqrstuvwxyz"
+        if ch != word[i] and word[:i] + ch + word[i + 1 :] in words
+    ]
+
+
+def test_index_neighbours_match_candidate_scan(tmp_path):
+    words = {w.lower() for w in WORDS}
+    built = WordIndex.build(WORDS, goals=["warm"])
+    built.save(tmp_path / "words.idx")
+    opened = WordIndex.open(tmp_path / "words.idx")
+    assert WordIndex.open(tmp_path / "words.idx") is opened
+    for index in (built, opened):
+        assert len(index) == len(words)
+        assert "zebra" in index and "Zebra" not in index
+        for word in words:
+            assert index.neighbours(word) == _candidates(word, words)
+    assert index.neighbours("cole") is None
+
+
+def test_distance_tables():
+    index = WordIndex.build(WORDS, goals=["warm"])
+    assert index.distance("cold", "warm") == 4
+    assert index.distance("core", "warm") == 3  # core, wore, worm, warm
+    assert index.distance("zebra", "warm") is None
+    assert index.distance("wore", "core") == 1  # computed by BFS on demand
+    assert ladder(index, "cold", "warm") == ("cold", "cord", "word", "ward", "warm")
+    game = WordLadderDuel("cold", "warm", index)
+    state = game.reset()
+    while not game.is_terminal(state):
+        d = game.distance_to_goal(state)
+        state = min((game.apply_action(state, a) for a in game.valid_actions(state)), key=game.distance_to_goal)
+        assert game.distance_to_goal(state) == d - 1
+    assert game.get_winner(state) == 1
+    assert WordLadderDuel("bold", "warm", index).distance_to_goal(("bold", 0)) == 5
+
+
+def test_actions_from_index_match_candidate_scan():
+    words = {w.lower() for w in WORDS}
+    game = WordLadderDuel("cold", "warm", WORDS)
+    for state in [("cold", 0), ("cord", 1), ("bold", 0)]:  # "bold" is not in the dictionary
+        actions = game.valid_actions(state)
+        assert actions == _candidates(state[0], words)
+        assert [game.action_to_str(state, a) for a in game.legal_action_ids(state)] == actions
+
+
+def test_words_outside_a_to_z_are_rejected():
+    with pytest.raises(ValueError):
+        WordIndex.build(WORDS + ["x-ray"])
+    with pytest.raises(ValueError):
+        WordLadderDuel("cold", "warm", WORDS + ["café"])
+
+
+def test_games_share_the_index_of_a_word_list():
+    first = WordLadderDuel("cold", "warm", WORDS)
+    assert WordLadderDuel("warm", "cold", list(reversed(WORDS))).dictionary is first.dictionary
+
+
+def test_open_maps_a_resaved_file_again(tmp_path):
+    path = tmp_path / "words.idx"
+    WordIndex.build(["cold", "cord"]).save(path)
+    old = WordIndex.open(path)
+    WordIndex.build(["cold", "cord", "card"]).save(path)
+    new = WordIndex.open(path)
+    assert len(new) == 3 and len(old) == 2
+    assert WordIndex.open(path) is new